@@ -5,12 +5,14 @@ Includes individual endpoints for all 53+ security, performance, and compliance
 """
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Path
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, HttpUrl, Field
 from typing import List, Optional, Dict, Any, Union
 import asyncio
+import dataclasses
+import json
 import logging
 from datetime import datetime
 import uvicorn
@@ -18,7 +20,14 @@ import importlib
 import inspect
 import os
 
-from main import WebsiteMonitor, Config, load_config, generate_report
+from main import WebsiteMonitor, Config, configure_process, load_config, generate_report
+from core import async_http, dnsbl, http_client
+from core.circuit_breaker import breaker
+from core.dispatch import dispatcher
+from core.dns_cache import dns_cache
+from core.engine import NOT_RUN
+from core.retry import policy as http_policy
+from core.executor import get_executor, shutdown_executor
 
 # Import ALL check functions dynamically
 CHECK_MODULES = {
@@ -77,6 +86,9 @@ CHECK_MODULES = {
     'xss_protection': 'checks.check_xss_protection',
 }
 
+# Hang-prone checks (Selenium, WHOIS) run in a killable worker process
+ISOLATED_CHECKS = {'browser_compatibility', 'domain_expiration', 'privacy_protected_whois'}
+
 # Load all check functions
 CHECK_FUNCTIONS = {}
 for check_name, module_path in CHECK_MODULES.items():
@@ -205,6 +217,17 @@ class ReportRequest(BaseModel):
 # Global variable to store the default config
 default_config = None
 
+
+def request_config(**overrides) -> Config:
+    """
+    Build the config of one request from the loaded config.yaml.
+
+    Only the given settings are overridden (None keeps the loaded value), so a
+    request runs with the configured workers, caches and timeouts.
+    """
+    base = default_config or Config(websites=["example.com"])
+    return dataclasses.replace(base, **{key: value for key, value in overrides.items() if value is not None})
+
 # Mount static files for custom docs
 if not os.path.exists("docs"):
     os.makedirs("docs")
@@ -222,6 +245,18 @@ async def startup_event():
         logger.error(f"Failed to load default configuration: {e}")
         # Create a minimal config as fallback
         default_config = Config(websites=["example.com"])
+    
+    # Size the shared check executor and HTTP pools and apply the policies once for the
+    # lifetime of the server; per-request configs must not reconfigure them
+    configure_process(default_config)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the check executor threads and pooled HTTP connections."""
+    shutdown_executor(wait=False)
+    http_client.close_client()
+    await async_http.close_client()
+    await dnsbl.close_client()
 
 @app.get("/", response_class=FileResponse, tags=["Root"])
 async def root():
@@ -274,8 +309,10 @@ async def api_landing():
                 <h2>🎯 Quick Start Endpoints</h2>
                 <div class="endpoint">
                     <strong>GET /health</strong> - API health and status information<br>
+                    <strong>GET /metrics</strong> - Check executor queue depth and worker activity<br>
                     <strong>GET /checks</strong> - List all {len(CHECK_FUNCTIONS)} available checks<br>
                     <strong>POST /monitor</strong> - Run all checks on multiple websites<br>
+                    <strong>POST /monitor/stream</strong> - Stream results as they complete (NDJSON or SSE)<br>
                     <strong>GET /monitor/single</strong> - Quick single website monitoring<br>
                     <strong>POST /generate-report</strong> - Generate comprehensive reports
                 </div>
@@ -331,6 +368,30 @@ async def health_check():
         config_loaded=default_config is not None
     )
 
+@app.get("/metrics", tags=["Health"])
+async def get_metrics():
+    """
+    ## Runtime Metrics
+    
+    Snapshot of the shared check executor:
+    - Queue depth and peak queue depth
+    - Active workers and pool size
+    - Completed and failed sync check calls
+
+    the check dispatch rate (configured maximum and realized rate over the
+    last minute), HTTP retries and hedged requests, DNS cache hits and
+    misses, DNSBL queries, and the hosts whose circuit breaker is currently open.
+    """
+    return {
+        "timestamp": datetime.now(),
+        "executor": get_executor().metrics(),
+        "dispatch": dispatcher.metrics(),
+        "http": http_policy.metrics(),
+        "dns": dns_cache.metrics(),
+        "dnsbl": dnsbl.metrics(),
+        "unreachable_hosts": breaker.open_hosts()
+    }
+
 @app.get("/checks", tags=["Checks"])
 async def list_checks():
     """
@@ -407,6 +468,21 @@ def _categorize_check(check_name: str) -> str:
     else:
         return "other"
 
+# Results the engine substitutes for a check that did not complete
+CELL_ERRORS = {
+    "🔴": "Check failed or timed out",
+    "⚪": "Check raised an error",
+    NOT_RUN: "Run deadline reached before the check ran",
+}
+
+
+def monitor_cell(website: str, result: str) -> Dict[str, Any]:
+    """One website's entry in a /monitor check result, flagged as an error if the check did not complete."""
+    if result in CELL_ERRORS:
+        return {"website": website, "result": result, "status": "error", "error": CELL_ERRORS[result]}
+    return {"website": website, "result": result, "status": "completed"}
+
+
 @app.post("/monitor", response_model=MonitorResponse, tags=["Monitoring"])
 async def monitor_websites(request: WebsiteRequest):
     """
@@ -431,7 +507,7 @@ async def monitor_websites(request: WebsiteRequest):
     
     try:
         # Create config from request
-        config = Config(
+        config = request_config(
             websites=request.websites,
             timeout=request.timeout or 30,
             pagespeed_api_key=request.pagespeed_api_key
@@ -439,35 +515,21 @@ async def monitor_websites(request: WebsiteRequest):
         
         monitor = WebsiteMonitor(config)
         
-        # Run all checks
+        # Run all checks concurrently
+        check_results = await monitor.run()
+        
         results = []
         total_checks = 0
         
-        for check in monitor.check_functions:
-            check_results = []
-            for website in config.websites:
-                try:
-                    result = await check.execute(website, config, config.timeout)
-                    check_results.append({
-                        "website": website,
-                        "result": result,
-                        "status": "completed"
-                    })
-                    total_checks += 1
-                except Exception as e:
-                    logger.error(f"Check {check.name} failed for {website}: {e}")
-                    check_results.append({
-                        "website": website,
-                        "result": "⚪",
-                        "status": "error",
-                        "error": str(e)
-                    })
-                    total_checks += 1
-            
+        for check_name, check_values in check_results:
             results.append({
-                "check_name": check.name,
-                "results": check_results
+                "check_name": check_name,
+                "results": [
+                    monitor_cell(website, result)
+                    for website, result in zip(config.websites, check_values)
+                ]
             })
+            total_checks += len(check_values)
         
         end_time = datetime.now()
         execution_time = (end_time - start_time).total_seconds()
@@ -486,6 +548,98 @@ async def monitor_websites(request: WebsiteRequest):
         logger.error(f"Monitoring failed: {e}")
         raise HTTPException(status_code=500, detail=f"Monitoring failed: {str(e)}")
 
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def _stream_event(kind: str, payload: Dict[str, Any], stream_format: str) -> str:
+    """Encode one stream event as an NDJSON line or a Server-Sent Event."""
+    if stream_format == "sse":
+        return f"event: {kind}\ndata: {json.dumps(payload, ensure_ascii=False, default=str)}\n\n"
+    return json.dumps({"type": kind, **payload}, ensure_ascii=False, default=str) + "\n"
+
+
+async def _stream_monitoring(request: WebsiteRequest, stream_format: str):
+    """Run all checks and encode each outcome as soon as it completes."""
+    start_time = datetime.now()
+    config = request_config(
+        websites=request.websites,
+        timeout=request.timeout or 30,
+        pagespeed_api_key=request.pagespeed_api_key
+    )
+    monitor = WebsiteMonitor(config)
+    total_checks = 0
+
+    try:
+        async for outcome in monitor.stream():
+            total_checks += 1
+            yield _stream_event("result", {
+                **outcome.to_dict(),
+                "status": "completed",
+                "timestamp": datetime.now(),
+            }, stream_format)
+    except Exception as e:
+        logger.error(f"Streaming monitoring failed: {e}")
+        yield _stream_event("error", {"detail": f"Monitoring failed: {str(e)}"}, stream_format)
+        return
+
+    end_time = datetime.now()
+    yield _stream_event("complete", {
+        "execution_time": (end_time - start_time).total_seconds(),
+        "timestamp": end_time,
+        "websites_checked": len(request.websites),
+        "checks_performed": total_checks,
+    }, stream_format)
+
+
+def _streaming_response(request: WebsiteRequest, stream_format: str) -> StreamingResponse:
+    return StreamingResponse(
+        _stream_monitoring(request, stream_format),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        # Stop reverse proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/monitor/stream", tags=["Monitoring"])
+async def monitor_websites_stream(
+    request: WebsiteRequest,
+    format: str = Query("ndjson", description="Stream encoding", pattern="^(ndjson|sse)$")
+):
+    """
+    ## Streaming Website Monitoring
+
+    Same checks as `POST /monitor`, but every result is sent as soon as it
+    completes instead of once the whole batch has finished.
+
+    **Formats:**
+    - `ndjson`: one JSON object per line, `"type"` is `result`, `error` or `complete`
+    - `sse`: Server-Sent Events named `result`, `error` and `complete`
+
+    Results arrive in completion order; each carries `check_name`, `website`,
+    `result`, `duration` and `timestamp`. The final `complete` event carries
+    the run summary.
+    """
+    return _streaming_response(request, format)
+
+
+@app.get("/monitor/stream", tags=["Monitoring"])
+async def monitor_websites_stream_get(
+    website: List[str] = Query(..., description="Website URL or domain to monitor (repeatable)"),
+    timeout: int = Query(30, description="Timeout in seconds for each check", ge=5, le=300),
+    format: str = Query("sse", description="Stream encoding", pattern="^(ndjson|sse)$")
+):
+    """
+    ## Streaming Website Monitoring (GET)
+
+    `GET` form of `POST /monitor/stream` for browser `EventSource` clients,
+    which cannot send a request body. Defaults to Server-Sent Events.
+    """
+    return _streaming_response(WebsiteRequest(websites=website, timeout=timeout), format)
+
+
 @app.get("/monitor/single", tags=["Monitoring"])
 async def monitor_single_website(
     website: str = Query(..., description="Website URL or domain to monitor", example="example.com"),
@@ -530,7 +684,7 @@ async def monitor_single_website_custom(request: CustomMonitorRequest):
     
     try:
         # Create config from request
-        config = Config(
+        config = request_config(
             websites=[request.website],
             timeout=request.timeout or 30,
             pagespeed_api_key=request.pagespeed_api_key
@@ -592,13 +746,13 @@ async def monitor_single_website_custom(request: CustomMonitorRequest):
                             timeout=config.timeout
                         )
                     else:
-                        result = await asyncio.wait_for(
-                            asyncio.to_thread(check_func, request.website, config.pagespeed_api_key or ""),
+                        result = await get_executor().run(
+                            check_func, request.website, config.pagespeed_api_key or "",
                             timeout=config.timeout
                         )
                 elif check_name == "rate_limiting":
-                    result = await asyncio.wait_for(
-                        asyncio.to_thread(check_func, request.website, 10),
+                    result = await get_executor().run(
+                        check_func, request.website, 10,
                         timeout=config.timeout
                     )
                 elif asyncio.iscoroutinefunction(check_func):
@@ -606,9 +760,14 @@ async def monitor_single_website_custom(request: CustomMonitorRequest):
                         check_func(request.website),
                         timeout=config.timeout
                     )
+                elif check_name in ISOLATED_CHECKS:
+                    result = await get_executor().run_isolated(
+                        check_func, request.website,
+                        timeout=config.timeout
+                    )
                 else:
-                    result = await asyncio.wait_for(
-                        asyncio.to_thread(check_func, request.website),
+                    result = await get_executor().run(
+                        check_func, request.website,
                         timeout=config.timeout
                     )
                 
@@ -664,13 +823,15 @@ def create_check_endpoint(check_name: str, check_func: callable):
                 if asyncio.iscoroutinefunction(check_func):
                     result = await asyncio.wait_for(check_func(f"https://{website}"), timeout)
                 else:
-                    result = check_func(f"https://{website}")
+                    result = await get_executor().run(check_func, f"https://{website}", timeout=timeout)
             elif check_name == "rate_limiting":
-                result = check_func(f"https://{website}")
+                result = await get_executor().run(check_func, f"https://{website}", timeout=timeout)
             elif asyncio.iscoroutinefunction(check_func):
                 result = await asyncio.wait_for(check_func(website), timeout)
+            elif check_name in ISOLATED_CHECKS:
+                result = await get_executor().run_isolated(check_func, website, timeout=timeout)
             else:
-                result = check_func(website)
+                result = await get_executor().run(check_func, website, timeout=timeout)
             
             end_time = datetime.now()
             
@@ -683,6 +844,9 @@ def create_check_endpoint(check_name: str, check_func: callable):
                 "execution_time": (end_time - start_time).total_seconds()
             }
             
+        except asyncio.TimeoutError:
+            logger.warning(f"Check {check_name} for {website} timed out after {timeout}s")
+            raise HTTPException(status_code=504, detail=f"Check timed out after {timeout} seconds")
         except Exception as e:
             logger.error(f"Check {check_name} failed for {website}: {e}")
             raise HTTPException(status_code=500, detail=f"Check failed: {str(e)}")
@@ -804,7 +968,7 @@ async def generate_monitoring_report(request: ReportRequest):
     """
     try:
         # Create config for report generation
-        config = Config(
+        config = request_config(
             websites=request.websites,
             timeout=request.timeout or 30,
             output_file="api_generated_report.md" if request.output_format == "markdown" else f"api_generated_report.{request.output_format}"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-site HTML parsing CPU time before and after the DOM cache.
+
+Before the parse-once cache every BeautifulSoup-based check built its own
+tree from the same homepage (some with lxml, some with html.parser). This
+script replays that pattern against real pages and compares it with a
+single ``core.dom_cache.get_document()`` call.
+
+Usage:
+    python benchmarks/bench_dom_cache.py example.com wikipedia.org
+    python benchmarks/bench_dom_cache.py --file page.html
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from core.dom_cache import get_document
+from core.page_cache import DEFAULT_HEADERS, normalize_url
+
+# Parser used by each check before the cache was introduced
+LEGACY_PARSERS = (
+    ['lxml'] * 8 +         # ad_and_tracking, alt_tags, amp, asset_minification, broken_links,
+                           # semantic_markup, subresource_integrity, third_party_requests
+    ['html.parser'] * 13   # clientside_rendering, cms_used, cookie_policy, deprecated_libraries,
+                           # external_links, favicon, internationalization, mixed_content,
+                           # open_graph_protocol, privacy_exposure, sitemap,
+                           # third_party_resources, url_canonicalization
+)
+
+
+class _StaticResponse:
+    """Minimal stand-in for a requests.Response built from a local file."""
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+def _legacy_parse(content: bytes):
+    for parser in LEGACY_PARSERS:
+        try:
+            BeautifulSoup(content, parser)
+        except FeatureNotFound:
+            BeautifulSoup(content, 'html.parser')
+
+
+def benchmark(name: str, response, rounds: int):
+    """Print CPU seconds per site for the legacy and cached parse paths."""
+    before = time.process_time()
+    for _ in range(rounds):
+        _legacy_parse(response.content)
+    legacy = (time.process_time() - before) / rounds
+
+    before = time.process_time()
+    for _ in range(rounds):
+        response.__dict__.pop('_parsed_document', None)
+        get_document(response)
+    cached = (time.process_time() - before) / rounds
+
+    ratio = legacy / cached if cached else 0.0
+    print(f"{name:<40} {len(response.content) / 1024:>8.1f} KiB {legacy:>10.3f}s {cached:>10.3f}s {ratio:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('websites', nargs='*', help='Websites to fetch and benchmark')
+    parser.add_argument('--file', action='append', default=[], help='Local HTML file to benchmark')
+    parser.add_argument('--rounds', type=int, default=3, help='Repetitions per site (default: 3)')
+    args = parser.parse_args()
+
+    if not args.websites and not args.file:
+        parser.error('give at least one website or --file')
+
+    print(f"{'site':<40} {'size':>12} {'before':>11} {'after':>11} {'gain':>8}")
+    for path in args.file:
+        with open(path, 'rb') as f:
+            benchmark(os.path.basename(path), _StaticResponse(f.read()), args.rounds)
+    for website in args.websites:
+        try:
+            response = requests.get(normalize_url(website), headers=DEFAULT_HEADERS, timeout=15)
+        except requests.RequestException as e:
+            print(f"{website:<40} fetch failed: {e}")
+            continue
+        benchmark(website, response, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
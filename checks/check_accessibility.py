@@ -1,8 +1,9 @@
-import requests
 import re
 from requests.exceptions import RequestException, Timeout, HTTPError
 import logging
 
+from core import http_client
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -57,7 +58,7 @@ def check_accessibility(website):
     headers = {'User-Agent': 'AccessibilityChecker/1.0'}
 
     try:
-        response = requests.get(LIGHTHOUSE_API_ENDPOINT, params=lighthouse_params, headers=headers, timeout=15)
+        response = http_client.get(LIGHTHOUSE_API_ENDPOINT, params=lighthouse_params, headers=headers, timeout=15)
         response.raise_for_status()
         data = response.json()
         score = data['lighthouseResult']['categories']['accessibility']['score']
@@ -80,7 +81,7 @@ def check_accessibility(website):
             "reporttype": "json"
         }
         try:
-            wave_response = requests.get(WAVE_API_ENDPOINT, params=wave_params, headers=headers, timeout=15)
+            wave_response = http_client.get(WAVE_API_ENDPOINT, params=wave_params, headers=headers, timeout=15)
             wave_response.raise_for_status()
             wave_data = wave_response.json()
             errors_count = wave_data['categories']['error']['count']
@@ -98,7 +99,7 @@ def check_accessibility(website):
             
             # Enhanced manual heuristic accessibility check
             try:
-                response = requests.get(website, headers=headers, timeout=15)
+                response = http_client.get(website, headers=headers, timeout=15)
                 response.raise_for_status()
                 content = response.text.lower()  # Case-insensitive matching
                 
@@ -1,9 +1,11 @@
 import re
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
-from bs4 import BeautifulSoup
 import logging
 
+from core import http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -71,7 +73,7 @@ def check_ad_and_tracking(website):
 
     try:
         # Enhanced content analysis with retry mechanism
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
         content = response.text.lower()
 
@@ -91,7 +93,7 @@ def check_ad_and_tracking(website):
                     logger.debug(f"Found {category} pattern: {pattern}")
 
         # Enhanced BeautifulSoup analysis
-        soup = BeautifulSoup(response.text, 'lxml')
+        soup = get_document(response).soup
         
         # Check script tags
         scripts = soup.find_all('script', src=True)
@@ -133,7 +135,7 @@ def check_ad_and_tracking(website):
         
         # Enhanced fallback with basic pattern matching
         try:
-            response = requests.get(website, headers=headers, timeout=10)
+            response = http_client.get(website, headers=headers, timeout=10)
             response.raise_for_status()
             
             # Simple pattern matching as fallback
@@ -1,8 +1,11 @@
 import re
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
 from bs4 import BeautifulSoup
 
+from core import http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 def check_alt_tags(website):
     """
     Check if all the images on the website have alt tags.
@@ -27,12 +30,11 @@ def check_alt_tags(website):
 
     try:
         # Method 1: Direct HTML content analysis using BeautifulSoup
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()  # Raise an error for HTTP issues
-        soup = BeautifulSoup(response.text, 'lxml')
 
         # Find all images and count those with and without alt tags
-        images = soup.find_all('img')
+        images = get_document(response).images
         total_images = len(images)
         images_with_alt = sum(1 for img in images if img.get('alt') and img.get('alt').strip())
 
@@ -55,7 +57,7 @@ def check_alt_tags(website):
         # Method 2: Alternative Heuristic Check via Meta Tags (Fallback)
         try:
             # Try to get the response again for fallback analysis
-            response = requests.get(website, headers=headers, timeout=10)
+            response = http_client.get(website, headers=headers, timeout=10)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -1,7 +1,7 @@
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
-from bs4 import BeautifulSoup
-from bs4 import FeatureNotFound
+
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
 
 def check_amp_compatibility(website):
     """
@@ -17,20 +17,12 @@ def check_amp_compatibility(website):
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'AMPChecker/1.0'
-    }
-
     try:
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
         html_content = response.text
 
-        # Prefer lxml parser for better performance, fallback to html.parser
-        try:
-            soup = BeautifulSoup(html_content, 'lxml')
-        except FeatureNotFound:
-            soup = BeautifulSoup(html_content, 'html.parser')
+        soup = get_document(response).soup
 
         # Check for AMP attributes on <html> tag
         amp_html = soup.find('html', attrs=lambda x: x and ('⚡' in x or 'amp' in x))
@@ -1,8 +1,10 @@
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
-from bs4 import BeautifulSoup
 import re
 
+from core import http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 def check_asset_minification(website):
     """
     Check if the website's CSS/JS assets are minified.
@@ -27,14 +29,14 @@ def check_asset_minification(website):
 
     try:
         # First, get the website content to extract asset links
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'lxml')
+        document = get_document(response)
         
         # Extract CSS and JS links
-        css_links = [link.get('href') for link in soup.find_all('link', rel='stylesheet') if link.get('href')]
-        js_links = [script.get('src') for script in soup.find_all('script', src=True) if script.get('src')]
+        css_links = [link.get('href') for link in document.link_tags if 'stylesheet' in link.get('rel', []) and link.get('href')]
+        js_links = [script.get('src') for script in document.script_sources if script.get('src')]
         
         # Convert relative URLs to absolute
         from urllib.parse import urljoin
@@ -51,7 +53,7 @@ def check_asset_minification(website):
         for link in website_links:
             try:
                 # Method 1: Check content and minification status
-                asset_response = requests.get(link, headers=headers, timeout=10)
+                asset_response = http_client.get(link, headers=headers, timeout=10)
                 asset_response.raise_for_status()
 
                 # Check if the content type is either CSS or JavaScript
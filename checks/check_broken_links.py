@@ -1,8 +1,53 @@
-import requests
+import asyncio
 from requests.exceptions import RequestException, Timeout, HTTPError
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 
+from core import async_http, http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
+HEADERS = {
+    'User-Agent': 'BrokenLinkChecker/1.0'
+}
+MAX_LINKS_TO_CHECK = 20  # Limit to avoid excessive requests
+
+
+def _candidate_links(links, website):
+    """Return the unique absolute URLs worth probing, in page order."""
+    checked_links = set()  # To avoid checking the same URL twice
+    candidates = []
+    for link in links:
+        href = link.get('href')
+
+        # Skip anchor links, JavaScript calls, and mailto links
+        if href.startswith(('#', 'javascript:', 'mailto:')):
+            continue
+
+        # Convert relative URLs to absolute URLs
+        full_url = urljoin(website, href)
+
+        # Skip already checked links
+        if full_url in checked_links:
+            continue
+
+        checked_links.add(full_url)
+        candidates.append(full_url)
+    return candidates
+
+
+def _grade_links(broken_link_count, total_links):
+    """Determine the result based on the broken link analysis."""
+    if total_links == 0:
+        print("No valid links found on the website.")
+        return "⚪"
+    elif broken_link_count == 0:
+        return "🟢"
+    elif broken_link_count < total_links:
+        return "🟠"
+    else:
+        return "🔴"
+
+
 def check_broken_links(website):
     """
     Check for broken links on the provided website.
@@ -21,43 +66,21 @@ def check_broken_links(website):
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'BrokenLinkChecker/1.0'
-    }
-
-    checked_links = set()  # To avoid checking the same URL twice
     broken_link_count = 0
     total_links = 0
-    max_links_to_check = 20  # Limit to avoid excessive requests
 
     try:
         # Method 1: Direct HTML content analysis using BeautifulSoup
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'lxml')
 
         # Find all anchor tags with href attributes
-        links = soup.find_all('a', href=True)
-
-        for link in links[:max_links_to_check]:  # Limit number of links to check
-            href = link.get('href')
-            
-            # Skip anchor links, JavaScript calls, and mailto links
-            if href.startswith(('#', 'javascript:', 'mailto:')):
-                continue
-
-            # Convert relative URLs to absolute URLs
-            full_url = urljoin(website, href)
-
-            # Skip already checked links
-            if full_url in checked_links:
-                continue
-
-            checked_links.add(full_url)
+        links = get_document(response).links
 
+        for full_url in _candidate_links(links[:MAX_LINKS_TO_CHECK], website):
             try:
                 # Check the status of the link
-                link_response = requests.get(full_url, headers=headers, allow_redirects=True, timeout=5)
+                link_response = http_client.get(full_url, headers=HEADERS, allow_redirects=True, timeout=5)
                 if 400 <= link_response.status_code < 600:
                     print(f"Broken link found: {full_url} (Status: {link_response.status_code})")
                     broken_link_count += 1
@@ -68,16 +91,7 @@ def check_broken_links(website):
 
             total_links += 1
 
-        # Determine the result based on the broken link analysis
-        if total_links == 0:
-            print("No valid links found on the website.")
-            return "⚪"
-        elif broken_link_count == 0:
-            return "🟢"
-        elif broken_link_count < total_links:
-            return "🟠"
-        else:
-            return "🔴"
+        return _grade_links(broken_link_count, total_links)
 
     except (Timeout, HTTPError, RequestException) as e:
         print(f"Request error occurred while checking broken links for {website}: {e}")
@@ -85,3 +99,43 @@ def check_broken_links(website):
     except Exception as e:
         print(f"An unexpected error occurred while checking broken links for {website}: {e}")
         return "⚪"
+
+
+async def check_broken_links_async(website):
+    """
+    Async variant of ``check_broken_links``.
+
+    The links are probed concurrently instead of one after another; the
+    per-host connection limit of the async client still applies.
+    """
+    if not website.startswith(('http://', 'https://')):
+        website = f"https://{website}"
+
+    client = async_http.get_client()
+
+    async def probe(url):
+        try:
+            link_response = await client.get(url, headers=HEADERS, allow_redirects=True, timeout=5)
+            if 400 <= link_response.status_code < 600:
+                print(f"Broken link found: {url} (Status: {link_response.status_code})")
+                return True
+            return False
+        except async_http.REQUEST_ERRORS as e:
+            print(f"Error while checking link: {url}: {e}")
+            return True
+
+    try:
+        response = await client.fetch_page(website, timeout=10)
+        response.raise_for_status()
+
+        links = get_document(response).links
+        candidates = _candidate_links(links[:MAX_LINKS_TO_CHECK], website)
+        broken = await asyncio.gather(*(probe(url) for url in candidates))
+        return _grade_links(sum(broken), len(candidates))
+
+    except async_http.REQUEST_ERRORS as e:
+        print(f"Request error occurred while checking broken links for {website}: {e}")
+        return "⚪"
+    except Exception as e:
+        print(f"An unexpected error occurred while checking broken links for {website}: {e}")
+        return "⚪"
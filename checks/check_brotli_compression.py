@@ -1,6 +1,7 @@
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core import http_client
+
 def check_brotli_compression(website):
     """
     Check if the website supports Brotli compression.
@@ -25,7 +26,7 @@ def check_brotli_compression(website):
 
     try:
         # Method 1: Direct HTTP Request with Brotli Accept-Encoding Header
-        response = requests.get(website, headers=headers, timeout=10)
+        response = http_client.get(website, headers=headers, timeout=10)
         response.raise_for_status()
 
         # Check if the response indicates Brotli compression
@@ -51,11 +52,11 @@ def check_brotli_compression(website):
             }
 
             # Request with Gzip/Deflate encoding
-            response_gzip = requests.get(website, headers=headers_gzip, timeout=10)
+            response_gzip = http_client.get(website, headers=headers_gzip, timeout=10)
             response_gzip.raise_for_status()
             
             # Request with Brotli encoding
-            response_brotli = requests.get(website, headers=headers_brotli, timeout=10)
+            response_brotli = http_client.get(website, headers=headers_brotli, timeout=10)
             response_brotli.raise_for_status()
 
             # Check if Brotli encoding is actually used in response
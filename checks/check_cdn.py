@@ -2,6 +2,8 @@ import requests
 import logging
 from typing import Optional
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 def check_cdn(website: str) -> str:
@@ -26,7 +28,7 @@ def check_cdn(website: str) -> str:
     }
 
     try:
-        response = requests.get(website, headers=headers, stream=True, timeout=10)
+        response = http_client.get(website, headers=headers, stream=True, timeout=10)
         response.raise_for_status()
 
         # Check server header for CDN indicators
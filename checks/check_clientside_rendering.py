@@ -1,7 +1,8 @@
-from bs4 import BeautifulSoup
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 def check_clientside_rendering(website, threshold=10):
     """
     Checks if a website relies heavily on client-side rendering by counting the number of script tags and other indicators.
@@ -21,15 +22,11 @@ def check_clientside_rendering(website, threshold=10):
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'ClientSideRenderingChecker/1.0'
-    }
-
     try:
         # Method 1: Check number of script tags
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = get_document(response).soup
         scripts = soup.find_all('script')
 
         num_scripts = len(scripts)
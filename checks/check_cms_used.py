@@ -1,6 +1,7 @@
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
-from bs4 import BeautifulSoup
+
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
 
 def check_cms_used(website):
     """
@@ -19,10 +20,6 @@ def check_cms_used(website):
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'CMSChecker/1.0'
-    }
-
     cms_patterns = {
         "WordPress": ["wp-", "wp-content", "wp-includes", "wp-json", "xmlrpc.php"],
         "Drupal": ["Drupal", "sites/default/files", "drupal.js"],
@@ -35,7 +32,7 @@ def check_cms_used(website):
 
     try:
         # Method 1: Direct HTML content analysis
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
         content = response.text
 
@@ -46,7 +43,7 @@ def check_cms_used(website):
                 return f"🟢 ({cms})"
         
         # Method 2: Additional heuristic checks with BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = get_document(response).soup
 
         # Check for meta tags or generator information that might indicate a CMS
         meta_generator = soup.find('meta', attrs={'name': 'generator'})
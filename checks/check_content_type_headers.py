@@ -1,6 +1,7 @@
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core.page_cache import fetch_page
+
 def check_content_type_headers(website):
     """
     Checks if the 'Content-Type' header of the website is set to 'text/html' 
@@ -19,13 +20,9 @@ def check_content_type_headers(website):
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'ContentTypeChecker/1.0'
-    }
-
     try:
         # Method 1: Check Content-Type header directly
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
         content_type = response.headers.get('Content-Type', '')
 
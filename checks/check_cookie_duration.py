@@ -1,7 +1,8 @@
-import requests
 from datetime import datetime
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core.page_cache import fetch_page
+
 def check_cookie_duration(website):
     """
     Ensure that session cookies set by the website don't have an overly long duration.
@@ -19,13 +20,9 @@ def check_cookie_duration(website):
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'CookieDurationChecker/1.0'
-    }
-
     try:
         # Perform the request to get cookies
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
 
         long_duration_cookies = 0
@@ -1,6 +1,7 @@
-import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core.page_cache import fetch_page
+
 def check_cookie_flags(website):
     """
     Check if all cookies set by the website have the Secure and HttpOnly flags.
@@ -19,12 +20,8 @@ def check_cookie_flags(website):
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'CookieFlagChecker/1.0'
-    }
-
     try:
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
 
         # Check if any cookies are set using the response.cookies object
@@ -1,7 +1,9 @@
-import requests
-from bs4 import BeautifulSoup
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core import http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 def check_cookie_policy(website):
     """
     Verify if the website has a cookie policy and it's accessible to users.
@@ -25,10 +27,10 @@ def check_cookie_policy(website):
 
     try:
         # Method 1: Direct page analysis for cookie policy
-        response = requests.get(website, headers=headers, timeout=10)
+        response = fetch_page(website, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_document(response).soup
 
         # Common keywords associated with cookie policies
         keywords = ["cookie policy", "cookie statement", "use of cookies", "privacy policy"]
@@ -56,7 +58,7 @@ def check_cookie_policy(website):
             common_paths = ["/cookie-policy", "/cookies", "/privacy-policy", "/legal/cookies", "/legal/privacy-policy"]
             for path in common_paths:
                 try:
-                    policy_response = requests.get(f"{website.rstrip('/')}{path}", headers=headers, timeout=5)
+                    policy_response = http_client.get(f"{website.rstrip('/')}{path}", headers=headers, timeout=5)
                     if policy_response.status_code == 200:
                         print(f"Cookie policy found at {website.rstrip('/')}{path}.")
                         return "🟢"
@@ -1,9 +1,10 @@
-import requests
 import logging
 from requests.exceptions import RequestException, Timeout, HTTPError
 from urllib.parse import urlparse
 import re
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 def check_cookie_samesite_attribute(website: str) -> str:
@@ -56,7 +57,7 @@ def check_cookie_samesite_attribute(website: str) -> str:
         
         for endpoint in endpoints_to_check:
             try:
-                response = requests.get(endpoint, headers=headers, timeout=10, allow_redirects=True)
+                response = http_client.get(endpoint, headers=headers, timeout=10, allow_redirects=True)
                 
                 # Collect cookies from response
                 for cookie in response.cookies:
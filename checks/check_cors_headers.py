@@ -1,9 +1,10 @@
-import requests
 import logging
 from requests.exceptions import RequestException, HTTPError
 from urllib.parse import urlparse
 import re
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 def check_cors_headers(website: str) -> str:
@@ -56,10 +57,10 @@ def check_cors_headers(website: str) -> str:
         for endpoint in endpoints_to_check:
             try:
                 # Check OPTIONS request (preflight)
-                options_response = requests.options(endpoint, headers=headers, timeout=10)
+                options_response = http_client.options(endpoint, headers=headers, timeout=10)
                 
                 # Check GET request for CORS headers
-                get_response = requests.get(endpoint, headers=headers, timeout=10)
+                get_response = http_client.get(endpoint, headers=headers, timeout=10)
                 
                 for response in [options_response, get_response]:
                     if response.status_code < 400:  # Only check successful responses
@@ -5,6 +5,8 @@ from urllib.parse import urlparse
 import re
 import time
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 # Rate limiting cache for GitHub API
@@ -100,7 +102,7 @@ def check_data_leakage(website: str, token: str) -> str:
                 query = f'"{pattern}" in:code'
                 url = f"https://api.github.com/search/code?q={query}&sort=indexed&order=desc"
                 
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 
                 # Handle rate limiting
                 if response.status_code == 403:
@@ -1,10 +1,11 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
 from requests.exceptions import RequestException
 from urllib.parse import urlparse
 import re
 
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 logger = logging.getLogger(__name__)
 
 def check_deprecated_libraries(website: str) -> str:
@@ -39,9 +40,9 @@ def check_deprecated_libraries(website: str) -> str:
         return "⚪"
 
     try:
-        response = requests.get(website, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = get_document(response).soup
         
         # Enhanced detection patterns - comprehensive library database
         deprecated_libraries = {
@@ -1,199 +1,215 @@
-import dns.resolver
+import asyncio
+import ipaddress
 import logging
-from dns.resolver import NXDOMAIN, NoAnswer, Timeout, NoNameservers
-from urllib.parse import urlparse
+import dns.exception
+from dns.resolver import NXDOMAIN
 import re
-import socket
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from core import dnsbl
+from core.dns_cache import dns_cache
 
 logger = logging.getLogger(__name__)
 
-def check_dns_blacklist(domain: str) -> str:
-    """
-    Check if a domain is blacklisted in known DNS-based blacklists.
+# Enhanced blacklist collection with more accurate categorization
+BLACKLISTS = {
+    # Critical malware/spam blacklists (actual threats)
+    "zen.spamhaus.org": {"priority": "critical", "type": "spam", "ignore_pbl": True},
+    "bl.spamcop.net": {"priority": "critical", "type": "spam", "ignore_pbl": False},
+    "cbl.abuseat.org": {"priority": "important", "type": "malware", "ignore_pbl": False},
 
-    Args:
-        domain (str): The domain name to be checked.
+    # Policy blacklists (often shared hosting - less critical for websites)
+    "pbl.spamhaus.org": {"priority": "policy", "type": "policy", "ignore_pbl": False},
 
-    Returns:
-        str: 
-            - "🟢" if the domain is not in any blacklist.
-            - "🟡" if the domain is found in some blacklists.
-            - "🔴" if the domain is found in multiple or critical blacklists.
-            - "⚪" if errors occurred during checking.
-    """
-    # Input validation and normalization
+    # Important spam blacklists
+    "dnsbl.sorbs.net": {"priority": "important", "type": "spam", "ignore_pbl": False},
+    "b.barracudacentral.org": {"priority": "important", "type": "spam", "ignore_pbl": False},
+
+    # Additional checks
+    "dnsbl.dronebl.org": {"priority": "additional", "type": "proxy", "ignore_pbl": False},
+}
+
+
+def _normalize_domain(domain: str) -> Optional[str]:
+    """Reduce a URL or hostname to the bare domain, or None if it is not valid."""
     if not domain:
         logger.error("Domain is required")
-        return "⚪"
-    
+        return None
+
     # Normalize domain
     domain = domain.lower().strip()
     domain = re.sub(r'^https?://', '', domain)
     domain = re.sub(r'^www\.', '', domain)
     domain = domain.split('/')[0]  # Remove path if present
     domain = domain.split(':')[0]  # Remove port if present
-    
+
     # Validate domain format
     if not re.match(r'^[a-zA-Z0-9][a-zA-Z0-9.-]*[a-zA-Z0-9]$', domain):
         logger.error(f"Invalid domain format: {domain}")
+        return None
+    return domain
+
+
+def _public_addresses(domain: str) -> List[str]:
+    """Resolve the IPv4 and IPv6 addresses of a domain once, skipping private/local ones."""
+    addresses = [address for _, address in dns_cache.addresses(domain)]
+    public = [address for address in addresses if ipaddress.ip_address(address).is_global]
+    if addresses and not public:
+        logger.info(f"Domain {domain} only resolves to private addresses; skipping blacklists")
+    return public
+
+
+def _unresolved(domain: str, error: Exception) -> List[dict]:
+    """Per-blacklist results of a site whose addresses could not be resolved: unknown everywhere."""
+    logger.error(f"Could not resolve IP for domain {domain}: {error}")
+    return [{"blacklist": blacklist, "listed": None, "priority": info["priority"], "type": info["type"],
+             "error": "Domain resolution failed"} for blacklist, info in BLACKLISTS.items()]
+
+
+def _zone_result(blacklist: str, info: dict, answers: Dict[str, object]) -> dict:
+    """
+    Summarize one blacklist over all addresses of the site.
+
+    ``answers`` maps each address to its return codes (empty if not listed)
+    or to the exception its query raised.
+    """
+    result = {"blacklist": blacklist, "listed": False, "priority": info["priority"], "type": info["type"]}
+    errors = [answer for answer in answers.values() if isinstance(answer, Exception)]
+    for address, codes in answers.items():
+        if isinstance(codes, Exception) or not codes:
+            continue
+        # For zen.spamhaus.org, check the return code to filter out PBL entries
+        if info.get("ignore_pbl"):
+            # Spamhaus return codes: 127.0.0.2-127.0.0.3 are PBL (policy, not actual spam)
+            pbl_codes = [code for code in codes if code in ['127.0.0.2', '127.0.0.3']]
+            if pbl_codes:
+                result.update(priority="policy", type="policy", ip=address, return_code=pbl_codes[0],
+                              note="PBL listing (shared hosting policy, not spam)")
+                continue
+        return {**result, "listed": True, "priority": info["priority"], "type": info["type"], "ip": address}
+    if errors:
+        logger.debug(f"DNS issue with blacklist {blacklist}: {errors[0]}")
+        result.update(listed=None, error=str(errors[0]))  # Unknown due to error
+    return result
+
+
+def _summarize(domain: str, results: List[dict]) -> str:
+    """Grade the per-blacklist results (shared by the sync and async checks)."""
+    # Analyze results with improved scoring that ignores policy listings
+    actual_threats = [r for r in results if r["listed"] is True and r["type"] not in ["policy"]]
+    policy_listings = [r for r in results if r["listed"] is True and r["type"] == "policy"]
+
+    critical_threats = [r for r in actual_threats if r["priority"] == "critical"]
+    important_threats = [r for r in actual_threats if r["priority"] == "important"]
+
+    # Log actual threats only
+    for result in actual_threats:
+        logger.warning(f"Domain {domain} listed in {result['blacklist']} ({result['type']}, {result['priority']})")
+
+    # Log policy listings as info (not warnings)
+    for result in policy_listings:
+        logger.info(f"Domain {domain} IP in policy list {result['blacklist']} (shared hosting policy)")
+
+    # Improved categorization - only consider actual threats
+    if critical_threats:
+        logger.critical(f"Domain {domain} found in {len(critical_threats)} critical threat blacklists")
+        return "🔴"
+    elif len(important_threats) >= 2:
+        logger.error(f"Domain {domain} found in multiple threat blacklists")
+        return "🔴"
+    elif important_threats:
+        logger.warning(f"Domain {domain} found in threat blacklists")
+        return "🟡"
+    elif policy_listings:
+        logger.info(f"Domain {domain} IP in policy lists only (shared hosting)")
+        return "🟢"  # Policy listings are not security threats
+    else:
+        logger.info(f"Domain {domain} not found in any blacklists")
+        return "🟢"
+
+
+def check_dns_blacklist(domain: str) -> str:
+    """
+    Check if a domain is blacklisted in known DNS-based blacklists.
+
+    Every IPv4 and IPv6 address of the domain is checked; the domain is
+    listed in a blacklist if any of its addresses is.
+
+    Args:
+        domain (str): The domain name to be checked.
+
+    Returns:
+        str:
+            - "🟢" if the domain is not in any blacklist.
+            - "🟡" if the domain is found in some blacklists.
+            - "🔴" if the domain is found in multiple or critical blacklists.
+            - "⚪" if errors occurred during checking.
+    """
+    domain = _normalize_domain(domain)
+    if domain is None:
         return "⚪"
 
-    # Enhanced blacklist collection with more accurate categorization
-    blacklists = {
-        # Critical malware/spam blacklists (actual threats)
-        "zen.spamhaus.org": {"priority": "critical", "type": "spam", "ignore_pbl": True},
-        "bl.spamcop.net": {"priority": "critical", "type": "spam", "ignore_pbl": False},
-        "cbl.abuseat.org": {"priority": "important", "type": "malware", "ignore_pbl": False},
-        
-        # Policy blacklists (often shared hosting - less critical for websites)
-        "pbl.spamhaus.org": {"priority": "policy", "type": "policy", "ignore_pbl": False},
-        
-        # Important spam blacklists
-        "dnsbl.sorbs.net": {"priority": "important", "type": "spam", "ignore_pbl": False},
-        "b.barracudacentral.org": {"priority": "important", "type": "spam", "ignore_pbl": False},
-        
-        # Additional checks
-        "dnsbl.dronebl.org": {"priority": "additional", "type": "proxy", "ignore_pbl": False},
-    }
-
-    def check_single_blacklist(blacklist_info):
-        """Helper function to check a single blacklist"""
-        blacklist, info = blacklist_info
+    def query(address: str, blacklist: str):
         try:
-            # Get IP address of domain first
-            ip_address = socket.gethostbyname(domain)
-            
-            # Skip private/local IP addresses
-            if ip_address.startswith(('127.', '192.168.', '10.')) or ip_address.startswith('172.'):
-                if int(ip_address.split('.')[1]) in range(16, 32):  # 172.16-31.x.x
-                    return {
-                        "blacklist": blacklist,
-                        "listed": False,
-                        "priority": info["priority"],
-                        "type": info["type"],
-                        "skip_reason": "Private IP"
-                    }
-            
-            # Reverse IP for blacklist query
-            ip_parts = ip_address.split('.')
-            reversed_ip = '.'.join(reversed(ip_parts))
-            
-            # Query the blacklist with custom resolver for timeout
-            query = f"{reversed_ip}.{blacklist}"
-            
-            # Create custom resolver with timeout
-            resolver = dns.resolver.Resolver()
-            resolver.timeout = 5
-            resolver.lifetime = 5
-            
-            result = resolver.resolve(query, 'A')
-            
-            # For zen.spamhaus.org, check the return code to filter out PBL entries
-            if blacklist == "zen.spamhaus.org" and info.get("ignore_pbl"):
-                for rdata in result:
-                    return_code = str(rdata)
-                    # Spamhaus return codes: 127.0.0.2-127.0.0.3 are PBL (policy, not actual spam)
-                    if return_code in ['127.0.0.2', '127.0.0.3']:
-                        return {
-                            "blacklist": blacklist,
-                            "listed": False,  # Treat PBL as not listed for website checks
-                            "priority": "policy",
-                            "type": "policy",
-                            "ip": ip_address,
-                            "return_code": return_code,
-                            "note": "PBL listing (shared hosting policy, not spam)"
-                        }
-            
-            return {
-                "blacklist": blacklist,
-                "listed": True,
-                "priority": info["priority"],
-                "type": info["type"],
-                "ip": ip_address
-            }
-            
+            return [rdata.address for rdata in dns_cache.resolve(dnsbl.reverse_name(address, blacklist), 'A')]
         except NXDOMAIN:
-            # Domain not listed in this blacklist (good)
-            return {
-                "blacklist": blacklist,
-                "listed": False,
-                "priority": info["priority"],
-                "type": info["type"]
-            }
-        except (NoAnswer, Timeout, NoNameservers) as e:
-            logger.debug(f"DNS issue with blacklist {blacklist}: {e}")
-            return {
-                "blacklist": blacklist,
-                "listed": None,  # Unknown due to error
-                "priority": info["priority"],
-                "type": info["type"],
-                "error": str(e)
-            }
-        except socket.gaierror:
-            logger.error(f"Could not resolve IP for domain {domain}")
-            return {
-                "blacklist": blacklist,
-                "listed": None,
-                "priority": info["priority"],
-                "type": info["type"],
-                "error": "Domain resolution failed"
-            }
+            return []  # Not listed in this blacklist (good)
         except Exception as e:
-            logger.debug(f"Error checking {blacklist}: {e}")
-            return {
-                "blacklist": blacklist,
-                "listed": None,
-                "priority": info["priority"],
-                "type": info["type"],
-                "error": str(e)
-            }
+            return e
+
+    try:
+        # Resolve the site once, not once per blacklist
+        addresses = _public_addresses(domain)
+        pairs = [(address, blacklist) for blacklist in BLACKLISTS for address in addresses]
+        with ThreadPoolExecutor(max_workers=max(1, min(len(pairs), len(BLACKLISTS)))) as executor:
+            answers = dict(zip(pairs, executor.map(lambda pair: query(*pair), pairs)))
+        results = [
+            _zone_result(blacklist, info, {address: answers[address, blacklist] for address in addresses})
+            for blacklist, info in BLACKLISTS.items()
+        ]
+        return _summarize(domain, results)
+
+    except dns.exception.DNSException as e:
+        # Only resolving the site raises; the blacklist queries return their errors
+        return _summarize(domain, _unresolved(domain, e))
+    except Exception as e:
+        logger.error(f"Unexpected error during blacklist checking for {domain}: {e}")
+        return "⚪"
+
+
+async def check_dns_blacklist_async(domain: str) -> str:
+    """
+    Async variant of ``check_dns_blacklist`` using the shared DNSBL client.
+
+    All blacklist queries of all sites in the run go out concurrently from
+    one socket, so a site costs about one round trip per blacklist.
+    """
+    domain = _normalize_domain(domain)
+    if domain is None:
+        return "⚪"
+
+    client = dnsbl.get_client()
+
+    async def query(address: str, blacklist: str):
+        try:
+            return await client.query(address, blacklist)
+        except (dns.exception.DNSException, OSError) as e:
+            return e
 
     try:
-        # Performance optimization - concurrent checking
-        results = []
-        with ThreadPoolExecutor(max_workers=3) as executor:  # Reduced workers to be gentler
-            futures = {executor.submit(check_single_blacklist, item): item for item in blacklists.items()}
-            
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Error in blacklist check thread: {e}")
-
-        # Analyze results with improved scoring that ignores policy listings
-        actual_threats = [r for r in results if r["listed"] is True and r["type"] not in ["policy"]]
-        policy_listings = [r for r in results if r["listed"] is True and r["type"] == "policy"]
-        
-        critical_threats = [r for r in actual_threats if r["priority"] == "critical"]
-        important_threats = [r for r in actual_threats if r["priority"] == "important"]
-        
-        # Log actual threats only
-        for result in actual_threats:
-            logger.warning(f"Domain {domain} listed in {result['blacklist']} ({result['type']}, {result['priority']})")
-        
-        # Log policy listings as info (not warnings)
-        for result in policy_listings:
-            logger.info(f"Domain {domain} IP in policy list {result['blacklist']} (shared hosting policy)")
-        
-        # Improved categorization - only consider actual threats
-        if critical_threats:
-            logger.critical(f"Domain {domain} found in {len(critical_threats)} critical threat blacklists")
-            return "🔴"
-        elif len(important_threats) >= 2:
-            logger.error(f"Domain {domain} found in multiple threat blacklists")
-            return "🔴"
-        elif important_threats:
-            logger.warning(f"Domain {domain} found in threat blacklists")
-            return "🟡"
-        elif policy_listings:
-            logger.info(f"Domain {domain} IP in policy lists only (shared hosting)")
-            return "🟢"  # Policy listings are not security threats
-        else:
-            logger.info(f"Domain {domain} not found in any blacklists")
-            return "🟢"
+        addresses = await asyncio.get_running_loop().run_in_executor(None, _public_addresses, domain)
+        pairs = [(address, blacklist) for blacklist in BLACKLISTS for address in addresses]
+        answers = dict(zip(pairs, await asyncio.gather(*(query(*pair) for pair in pairs))))
+        results = [
+            _zone_result(blacklist, info, {address: answers[address, blacklist] for address in addresses})
+            for blacklist, info in BLACKLISTS.items()
+        ]
+        return _summarize(domain, results)
 
+    except dns.exception.DNSException as e:
+        # Only resolving the site raises; the blacklist queries return their errors
+        return _summarize(domain, _unresolved(domain, e))
     except Exception as e:
         logger.error(f"Unexpected error during blacklist checking for {domain}: {e}")
         return "⚪"
@@ -6,6 +6,7 @@ import dns.rdatatype
 import logging
 import re
 from urllib.parse import urlparse
+from core.dns_cache import dns_cache
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,7 @@ def check_dnssec(domain: str) -> str:
         
         # Check for DNSKEY records
         try:
-            dnskey_query = dns.resolver.resolve(domain_name, 'DNSKEY', tcp=True)
+            dnskey_query = dns_cache.resolve(domain_name, 'DNSKEY', tcp=True)
             if dnskey_query:
                 dnssec_indicators.append("DNSKEY records found")
                 logger.info(f"Found {len(dnskey_query)} DNSKEY records for {domain}")
@@ -58,7 +59,7 @@ def check_dnssec(domain: str) -> str:
         
         # Check for DS records in parent zone
         try:
-            ds_query = dns.resolver.resolve(domain_name, 'DS', tcp=True)
+            ds_query = dns_cache.resolve(domain_name, 'DS', tcp=True)
             if ds_query:
                 dnssec_indicators.append("DS records found")
                 logger.info(f"Found {len(ds_query)} DS records for {domain}")
@@ -67,7 +68,7 @@ def check_dnssec(domain: str) -> str:
         
         # Check for RRSIG records (signature records)
         try:
-            rrsig_query = dns.resolver.resolve(domain_name, 'RRSIG', tcp=True)
+            rrsig_query = dns_cache.resolve(domain_name, 'RRSIG', tcp=True)
             if rrsig_query:
                 dnssec_indicators.append("RRSIG records found")
                 logger.info(f"Found RRSIG records for {domain}")
@@ -76,11 +77,9 @@ def check_dnssec(domain: str) -> str:
         
         # Fallback mechanism - check for any DNSSEC records
         if not dnssec_indicators:
-            # Try checking A record with DNSSEC validation
+            # Try checking A record
             try:
-                resolver = dns.resolver.Resolver()
-                resolver.use_edns(0, dns.flags.DO, 4096)  # Enable DNSSEC
-                a_query = resolver.resolve(domain_name, 'A')
+                dns_cache.resolve(domain_name, 'A')
                 # If we get here, DNS works but DNSSEC might not be configured
                 logger.info(f"DNS resolution works for {domain} but no DNSSEC indicators found")
             except Exception:
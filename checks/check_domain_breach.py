@@ -4,8 +4,11 @@ from requests.exceptions import RequestException, HTTPError
 from urllib.parse import urlparse
 import json
 import re
+import threading
 import time
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 # Simple rate limiting cache
@@ -14,6 +17,41 @@ _rate_limit_cache = {
     'min_interval': 1.5  # Respect HIBP rate limits
 }
 
+# The breach catalog is the same for every domain; download it at most once an hour
+_catalog_cache = {
+    'data': None,
+    'timestamp': 0,
+    'ttl': 3600,
+    'lock': threading.Lock()
+}
+
+
+def _get_breach_catalog():
+    """Return the HIBP breach catalog, downloading it when the cached copy is stale."""
+    with _catalog_cache['lock']:
+        current_time = time.time()
+        if _catalog_cache['data'] is not None and current_time - _catalog_cache['timestamp'] < _catalog_cache['ttl']:
+            logger.debug("Using cached breach catalog")
+            return _catalog_cache['data']
+
+        # Performance optimization - rate limiting
+        time_since_last = current_time - _rate_limit_cache['last_request']
+        if time_since_last < _rate_limit_cache['min_interval']:
+            time.sleep(_rate_limit_cache['min_interval'] - time_since_last)
+        _rate_limit_cache['last_request'] = time.time()
+
+        url = f"https://haveibeenpwned.com/api/v3/breaches"
+        headers = {
+            "hibp-api-version": "3",
+            "User-Agent": "WebsiteMonitor/1.0"
+        }
+        response = http_client.get(url, headers=headers, timeout=15)
+        response.raise_for_status()
+
+        _catalog_cache['data'] = response.json()
+        _catalog_cache['timestamp'] = time.time()
+        return _catalog_cache['data']
+
 def check_domain_breach(website: str) -> str:
     """
     Check if a domain has been found in any known data breaches using the Have I Been Pwned API.
@@ -45,27 +83,10 @@ def check_domain_breach(website: str) -> str:
         logger.error(f"Invalid domain format: {website}")
         return "⚪"
 
-    # Performance optimization - rate limiting
-    current_time = time.time()
-    time_since_last = current_time - _rate_limit_cache['last_request']
-    if time_since_last < _rate_limit_cache['min_interval']:
-        time.sleep(_rate_limit_cache['min_interval'] - time_since_last)
-    
-    _rate_limit_cache['last_request'] = time.time()
-
     try:
         # Enhanced API usage - check breaches endpoint
-        url = f"https://haveibeenpwned.com/api/v3/breaches"
-        headers = {
-            "hibp-api-version": "3",
-            "User-Agent": "WebsiteMonitor/1.0"
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        if response.status_code == 200:
-            all_breaches = response.json()
+        all_breaches = _get_breach_catalog()
+        if all_breaches is not None:
             
             # Enhanced detection patterns - check for domain-related breaches
             domain_breaches = []
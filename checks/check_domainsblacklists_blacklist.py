@@ -1,4 +1,3 @@
-import requests
 import logging
 from requests.exceptions import RequestException, Timeout, HTTPError
 from urllib.parse import urlparse
@@ -6,6 +5,8 @@ import re
 import hashlib
 import time
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 # Simple cache to avoid repeated downloads
@@ -61,7 +62,7 @@ def check_domainsblacklists_blacklist(domain: str) -> str:
         else:
             logger.info("Downloading fresh blacklist data")
             # Stream the response to handle large files efficiently
-            response = requests.get(url, headers=headers, stream=True, timeout=60)
+            response = http_client.get(url, headers=headers, stream=True, timeout=60)
             response.raise_for_status()
 
             # Build a set for O(1) lookup performance
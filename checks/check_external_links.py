@@ -1,11 +1,14 @@
 import requests
 import logging
-from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from requests.exceptions import RequestException, HTTPError
 from urllib.parse import urlparse, urljoin
 import time
 
+from core import http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 logger = logging.getLogger(__name__)
 
 def check_external_links(website: str, max_workers: int = 10) -> str:
@@ -47,10 +50,10 @@ def check_external_links(website: str, max_workers: int = 10) -> str:
 
     try:
         # Fetch the main page content
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_document(response).soup
 
         # Enhanced detection patterns - extract all types of external links
         external_links = set()
@@ -85,7 +88,7 @@ def check_external_links(website: str, max_workers: int = 10) -> str:
         def check_link_detailed(url):
             try:
                 start_time = time.time()
-                resp = requests.head(url, timeout=10, allow_redirects=True, headers=headers)
+                resp = http_client.head(url, timeout=10, allow_redirects=True, headers=headers)
                 response_time = time.time() - start_time
                 
                 if resp.status_code == 200:
@@ -1,28 +1,30 @@
-import requests
+import asyncio
 import logging
-from bs4 import BeautifulSoup
 from requests.exceptions import RequestException, HTTPError
 from urllib.parse import urlparse, urljoin
 
+from core import async_http, http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 logger = logging.getLogger(__name__)
 
-def check_favicon(website: str) -> str:
-    """
-    Check if the website has a valid favicon.
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36'
+}
 
-    Args:
-        website (str): URL of the website to be checked.
+# Look for various favicon link types
+FAVICON_RELS = ['icon', 'shortcut icon', 'apple-touch-icon', 'apple-touch-icon-precomposed']
 
-    Returns:
-        str: 
-            - "🟢" if a valid favicon is found.
-            - "🔴" if no valid favicon is found.
-            - "⚪" if an error occurred during the check.
-    """
-    # Input validation and URL normalization
+# Common alternative locations
+COMMON_PATHS = ['/apple-touch-icon.png', '/icon.png', '/favicon.png']
+
+
+def _base_url(website: str):
+    """Return the normalized website, its parsed URL and its base URL, or None if it is invalid."""
     if not website:
         logger.error("Website URL is required")
-        return "⚪"
+        return None
     
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
@@ -31,24 +33,63 @@ def check_favicon(website: str) -> str:
         parsed_url = urlparse(website)
         if not parsed_url.netloc:
             logger.error(f"Invalid URL format: {website}")
-            return "⚪"
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            return None
+        return website, parsed_url, f"{parsed_url.scheme}://{parsed_url.netloc}"
     except Exception as e:
         logger.error(f"URL parsing error for {website}: {e}")
-        return "⚪"
+        return None
+
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36'
-    }
+def _linked_favicons(soup, website: str, parsed_url, base_url: str) -> list:
+    """Return the favicon URLs referenced by the page's link tags."""
+    favicon_urls = []
+    for rel in FAVICON_RELS:
+        icons = soup.find_all('link', rel=lambda x: x and rel in x.lower() if x else False)
+        for icon in icons:
+            href = icon.get('href')
+            if not href:
+                continue
+            
+            # Normalize URL
+            if href.startswith('//'):
+                favicon_url = f"{parsed_url.scheme}:{href}"
+            elif href.startswith('/'):
+                favicon_url = f"{base_url}{href}"
+            elif not href.startswith(('http://', 'https://')):
+                favicon_url = urljoin(website, href)
+            else:
+                favicon_url = href
+            favicon_urls.append(favicon_url)
+    return favicon_urls
+
+
+def check_favicon(website: str) -> str:
+    """
+    Check if the website has a valid favicon.
+
+    Args:
+        website (str): URL of the website to be checked.
+
+    Returns:
+        str: 
+            - "🟢" if a valid favicon is found.
+            - "🔴" if no valid favicon is found.
+            - "⚪" if an error occurred during the check.
+    """
+    # Input validation and URL normalization
+    normalized = _base_url(website)
+    if normalized is None:
+        return "⚪"
+    website, parsed_url, base_url = normalized
 
     def check_favicon_url(url):
         """Helper function to check if a favicon URL is valid"""
         try:
-            response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
+            response = http_client.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
             return response.status_code == 200
         except:
             try:
-                response = requests.get(url, headers=headers, timeout=10, stream=True)
+                response = http_client.get(url, headers=HEADERS, timeout=10, stream=True)
                 return response.status_code == 200 and len(response.content) > 0
             except:
                 return False
@@ -66,42 +107,22 @@ def check_favicon(website: str) -> str:
 
         # 2. Parse HTML for favicon references
         try:
-            response = requests.get(website, headers=headers, timeout=15)
+            response = fetch_page(website)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = get_document(response).soup
 
-            # Look for various favicon link types
-            favicon_rels = ['icon', 'shortcut icon', 'apple-touch-icon', 'apple-touch-icon-precomposed']
-            
-            for rel in favicon_rels:
-                icons = soup.find_all('link', rel=lambda x: x and rel in x.lower() if x else False)
-                for icon in icons:
-                    href = icon.get('href')
-                    if not href:
-                        continue
-                    
-                    # Normalize URL
-                    if href.startswith('//'):
-                        favicon_url = f"{parsed_url.scheme}:{href}"
-                    elif href.startswith('/'):
-                        favicon_url = f"{base_url}{href}"
-                    elif not href.startswith(('http://', 'https://')):
-                        favicon_url = urljoin(website, href)
-                    else:
-                        favicon_url = href
-                    
-                    favicon_candidates.append(favicon_url)
-                    
-                    if check_favicon_url(favicon_url):
-                        logger.info(f"Favicon found via HTML link tag: {favicon_url}")
-                        return "🟢"
+            for favicon_url in _linked_favicons(soup, website, parsed_url, base_url):
+                favicon_candidates.append(favicon_url)
+                
+                if check_favicon_url(favicon_url):
+                    logger.info(f"Favicon found via HTML link tag: {favicon_url}")
+                    return "🟢"
 
         except Exception as e:
             logger.warning(f"Error parsing HTML for favicon on {website}: {e}")
 
         # 3. Try common alternative locations
-        common_paths = ['/apple-touch-icon.png', '/icon.png', '/favicon.png']
-        for path in common_paths:
+        for path in COMMON_PATHS:
             favicon_url = f"{base_url}{path}"
             favicon_candidates.append(favicon_url)
             if check_favicon_url(favicon_url):
@@ -117,3 +138,68 @@ def check_favicon(website: str) -> str:
     except Exception as e:
         logger.error(f"Unexpected error while checking favicon for {website}: {e}")
         return "⚪"
+
+
+async def check_favicon_async(website: str) -> str:
+    """
+    Async variant of ``check_favicon`` using the native asyncio HTTP client.
+
+    The candidates of each step (link tags, common locations) are probed
+    concurrently.
+    """
+    normalized = _base_url(website)
+    if normalized is None:
+        return "⚪"
+    website, parsed_url, base_url = normalized
+    client = async_http.get_client()
+
+    async def check_favicon_url(url):
+        try:
+            response = await client.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
+            return response.status_code == 200
+        except Exception:
+            try:
+                response = await client.get(url, headers=HEADERS, timeout=10)
+                return response.status_code == 200 and len(response.content) > 0
+            except Exception:
+                return False
+
+    async def first_valid(urls):
+        valid = await asyncio.gather(*(check_favicon_url(url) for url in urls))
+        return next((url for url, ok in zip(urls, valid) if ok), None)
+
+    try:
+        default_favicon = f"{base_url}/favicon.ico"
+        if await check_favicon_url(default_favicon):
+            logger.info(f"Favicon found at default location: {default_favicon}")
+            return "🟢"
+        favicon_candidates = [default_favicon]
+
+        try:
+            response = await client.fetch_page(website)
+            response.raise_for_status()
+            linked = _linked_favicons(get_document(response).soup, website, parsed_url, base_url)
+            favicon_candidates.extend(linked)
+            favicon_url = await first_valid(linked)
+            if favicon_url:
+                logger.info(f"Favicon found via HTML link tag: {favicon_url}")
+                return "🟢"
+        except Exception as e:
+            logger.warning(f"Error parsing HTML for favicon on {website}: {e}")
+
+        common = [f"{base_url}{path}" for path in COMMON_PATHS]
+        favicon_candidates.extend(common)
+        favicon_url = await first_valid(common)
+        if favicon_url:
+            logger.info(f"Favicon found at common location: {favicon_url}")
+            return "🟢"
+
+        logger.warning(f"No valid favicon found for {website}. Checked {len(set(favicon_candidates))} locations")
+        return "🔴"
+
+    except async_http.REQUEST_ERRORS as e:
+        logger.error(f"Request error while checking favicon for {website}: {e}")
+        return "⚪"
+    except Exception as e:
+        logger.error(f"Unexpected error while checking favicon for {website}: {e}")
+        return "⚪"
@@ -1,8 +1,9 @@
-import requests
 import logging
 from requests.exceptions import RequestException, Timeout, HTTPError
 from urllib.parse import urlparse
 
+from core.page_cache import fetch_page
+
 logger = logging.getLogger(__name__)
 
 def check_floc(website: str) -> str:
@@ -35,13 +36,9 @@ def check_floc(website: str) -> str:
         logger.error(f"URL parsing error for {website}: {e}")
         return "⚪"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36'
-    }
-
     try:
         # Perform the HTTP request with timeout
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
 
         # Enhanced detection patterns
@@ -1,10 +1,11 @@
-from bs4 import BeautifulSoup
-import requests
 import logging
 from requests.exceptions import RequestException, HTTPError
 from urllib.parse import urlparse, urljoin
 import re
 
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 logger = logging.getLogger(__name__)
 
 def check_mixed_content(website: str) -> str:
@@ -37,17 +38,13 @@ def check_mixed_content(website: str) -> str:
         logger.error(f"URL parsing error for {website}: {e}")
         return "⚪"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         # Make a request to the website
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
 
         # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = get_document(response).soup
 
         # Enhanced detection patterns - check multiple attributes and elements
         mixed_content_found = []
@@ -4,6 +4,8 @@ import logging
 from requests.exceptions import RequestException, HTTPError
 from urllib.parse import urlparse
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 def check_mobile_friendly(website: str, api_key: str) -> str:
@@ -44,7 +46,7 @@ def check_mobile_friendly(website: str, api_key: str) -> str:
 
     try:
         # Make a POST request to the Google API
-        response = requests.post(api_url, headers=headers, json=payload, timeout=30)
+        response = http_client.post(api_url, headers=headers, json=payload, timeout=30)
         response.raise_for_status()
 
         # Parse the response JSON
@@ -1,8 +1,9 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
 from requests.exceptions import RequestException, HTTPError, Timeout
 
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,17 +30,13 @@ def check_open_graph_protocol(website: str) -> str:
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         # Make a request to the website
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
 
         # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = get_document(response).soup
 
         # List of essential Open Graph tags
         essential_tags = {'og:title', 'og:type', 'og:image', 'og:url'}
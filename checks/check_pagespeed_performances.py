@@ -1,7 +1,8 @@
-import requests
 import logging
 from requests.exceptions import RequestException, HTTPError, Timeout
 
+from core import http_client
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,7 +43,7 @@ def check_pagespeed_performances(website: str, api_key: str = None) -> str:
             'strategy': 'mobile'  # Default to mobile strategy
         }
         
-        response = requests.get(pagespeed_url, params=params, timeout=30)
+        response = http_client.get(pagespeed_url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -1,10 +1,12 @@
 import re
-import requests
 import logging
 from requests.exceptions import RequestException, Timeout, HTTPError
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from core import http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,7 +52,7 @@ def check_privacy_exposure(website: str) -> str:
 
     try:
         # Method 1: Direct HTML content analysis
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
 
         # Check for sensitive data patterns in the HTML content
@@ -61,7 +63,7 @@ def check_privacy_exposure(website: str) -> str:
                 logger.warning(f"Sensitive data pattern found: {pattern[:30]}... ({len(matches)} matches)")
 
         # Method 2: Meta tags and scripts analysis
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_document(response).soup
         
         # Check meta tags for privacy leaks
         meta_tags = soup.find_all('meta', {'name': re.compile(r'(description|keywords|author)', re.IGNORECASE)})
@@ -93,7 +95,7 @@ def check_privacy_exposure(website: str) -> str:
         for path in sensitive_paths:
             try:
                 file_url = urljoin(website, path)
-                file_response = requests.get(file_url, headers=headers, timeout=5)
+                file_response = http_client.get(file_url, headers=headers, timeout=5)
                 
                 if file_response.status_code == 200:
                     for pattern in sensitive_data_patterns:
@@ -114,7 +116,7 @@ def check_privacy_exposure(website: str) -> str:
         for backup_path in backup_patterns:
             try:
                 backup_url = urljoin(website, backup_path)
-                backup_response = requests.get(backup_url, headers=headers, timeout=5)
+                backup_response = http_client.get(backup_url, headers=headers, timeout=5)
                 
                 if backup_response.status_code == 200:
                     exposure_score += 5  # High weight for accessible backup files
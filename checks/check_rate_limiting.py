@@ -4,6 +4,8 @@ import logging
 from urllib.parse import urlparse, urlunparse
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core import http_client
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -66,7 +68,8 @@ def check_rate_limiting(website: str, num_requests: int = 5, delay: float = 0.3,
             start_time = time.perf_counter()
             
             try:
-                response = requests.get(website, headers=headers, timeout=15)
+                # Each request is a probe: retrying or hedging it would skew the count
+                response = http_client.get(website, headers=headers, timeout=15, retry=False)
                 end_time = time.perf_counter()
                 
                 response_time = end_time - start_time
@@ -1,8 +1,9 @@
-import requests
 import logging
 from requests.exceptions import RequestException, Timeout, HTTPError
 from urllib.parse import urljoin
 
+from core import http_client
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,7 +49,7 @@ def check_redirect_chains(website: str) -> str:
                 return "🔴"
             
             visited_urls.add(current_url)
-            response = requests.get(current_url, headers=headers, allow_redirects=False, timeout=15)
+            response = http_client.get(current_url, headers=headers, allow_redirects=False, timeout=15)
             
             # Check if there's a redirect
             if response.status_code in [301, 302, 303, 307, 308]:
@@ -1,11 +1,41 @@
-import requests
 import logging
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core import async_http, http_client
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _classify_redirect(status_code: int, location: str, website: str) -> str:
+    """Grade the HTTP response of the plain-HTTP site (shared by the sync and async checks)."""
+    # Enhanced redirect analysis
+    if status_code in [301, 302, 303, 307, 308] and location:
+        logger.debug(f"Redirect detected: {status_code} -> {location}")
+        
+        # Check if redirect is to HTTPS
+        if location.startswith(f"https://{website}"):
+            # Check for permanent redirect (301, 308) - more secure
+            if status_code in [301, 308]:
+                logger.info(f"Website {website} has secure permanent redirect to HTTPS")
+                return "🟢"
+            else:
+                logger.info(f"Website {website} redirects to HTTPS but uses temporary redirect")
+                return "🟠"
+        elif location.startswith('https://'):
+            # Redirects to HTTPS but different domain
+            logger.warning(f"Website {website} redirects to different HTTPS domain: {location}")
+            return "🟠"
+        else:
+            # Redirects but not to HTTPS
+            logger.warning(f"Website {website} redirects but not to HTTPS: {location}")
+            return "🔴"
+    else:
+        # No redirect or invalid redirect
+        logger.warning(f"Website {website} does not redirect from HTTP to HTTPS")
+        return "🔴"
+
+
 def check_redirects(website: str) -> str:
     """
     Verify if a website using HTTP redirects to its HTTPS counterpart with enhanced security analysis.
@@ -37,34 +67,9 @@ def check_redirects(website: str) -> str:
 
     try:
         # Make an HTTP request to the site and prevent automatic redirects
-        response = requests.get(f"http://{website}", headers=headers, allow_redirects=False, timeout=15)
-        redirect_location = response.headers.get('Location', '')
+        response = http_client.get(f"http://{website}", headers=headers, allow_redirects=False, timeout=15)
 
-        # Enhanced redirect analysis
-        if response.status_code in [301, 302, 303, 307, 308] and redirect_location:
-            logger.debug(f"Redirect detected: {response.status_code} -> {redirect_location}")
-            
-            # Check if redirect is to HTTPS
-            if redirect_location.startswith(f"https://{website}"):
-                # Check for permanent redirect (301, 308) - more secure
-                if response.status_code in [301, 308]:
-                    logger.info(f"Website {website} has secure permanent redirect to HTTPS")
-                    return "🟢"
-                else:
-                    logger.info(f"Website {website} redirects to HTTPS but uses temporary redirect")
-                    return "🟠"
-            elif redirect_location.startswith('https://'):
-                # Redirects to HTTPS but different domain
-                logger.warning(f"Website {website} redirects to different HTTPS domain: {redirect_location}")
-                return "🟠"
-            else:
-                # Redirects but not to HTTPS
-                logger.warning(f"Website {website} redirects but not to HTTPS: {redirect_location}")
-                return "🔴"
-        else:
-            # No redirect or invalid redirect
-            logger.warning(f"Website {website} does not redirect from HTTP to HTTPS")
-            return "🔴"
+        return _classify_redirect(response.status_code, response.headers.get('Location', ''), website)
 
     except (Timeout, HTTPError) as e:
         logger.warning(f"HTTP/Timeout error while checking redirects for {website}: {e}")
@@ -75,3 +80,31 @@ def check_redirects(website: str) -> str:
     except Exception as e:
         logger.error(f"Unexpected error while checking redirects for {website}: {e}")
         return "⚪"
+
+
+async def check_redirects_async(website: str) -> str:
+    """Async variant of ``check_redirects`` using the native asyncio HTTP client."""
+    if not website or not isinstance(website, str):
+        logger.error(f"Invalid website input: {website}")
+        return "⚪"
+    
+    website = website.strip()
+    if website.startswith(('http://', 'https://')):
+        from urllib.parse import urlparse
+        website = urlparse(website).netloc
+
+    headers = {
+        "User-Agent": "HTTPtoHTTPSRedirectChecker/2.0"
+    }
+
+    try:
+        response = await async_http.get_client().get(
+            f"http://{website}", headers=headers, allow_redirects=False, timeout=15
+        )
+        return _classify_redirect(response.status_code, response.headers.get('Location', ''), website)
+    except async_http.REQUEST_ERRORS as e:
+        logger.warning(f"Request error while checking redirects for {website}: {e}")
+        return "⚪"
+    except Exception as e:
+        logger.error(f"Unexpected error while checking redirects for {website}: {e}")
+        return "⚪"
@@ -1,11 +1,11 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
-from bs4 import FeatureNotFound
 from requests.exceptions import RequestException
 import json
 import re
 
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,21 +33,13 @@ def check_semantic_markup(website):
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         # Fetch website content
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
-        html_content = response.text
 
         # Parse HTML content
-        try:
-            soup = BeautifulSoup(html_content, 'lxml')
-        except FeatureNotFound:
-            soup = BeautifulSoup(html_content, 'html.parser')
+        soup = get_document(response).soup
         
         markup_score = 0
         markup_types = []
@@ -43,7 +43,7 @@ def check_server_response_time(website: str, num_attempts: int = 3) -> str:
         for attempt in range(num_attempts):
             start_time = time.perf_counter()
 
-            # Make the request and measure time to first byte
+            # Make the request and measure time to first byte (a fresh connection on purpose, not the shared pool)
             response = requests.get(website, headers=headers, timeout=15, stream=True)
             
             # Time to first byte
@@ -1,13 +1,68 @@
-import requests
+import asyncio
 import logging
-from bs4 import BeautifulSoup
+import re
 from urllib.parse import urljoin, urlparse
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core import async_http, http_client
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Enhanced sitemap paths with more comprehensive patterns
+SITEMAP_PATHS = [
+    '/sitemap.xml',                # Default location
+    '/sitemap_index.xml',          # Index file for multiple sitemaps
+    '/sitemap/sitemap.xml',        # Common alternative path
+    '/sitemap1.xml',               # Numbered sitemap
+    '/sitemap-index.xml',          # Alternative index naming
+    '/sitemap/sitemap-index.xml',  # Nested alternative
+    '/sitemap_index.xml.gz',       # Compressed sitemap
+    '/sitemaps.xml',               # Plural variant
+    '/site-map.xml',               # Hyphenated variant
+]
+
+SITEMAP_INDICATORS = ['<urlset', '<sitemapindex', '<url>', '<sitemap>']
+# Pages merely linked from the HTML must carry a sitemap root element
+LINKED_SITEMAP_INDICATORS = ['<urlset', '<sitemapindex']
+
+
+def _normalize(website):
+    """Return the website as an https URL by default, or None if the input is invalid."""
+    if not website or not isinstance(website, str):
+        logger.error(f"Invalid website input: {website}")
+        return None
+    
+    website = website.strip()
+    if not website.startswith(('http://', 'https://')):
+        website = f"https://{website}"
+    return website
+
+
+def _is_sitemap(response, indicators=SITEMAP_INDICATORS) -> bool:
+    if response.status_code != 200:
+        return False
+    content = response.text.lower()
+    return any(indicator in content for indicator in indicators)
+
+
+def _robots_sitemaps(robots_text: str) -> list:
+    """Return the sitemap URLs declared in robots.txt."""
+    robots_content = robots_text.lower()
+    if 'sitemap:' not in robots_content:
+        return []
+    return [url.strip() for url in re.findall(r'sitemap:\s*(.+)', robots_content, re.IGNORECASE)]
+
+
+def _linked_sitemaps(soup, website: str) -> list:
+    """Return the URLs of the page's links that mention a sitemap."""
+    sitemap_links = soup.find_all('a', href=lambda x: x and 'sitemap' in x.lower())
+    return [urljoin(website, link.get('href')) for link in sitemap_links if link.get('href')]
+
+
 def check_sitemap(website):
     """
     Check if the provided website has a sitemap.xml with enhanced validation.
@@ -22,49 +77,21 @@ def check_sitemap(website):
             - "⚪" for any other unexpected errors.
     """
     # Input validation and URL normalization
-    if not website or not isinstance(website, str):
-        logger.error(f"Invalid website input: {website}")
+    website = _normalize(website)
+    if website is None:
         return "⚪"
-    
-    website = website.strip()
-    if not website.startswith(('http://', 'https://')):
-        website = f"https://{website}"
-    
-    # Enhanced sitemap paths with more comprehensive patterns
-    sitemap_paths = [
-        '/sitemap.xml',                # Default location
-        '/sitemap_index.xml',          # Index file for multiple sitemaps
-        '/sitemap/sitemap.xml',        # Common alternative path
-        '/sitemap1.xml',               # Numbered sitemap
-        '/sitemap-index.xml',          # Alternative index naming
-        '/sitemap/sitemap-index.xml',  # Nested alternative
-        '/sitemap_index.xml.gz',       # Compressed sitemap
-        '/sitemaps.xml',               # Plural variant
-        '/site-map.xml',               # Hyphenated variant
-        '/robots.txt'                  # Check robots.txt for sitemap reference
-    ]
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
 
     try:
-        session = requests.Session()
-        session.headers.update(headers)
-        
         # Method 1: Check common sitemap paths
-        for path in sitemap_paths[:-1]:  # Exclude robots.txt for now
+        for path in SITEMAP_PATHS:
             try:
                 sitemap_url = urljoin(website, path)
-                response = session.get(sitemap_url, timeout=15)
+                response = http_client.get(sitemap_url, timeout=15)
                 
-                if response.status_code == 200:
-                    content = response.text.lower()
-                    
-                    # Enhanced validation of sitemap content
-                    if any(indicator in content for indicator in ['<urlset', '<sitemapindex', '<url>', '<sitemap>']):
-                        logger.info(f"Valid sitemap found at {sitemap_url}")
-                        return "🟢"
+                # Enhanced validation of sitemap content
+                if _is_sitemap(response):
+                    logger.info(f"Valid sitemap found at {sitemap_url}")
+                    return "🟢"
                     
             except (Timeout, HTTPError, RequestException):
                 continue
@@ -72,50 +99,33 @@ def check_sitemap(website):
         # Method 2: Check robots.txt for sitemap references
         try:
             robots_url = urljoin(website, '/robots.txt')
-            robots_response = session.get(robots_url, timeout=10)
+            robots_response = http_client.get(robots_url, timeout=10)
             
             if robots_response.status_code == 200:
-                robots_content = robots_response.text.lower()
-                if 'sitemap:' in robots_content:
-                    # Extract sitemap URLs from robots.txt
-                    import re
-                    sitemap_matches = re.findall(r'sitemap:\s*(.+)', robots_content, re.IGNORECASE)
-                    
-                    for sitemap_url in sitemap_matches:
-                        sitemap_url = sitemap_url.strip()
-                        try:
-                            sitemap_response = session.get(sitemap_url, timeout=10)
-                            if sitemap_response.status_code == 200:
-                                content = sitemap_response.text.lower()
-                                if any(indicator in content for indicator in ['<urlset', '<sitemapindex', '<url>', '<sitemap>']):
-                                    logger.info(f"Valid sitemap found via robots.txt: {sitemap_url}")
-                                    return "🟢"
-                        except (Timeout, HTTPError, RequestException):
-                            continue
+                for sitemap_url in _robots_sitemaps(robots_response.text):
+                    try:
+                        if _is_sitemap(http_client.get(sitemap_url, timeout=10)):
+                            logger.info(f"Valid sitemap found via robots.txt: {sitemap_url}")
+                            return "🟢"
+                    except (Timeout, HTTPError, RequestException):
+                        continue
         except (Timeout, HTTPError, RequestException):
             pass
         
         # Method 3: Check HTML for sitemap links
         try:
-            main_response = session.get(website, timeout=15)
+            main_response = fetch_page(website)
             if main_response.status_code == 200:
-                soup = BeautifulSoup(main_response.text, 'html.parser')
+                soup = get_document(main_response).soup
                 
                 # Look for sitemap links in HTML
-                sitemap_links = soup.find_all('a', href=lambda x: x and 'sitemap' in x.lower())
-                for link in sitemap_links:
-                    href = link.get('href')
-                    if href:
-                        sitemap_url = urljoin(website, href)
-                        try:
-                            sitemap_response = session.get(sitemap_url, timeout=10)
-                            if sitemap_response.status_code == 200:
-                                content = sitemap_response.text.lower()
-                                if any(indicator in content for indicator in ['<urlset', '<sitemapindex']):
-                                    logger.info(f"Valid sitemap found in HTML links: {sitemap_url}")
-                                    return "🟢"
-                        except (Timeout, HTTPError, RequestException):
-                            continue
+                for sitemap_url in _linked_sitemaps(soup, website):
+                    try:
+                        if _is_sitemap(http_client.get(sitemap_url, timeout=10), LINKED_SITEMAP_INDICATORS):
+                            logger.info(f"Valid sitemap found in HTML links: {sitemap_url}")
+                            return "🟢"
+                    except (Timeout, HTTPError, RequestException):
+                        continue
         except (Timeout, HTTPError, RequestException):
             pass
         
@@ -128,3 +138,64 @@ def check_sitemap(website):
     except Exception as e:
         logger.error(f"Unexpected error while checking sitemap for {website}: {e}")
         return "⚪"
+
+
+async def check_sitemap_async(website):
+    """
+    Async variant of ``check_sitemap`` using the native asyncio HTTP client.
+
+    The candidate URLs of each method are requested concurrently.
+    """
+    website = _normalize(website)
+    if website is None:
+        return "⚪"
+    client = async_http.get_client()
+
+    async def first_sitemap(urls, timeout, indicators=SITEMAP_INDICATORS):
+        async def valid(url):
+            try:
+                return _is_sitemap(await client.get(url, timeout=timeout), indicators)
+            except async_http.REQUEST_ERRORS:
+                return False
+        found = await asyncio.gather(*(valid(url) for url in urls))
+        return next((url for url, ok in zip(urls, found) if ok), None)
+
+    try:
+        # Method 1: Check common sitemap paths
+        sitemap_url = await first_sitemap([urljoin(website, path) for path in SITEMAP_PATHS], 15)
+        if sitemap_url:
+            logger.info(f"Valid sitemap found at {sitemap_url}")
+            return "🟢"
+
+        # Method 2: Check robots.txt for sitemap references
+        try:
+            robots_response = await client.get(urljoin(website, '/robots.txt'), timeout=10)
+            if robots_response.status_code == 200:
+                sitemap_url = await first_sitemap(_robots_sitemaps(robots_response.text), 10)
+                if sitemap_url:
+                    logger.info(f"Valid sitemap found via robots.txt: {sitemap_url}")
+                    return "🟢"
+        except async_http.REQUEST_ERRORS:
+            pass
+
+        # Method 3: Check HTML for sitemap links
+        try:
+            main_response = await client.fetch_page(website)
+            if main_response.status_code == 200:
+                soup = get_document(main_response).soup
+                sitemap_url = await first_sitemap(_linked_sitemaps(soup, website), 10, LINKED_SITEMAP_INDICATORS)
+                if sitemap_url:
+                    logger.info(f"Valid sitemap found in HTML links: {sitemap_url}")
+                    return "🟢"
+        except async_http.REQUEST_ERRORS:
+            pass
+
+        logger.warning(f"No valid sitemap found for {website}")
+        return "🔴"
+
+    except async_http.REQUEST_ERRORS as e:
+        logger.error(f"Request error while checking sitemap for {website}: {e}")
+        return "🔴"
+    except Exception as e:
+        logger.error(f"Unexpected error while checking sitemap for {website}: {e}")
+        return "⚪"
@@ -4,6 +4,8 @@ import logging
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
+from core.tls_probe import probe
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,21 +39,10 @@ def check_ssl_cert(website: str, port: int = 443) -> str:
     else:
         host = website.split(':')[0]
 
-    # Create enhanced SSL context
-    context = ssl.create_default_context()
-    context.check_hostname = True
-    context.verify_mode = ssl.CERT_REQUIRED
-
     try:
-        # Create connection with timeout
-        with socket.create_connection((host, port), timeout=15) as conn:
-            with context.wrap_socket(conn, server_hostname=host) as sock:
-                cert = sock.getpeercert()
-                cert_der = sock.getpeercert(binary_form=True)
-                
-                # Get protocol and cipher information
-                protocol_version = sock.version()
-                cipher_info = sock.cipher()
+        # Verified handshake, shared with the other TLS checks of the run
+        tls = probe(host, port)
+        cert = tls.cert
 
         # Extract certificate information
         subject = dict(x[0] for x in cert['subject'])
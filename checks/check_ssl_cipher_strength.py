@@ -2,6 +2,9 @@ import socket
 import ssl
 import logging
 
+from core.tls_probe import probe
+from core.tls_scan import scanner
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,15 +25,67 @@ MODERATE_CIPHERS = {
 }
 
 WEAK_CIPHERS = {
-    'RC4', 'DES', '3DES', 'MD5', 'SHA1', 'NULL'
+    'RC4', 'DES', '3DES', 'MD5', 'SHA1', 'NULL', 'EXP', 'ADH', 'AECDH'
 }
 
-def check_ssl_cipher_strength(website: str) -> str:
+OUTDATED_PROTOCOLS = {'TLSv1', 'TLSv1.1'}
+
+
+def _is_weak(cipher_name: str) -> bool:
+    cipher_upper = cipher_name.upper()
+    return any(weak in cipher_upper for weak in WEAK_CIPHERS)
+
+
+def _weaknesses(scan) -> list:
+    """Outdated protocol versions and weak suites a TLS scan found accepted."""
+    weaknesses = [protocol for protocol, accepted in scan.protocols.items()
+                  if accepted and protocol in OUTDATED_PROTOCOLS]
+    weaknesses += [cipher for ciphers in scan.ciphers.values() for cipher in ciphers if _is_weak(cipher)]
+    return weaknesses
+
+
+def _grade_negotiated(cipher_name: str, protocol_version: str) -> str:
+    """Grade the protocol version and suite negotiated by a default client."""
+    # Check for weak indicators first
+    if _is_weak(cipher_name):
+        logger.warning(f"Weak cipher components detected: {cipher_name}")
+        return "🔴"
+    
+    # Check protocol version
+    if protocol_version in ['TLSv1.3']:
+        logger.info(f"Excellent protocol version: {protocol_version}")
+        return "🟢"
+    elif protocol_version in ['TLSv1.2']:
+        # For TLS 1.2, check specific cipher
+        if cipher_name in STRONG_CIPHERS:
+            logger.info(f"Strong cipher with TLS 1.2: {cipher_name}")
+            return "🟢"
+        elif cipher_name in MODERATE_CIPHERS:
+            logger.info(f"Moderate cipher with TLS 1.2: {cipher_name}")
+            return "🟠"
+        else:
+            logger.warning(f"Unknown/weak cipher with TLS 1.2: {cipher_name}")
+            return "🔴"
+    elif protocol_version in ['TLSv1.1', 'TLSv1']:
+        logger.warning(f"Outdated protocol version: {protocol_version}")
+        return "🔴"
+    else:
+        logger.warning(f"Unknown protocol version: {protocol_version}")
+        return "🔴"
+
+
+def check_ssl_cipher_strength(website: str, enumerate_ciphers: bool = True) -> str:
     """
     Check the strength of the SSL/TLS cipher suite of the website with enhanced analysis.
 
+    Besides the suite negotiated by default, every protocol version and
+    suite the server accepts is enumerated; accepting an outdated protocol
+    or a weak suite is reported even if the server would never pick it
+    for a modern client.
+
     Args:
         website (str): URL of the website to be checked.
+        enumerate_ciphers (bool, optional): Enumerate the accepted protocols and suites. Defaults to True.
 
     Returns:
         str:
@@ -53,18 +108,10 @@ def check_ssl_cipher_strength(website: str) -> str:
         hostname = website.split('/')[0].split(':')[0]
 
     try:
-        # Create enhanced SSL context
-        context = ssl.create_default_context()
-        context.check_hostname = True
-        context.verify_mode = ssl.CERT_REQUIRED
-        
-        # Create connection with timeout
-        with socket.create_connection((hostname, 443), timeout=15) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                # Get comprehensive SSL information
-                cipher_info = ssock.cipher()
-                protocol_version = ssock.version()
-                cert = ssock.getpeercert()
+        # Verified handshake, shared with the other TLS checks of the run
+        tls = probe(hostname)
+        cipher_info = tls.cipher
+        protocol_version = tls.protocol
 
         if not cipher_info:
             logger.warning(f"No cipher information available for {hostname}")
@@ -76,36 +123,27 @@ def check_ssl_cipher_strength(website: str) -> str:
 
         logger.info(f"SSL analysis for {hostname}: {cipher_name}, {protocol_version}, {cipher_bits} bits")
 
-        # Enhanced cipher strength analysis
-        cipher_upper = cipher_name.upper()
-        
-        # Check for weak indicators first
-        if any(weak in cipher_upper for weak in WEAK_CIPHERS):
-            logger.warning(f"Weak cipher components detected: {cipher_name}")
-            return "🔴"
-        
-        # Check protocol version
-        if protocol_version in ['TLSv1.3']:
-            logger.info(f"Excellent protocol version: {protocol_version}")
-            return "🟢"
-        elif protocol_version in ['TLSv1.2']:
-            # For TLS 1.2, check specific cipher
-            if cipher_name in STRONG_CIPHERS:
-                logger.info(f"Strong cipher with TLS 1.2: {cipher_name}")
-                return "🟢"
-            elif cipher_name in MODERATE_CIPHERS:
-                logger.info(f"Moderate cipher with TLS 1.2: {cipher_name}")
-                return "🟠"
-            else:
-                logger.warning(f"Unknown/weak cipher with TLS 1.2: {cipher_name}")
-                return "🔴"
-        elif protocol_version in ['TLSv1.1', 'TLSv1']:
-            logger.warning(f"Outdated protocol version: {protocol_version}")
-            return "🔴"
-        else:
-            logger.warning(f"Unknown protocol version: {protocol_version}")
+        result = _grade_negotiated(cipher_name, protocol_version)
+        if result == "🔴" or not enumerate_ciphers:
+            return result
+
+        # One accepted weakness is enough for 🔴, so the scan stops at the first
+        try:
+            scan = scanner.scan(hostname, stop=lambda partial: bool(_weaknesses(partial)))
+        except OSError as e:
+            logger.warning(f"Could not enumerate the TLS suites of {hostname}: {e}")
+            return result
+
+        weaknesses = _weaknesses(scan)
+        if weaknesses:
+            logger.warning(f"{hostname} accepts outdated protocols or weak ciphers: {', '.join(weaknesses)}")
             return "🔴"
 
+        accepted = {protocol: len(ciphers) for protocol, ciphers in scan.ciphers.items()}
+        logger.info(f"TLS scan of {hostname}: accepted suites per protocol {accepted} "
+                    f"({scan.handshakes} handshakes in {scan.duration:.1f}s)")
+        return result
+
     except socket.timeout:
         logger.warning(f"Connection timeout for {hostname}")
         return "⚪"
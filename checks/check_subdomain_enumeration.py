@@ -1,20 +1,154 @@
-import requests
+import asyncio
+import itertools
 import logging
+import re
+import secrets
 from urllib.parse import urlparse
 from requests.exceptions import RequestException, Timeout, HTTPError
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Set
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+
+from core import async_http, http_client
+from core.dns_cache import dns_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def check_subdomain_enumeration(website: str) -> tuple:
+# Enhanced subdomain list with security-focused subdomains
+SUBDOMAINS = [
+    # Common subdomains
+    "www", "api", "dev", "test", "staging", "mail", "blog", "shop", "admin",
+    # Development/staging subdomains (potentially risky)
+    "development", "stage", "beta", "alpha", "demo", "sandbox",
+    # Infrastructure subdomains
+    "cdn", "static", "assets", "media", "files",
+    # Potentially sensitive subdomains
+    "backup", "old", "legacy", "archive", "temp", "tmp",
+    # Service subdomains
+    "ftp", "ssh", "vpn", "remote", "portal"
+]
+
+# Categorize subdomains by risk level
+RISKY_SUBDOMAINS = {
+    "dev", "test", "staging", "development", "stage", "beta", "alpha",
+    "demo", "sandbox", "backup", "old", "legacy", "archive", "temp", "tmp"
+}
+
+# Concurrent DNS lookups per enumeration; only names that resolve are probed over HTTP
+DNS_CONCURRENCY = 100
+HTTP_CONCURRENCY = 10
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+_LABELS = re.compile(r'^[a-z0-9_]([a-z0-9_-]*[a-z0-9])?(\.[a-z0-9_]([a-z0-9_-]*[a-z0-9])?)*$')
+
+
+def _domain_of(website: str) -> Optional[str]:
+    """Extract the domain from a URL or bare hostname, or None if the input is invalid."""
+    if not website or not isinstance(website, str):
+        logger.error(f"Invalid website input: {website}")
+        return None
+
+    # Extract domain from URL if full URL provided
+    if website.startswith(('http://', 'https://')):
+        return urlparse(website).netloc
+    return website.strip()
+
+
+def _candidates(wordlist: Optional[str] = None) -> Iterator[str]:
+    """
+    Yield the built-in subdomain labels, then those of ``wordlist``.
+
+    The wordlist (one label per line, ``#`` for comments) is read line by
+    line as the enumeration consumes it, so it can hold millions of names.
+    """
+    yield from SUBDOMAINS
+    if not wordlist:
+        return
+    builtin = set(SUBDOMAINS)
+    try:
+        with open(wordlist, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                label = line.split('#', 1)[0].strip().lower().rstrip('.')
+                if label and label not in builtin and _LABELS.match(label):
+                    yield label
+    except OSError as e:
+        logger.error(f"Could not read subdomain wordlist {wordlist}: {e}")
+
+
+def _addresses(answer) -> Set[str]:
+    return {rdata.address for rdata in answer}
+
+
+def _is_wildcard(addresses: Set[str], wildcard: Optional[Set[str]]) -> bool:
+    """Whether a name only resolves the way a random, non-existent name of the zone does."""
+    return wildcard is not None and addresses <= wildcard
+
+
+def _probe_names(domain: str) -> List[str]:
+    """Random names that cannot exist; if they resolve, the zone has wildcard DNS."""
+    return [f"{secrets.token_hex(8)}.{domain}" for _ in range(2)]
+
+
+def _resolve(name: str) -> Optional[Set[str]]:
+    """Resolve a name through the shared DNS cache: its IPv4 addresses, or None if it does not exist."""
+    try:
+        return _addresses(dns_cache.resolve(name, 'A'))
+    except dns.resolver.NoAnswer:
+        return set()  # The name exists, without an IPv4 address
+    except dns.exception.DNSException:
+        return None
+
+
+def _wildcard_addresses(results: List[Optional[Set[str]]]) -> Optional[Set[str]]:
+    resolved = [addresses for addresses in results if addresses is not None]
+    return set().union(*resolved) if resolved else None
+
+
+def _summarize(domain: str, discovered_subdomains: List[str]) -> tuple:
+    """Grade the discovered subdomains (shared by the sync and async checks)."""
+    risky_subdomains = [
+        url for url in discovered_subdomains
+        if urlparse(url).netloc[:-len(domain) - 1].split('.')[0] in RISKY_SUBDOMAINS
+    ]
+
+    # Enhanced result analysis
+    total_discovered = len(discovered_subdomains)
+    total_risky = len(risky_subdomains)
+
+    logger.info(f"Subdomain enumeration for {domain}: {total_discovered} discovered, {total_risky} potentially risky")
+
+    if total_risky > 0:
+        logger.warning(f"Risky subdomains found: {risky_subdomains}")
+        return "🔴", discovered_subdomains
+    elif total_discovered > 5:
+        logger.warning(f"Multiple subdomains discovered for {domain}, potential attack surface")
+        return "🟠", discovered_subdomains
+    elif total_discovered > 0:
+        logger.info(f"Few subdomains discovered for {domain}")
+        return "🟠", discovered_subdomains
+    else:
+        logger.info(f"No subdomains discovered for {domain}")
+        return "🟢", []
+
+
+def check_subdomain_enumeration(website: str, wordlist: Optional[str] = None) -> tuple:
     """
     Check for the existence of common subdomains for a given website with enhanced security analysis.
 
+    Candidates are resolved first; only names that exist, and do not merely
+    match the zone's wildcard record, are requested over HTTPS.
+
     Args:
         website (str): The main domain of the website to be checked.
+        wordlist (str, optional): File with extra subdomain labels, one per line.
 
     Returns:
         tuple: A status symbol and a list of discovered subdomains.
@@ -23,100 +157,108 @@ def check_subdomain_enumeration(website: str) -> tuple:
             - "🔴" if risky subdomains were found.
             - "⚪" for unexpected errors.
     """
-    # Input validation and URL normalization
-    if not website or not isinstance(website, str):
-        logger.error(f"Invalid website input: {website}")
+    domain = _domain_of(website)
+    if domain is None:
         return "⚪", []
-    
-    # Extract domain from URL if full URL provided
-    if website.startswith(('http://', 'https://')):
-        parsed = urlparse(website)
-        domain = parsed.netloc
-    else:
-        domain = website.strip()
-
-    # Enhanced subdomain list with security-focused subdomains
-    SUBDOMAINS = [
-        # Common subdomains
-        "www", "api", "dev", "test", "staging", "mail", "blog", "shop", "admin",
-        # Development/staging subdomains (potentially risky)
-        "development", "stage", "beta", "alpha", "demo", "sandbox",
-        # Infrastructure subdomains
-        "cdn", "static", "assets", "media", "files",
-        # Potentially sensitive subdomains
-        "backup", "old", "legacy", "archive", "temp", "tmp",
-        # Service subdomains
-        "ftp", "ssh", "vpn", "remote", "portal"
-    ]
-    
-    # Categorize subdomains by risk level
-    RISKY_SUBDOMAINS = {
-        "dev", "test", "staging", "development", "stage", "beta", "alpha", 
-        "demo", "sandbox", "backup", "old", "legacy", "archive", "temp", "tmp"
-    }
-
-    discovered_subdomains = []
-    risky_subdomains = []
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
 
-    def check_subdomain(subdomain):
+    def check_subdomain(subdomain_url: str) -> Optional[str]:
         """Helper function to check individual subdomain."""
-        subdomain_url = f"https://{subdomain}.{domain}"
         try:
-            response = requests.get(subdomain_url, headers=headers, timeout=10, allow_redirects=True)
+            response = http_client.get(subdomain_url, headers=HEADERS, timeout=10, allow_redirects=True)
             if response.status_code == 200:
                 logger.debug(f"Discovered subdomain: {subdomain_url}")
-                return subdomain_url, subdomain in RISKY_SUBDOMAINS
-            return None, False
+                return subdomain_url
+            return None
         except (Timeout, HTTPError, RequestException):
-            return None, False
+            return None
         except Exception as e:
             logger.debug(f"Error checking {subdomain_url}: {e}")
-            return None, False
+            return None
 
     try:
-        # Use ThreadPoolExecutor for concurrent subdomain checking
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            # Submit all subdomain checks
-            future_to_subdomain = {
-                executor.submit(check_subdomain, sub): sub 
-                for sub in SUBDOMAINS
-            }
-            
-            # Process results as they complete
-            for future in as_completed(future_to_subdomain, timeout=60):
-                subdomain = future_to_subdomain[future]
-                try:
-                    result, is_risky = future.result()
-                    if result:
-                        discovered_subdomains.append(result)
-                        if is_risky:
-                            risky_subdomains.append(result)
-                except Exception as e:
-                    logger.debug(f"Error processing result for {subdomain}: {e}")
-                    continue
-
-        # Enhanced result analysis
-        total_discovered = len(discovered_subdomains)
-        total_risky = len(risky_subdomains)
-
-        logger.info(f"Subdomain enumeration for {domain}: {total_discovered} discovered, {total_risky} potentially risky")
-        
-        if total_risky > 0:
-            logger.warning(f"Risky subdomains found: {risky_subdomains}")
-            return "🔴", discovered_subdomains
-        elif total_discovered > 5:
-            logger.warning(f"Multiple subdomains discovered for {domain}, potential attack surface")
-            return "🟠", discovered_subdomains
-        elif total_discovered > 0:
-            logger.info(f"Few subdomains discovered for {domain}")
-            return "🟠", discovered_subdomains
-        else:
-            logger.info(f"No subdomains discovered for {domain}")
-            return "🟢", []
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            wildcard = _wildcard_addresses(list(executor.map(_resolve, _probe_names(domain))))
+            if wildcard is not None:
+                logger.info(f"Wildcard DNS detected for {domain}: {sorted(wildcard)}")
+
+            # Resolve in batches so that a large wordlist is never loaded whole
+            existing = []
+            labels = _candidates(wordlist)
+            while True:
+                batch = [f"{label}.{domain}" for label in itertools.islice(labels, 1000)]
+                if not batch:
+                    break
+                for name, addresses in zip(batch, executor.map(_resolve, batch)):
+                    if addresses is not None and not _is_wildcard(addresses, wildcard):
+                        existing.append(f"https://{name}")
+
+        with ThreadPoolExecutor(max_workers=HTTP_CONCURRENCY) as executor:
+            discovered_subdomains = [url for url in executor.map(check_subdomain, existing) if url]
+
+        return _summarize(domain, discovered_subdomains)
+
+    except Exception as e:
+        logger.error(f"Unexpected error during subdomain enumeration for {domain}: {e}")
+        return "⚪", []
+
+
+async def check_subdomain_enumeration_async(website: str, wordlist: Optional[str] = None) -> tuple:
+    """Async variant of ``check_subdomain_enumeration`` resolving candidates with asyncio DNS."""
+    domain = _domain_of(website)
+    if domain is None:
+        return "⚪", []
+
+    resolver = dns.asyncresolver.Resolver(configure=False)
+    resolver.nameservers = list(dns_cache.resolver.nameservers)
+    resolver.timeout = resolver.lifetime = dns_cache.timeout
+
+    async def resolve(name: str) -> Optional[Set[str]]:
+        try:
+            return _addresses(await resolver.resolve(name, 'A'))
+        except dns.resolver.NoAnswer:
+            return set()
+        except dns.exception.DNSException:
+            return None
+
+    async def check_subdomain(subdomain_url: str) -> Optional[str]:
+        try:
+            response = await async_http.get_client().get(subdomain_url, headers=HEADERS, timeout=10)
+            if response.status_code == 200:
+                logger.debug(f"Discovered subdomain: {subdomain_url}")
+                return subdomain_url
+            return None
+        except async_http.REQUEST_ERRORS:
+            return None
+        except Exception as e:
+            logger.debug(f"Error checking {subdomain_url}: {e}")
+            return None
+
+    try:
+        wildcard = _wildcard_addresses(await asyncio.gather(*(resolve(name) for name in _probe_names(domain))))
+        if wildcard is not None:
+            logger.info(f"Wildcard DNS detected for {domain}: {sorted(wildcard)}")
+
+        # Workers pull from one lazy iterator, so a large wordlist is never loaded whole
+        labels = _candidates(wordlist)
+        existing = []
+
+        async def resolver_worker():
+            for label in labels:
+                name = f"{label}.{domain}"
+                addresses = await resolve(name)
+                if addresses is not None and not _is_wildcard(addresses, wildcard):
+                    existing.append(f"https://{name}")
+
+        await asyncio.gather(*(resolver_worker() for _ in range(DNS_CONCURRENCY)))
+
+        semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+
+        async def probe(subdomain_url: str) -> Optional[str]:
+            async with semaphore:
+                return await check_subdomain(subdomain_url)
+
+        discovered_subdomains = [url for url in await asyncio.gather(*(probe(url) for url in existing)) if url]
+        return _summarize(domain, discovered_subdomains)
 
     except Exception as e:
         logger.error(f"Unexpected error during subdomain enumeration for {domain}: {e}")
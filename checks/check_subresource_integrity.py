@@ -1,9 +1,10 @@
-import requests
 import logging
-from bs4 import BeautifulSoup
 from typing import Tuple
 from requests.exceptions import RequestException
 
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,17 +32,13 @@ def check_subresource_integrity(website: str) -> Tuple[str, int]:
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         # Fetch website content
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
         
         # Parse HTML content
-        soup = BeautifulSoup(response.content, 'lxml')
+        soup = get_document(response).soup
 
         # Find all external resources that should have SRI
         external_resources = []
@@ -1,9 +1,10 @@
-import requests
 import logging
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core.dom_cache import get_document
+from core.page_cache import fetch_page
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,13 +32,9 @@ def check_third_party_resources(website: str) -> str:
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         # Fetch content with proper error handling
-        response = requests.get(website, headers=headers, timeout=15)
+        response = fetch_page(website)
         response.raise_for_status()
 
         # Parse main domain
@@ -49,7 +46,7 @@ def check_third_party_resources(website: str) -> str:
             root_domain = main_domain
 
         # Parse HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = get_document(response).soup
 
         # Track third-party domains and resource types
         third_party_domains = set()
@@ -67,7 +67,7 @@ def check_website_load_time(website: str, num_attempts: int = 3) -> str:
         for attempt in range(num_attempts):
             start_time = time.perf_counter()
             
-            # Perform the request with enhanced monitoring
+            # Perform the request with enhanced monitoring (a fresh connection on purpose, not the shared pool)
             response = requests.get(
                 website, 
                 headers=headers, 
@@ -1,8 +1,9 @@
-import requests
 import logging
 from typing import Optional
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from core.page_cache import fetch_page
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,13 +32,9 @@ def check_xss_protection(website: str, timeout_seconds: Optional[int] = 10) -> s
     if not website.startswith(('http://', 'https://')):
         website = f"https://{website}"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         # Make request with proper timeout and error handling
-        response = requests.get(website, headers=headers, timeout=timeout_seconds)
+        response = fetch_page(website, timeout=timeout_seconds)
         response.raise_for_status()
 
         # Check X-XSS-Protection header
@@ -0,0 +1,6 @@
+"""
+Core runtime components for the Website Monitor.
+
+These modules hold the execution machinery shared by main.py, api.py and
+scheduler.py; the individual checks live in the checks/ directory.
+"""
@@ -0,0 +1,292 @@
+"""
+Native asyncio HTTP client for the async variants of the checks.
+
+Thread-backed checks cost one worker thread per blocking request. The
+async variants registered alongside them (``check_*_async``) use this
+client instead, so a single event loop can keep thousands of requests in
+flight. It is built on aiohttp, which is optional: when it is not
+installed ``AVAILABLE`` is False and the engine runs the sync checks.
+
+Responses are returned as ``AsyncResponse`` objects exposing the small
+subset of the ``requests.Response`` API the checks rely on, so helpers
+like ``core.dom_cache.get_document`` work on them unchanged.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from core.circuit_breaker import breaker, endpoint_of, host_of
+from core.http_client import DEFAULT_HEADERS, DEFAULT_TIMEOUT
+from core.page_cache import normalize_url
+from core.retry import RETRY_STATUSES, policy
+
+try:
+    import aiohttp
+    AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHttpError(Exception):
+    """Raised by ``AsyncResponse.raise_for_status`` for 4xx/5xx responses."""
+
+
+class HostUnreachableError(AsyncHttpError):
+    """Raised without sending the request when the host's circuit is open."""
+
+
+# Exceptions an async check should treat as request failures
+REQUEST_ERRORS: Tuple[type, ...] = (AsyncHttpError, asyncio.TimeoutError)
+if AVAILABLE:
+    REQUEST_ERRORS += (aiohttp.ClientError,)
+
+
+class AsyncResponse:
+    """Fully read HTTP response."""
+
+    def __init__(self, url: str, status_code: int, headers, content: bytes, encoding: Optional[str],
+                 history: Tuple['AsyncResponse', ...] = ()):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.history = history
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise AsyncHttpError(f"{self.status_code} error for url: {self.url}")
+
+
+class AsyncHttpClient:
+    """Shared ``aiohttp.ClientSession`` with bounded connection pools."""
+
+    def __init__(self, limit: int = 1000, limit_per_host: int = 4, timeout: float = DEFAULT_TIMEOUT,
+                 headers: Optional[Dict[str, str]] = None):
+        if not AVAILABLE:
+            raise RuntimeError("aiohttp is not installed")
+        self.timeout = timeout
+        self.loop = asyncio.get_running_loop()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=300),
+            headers=headers or DEFAULT_HEADERS,
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                      allow_redirects: bool = True, timeout: Optional[float] = None, retry: bool = True,
+                      **kwargs: Any) -> AsyncResponse:
+        """
+        Send a request and read the whole body, failing fast if the host's circuit is open.
+
+        Idempotent requests are retried and hedged like those of the sync client;
+        pass ``retry=False`` to send exactly one request.
+        """
+        host = host_of(url)
+        endpoint = endpoint_of(url)
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        attempts = policy.attempts(method) if retry else 1
+        for attempt in range(attempts):
+            if breaker.is_open(endpoint):
+                raise HostUnreachableError(f"{endpoint} is unreachable (circuit open)")
+            try:
+                result = await self._send(method, url, host, retry, headers=headers,
+                                          allow_redirects=allow_redirects, timeout=client_timeout, **kwargs)
+            except aiohttp.ClientSSLError:
+                raise
+            except aiohttp.ClientConnectorError as e:
+                breaker.record_failure(endpoint, str(e))
+                if attempt + 1 >= attempts:
+                    raise
+                await asyncio.sleep(policy.backoff(attempt))
+                continue
+            breaker.record_success(endpoint)
+            if result.status_code in RETRY_STATUSES and attempt + 1 < attempts:
+                await asyncio.sleep(policy.backoff(attempt, result.headers.get('Retry-After')))
+                continue
+            return result
+
+    async def _fetch(self, method: str, url: str, **kwargs: Any) -> AsyncResponse:
+        async with self.session.request(method, url, **kwargs) as response:
+            content = await response.read()
+            history = tuple(
+                AsyncResponse(str(hop.url), hop.status, hop.headers, b'', None) for hop in response.history
+            )
+            return AsyncResponse(str(response.url), response.status, response.headers, content,
+                                 response.charset, history)
+
+    async def _send(self, method: str, url: str, host: str, hedge: bool, **kwargs: Any) -> AsyncResponse:
+        """Send one attempt, hedged if allowed and the policy says so, and record its latency."""
+        started = time.perf_counter()
+        delay = policy.hedge_delay(method, host) if hedge else None
+        primary = asyncio.ensure_future(self._fetch(method, url, **kwargs))
+        tasks = {primary}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    policy.record_hedge()
+                    tasks.add(asyncio.ensure_future(self._fetch(method, url, **kwargs)))
+            while True:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                winner = succeeded[0] if succeeded else done.pop()
+                # If the first to finish failed, the other one may still succeed
+                if succeeded or not tasks:
+                    break
+            result = winner.result()
+            if winner is not primary:
+                policy.record_hedge(won=True)
+        finally:
+            for task in tasks:
+                task.cancel()
+        policy.record_latency(host, time.perf_counter() - started)
+        return result
+
+    async def get(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request('GET', url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> AsyncResponse:
+        kwargs.setdefault('allow_redirects', False)
+        return await self.request('HEAD', url, **kwargs)
+
+    async def fetch_page(self, url: str, allow_redirects: bool = True,
+                         timeout: float = DEFAULT_TIMEOUT) -> AsyncResponse:
+        """
+        GET a page with the default profile, once per client (single-flight).
+
+        This is the async counterpart of ``core.page_cache.fetch_page``.
+        """
+        return await pages.fetch(self, url, allow_redirects=allow_redirects, timeout=timeout)
+
+    async def close(self):
+        await self.session.close()
+
+
+class AsyncPageCache:
+    """
+    Single-flight cache of the pages fetched by the async checks.
+
+    Like ``core.page_cache``, it is only active within run scopes and is
+    emptied when the last open scope closes, so a run finishing does not
+    drop the pages of another run still in progress (e.g. two concurrent
+    API requests). Failed fetches are not kept, and pages older than
+    ``max_age`` seconds are fetched again.
+    """
+
+    def __init__(self, max_age: float = 300):
+        self.max_age = max_age
+        # key -> (fetch task, monotonic time it finished)
+        self._pages: Dict[Tuple[str, bool], asyncio.Future] = {}
+        self._fetched_at: Dict[Tuple[str, bool], float] = {}
+        self._lock = threading.Lock()
+        self._scopes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether at least one run scope is open."""
+        return self._scopes > 0
+
+    @contextmanager
+    def run_scope(self):
+        """Enable caching for the duration of a monitoring run."""
+        with self._lock:
+            self._scopes += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._scopes -= 1
+                if self._scopes == 0:
+                    logger.info(f"Async page cache: {self.hits} hits, {self.misses} misses, {len(self._pages)} pages")
+                    self._pages.clear()
+                    self._fetched_at.clear()
+                    self.hits = 0
+                    self.misses = 0
+
+    async def fetch(self, client: 'AsyncHttpClient', url: str, allow_redirects: bool = True,
+                    timeout: float = DEFAULT_TIMEOUT) -> AsyncResponse:
+        """Return the (possibly shared) response for a GET request sent with ``client``."""
+        url = normalize_url(url)
+        if not self.active:
+            return await client.get(url, allow_redirects=allow_redirects, timeout=timeout)
+
+        key = (url, allow_redirects)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            future = self._pages.get(key)
+            if future is not None and future.get_loop() is not loop:
+                # Fetched by a run on another event loop
+                future = None
+            elif future is not None and future.done():
+                # Without a fetch time the task has just failed and is still landing; share it
+                fetched_at = self._fetched_at.get(key)
+                if fetched_at is not None and time.monotonic() - fetched_at > self.max_age:
+                    future = None
+            if future is None:
+                self._fetched_at.pop(key, None)
+                future = loop.create_task(self._get(key, client, url, allow_redirects, timeout))
+                future.add_done_callback(lambda task: self._landed(key, task))
+                self._pages[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+        return await asyncio.shield(future)
+
+    async def _get(self, key: Tuple[str, bool], client: 'AsyncHttpClient', url: str, allow_redirects: bool,
+                   timeout: float) -> AsyncResponse:
+        response = await client.get(url, allow_redirects=allow_redirects, timeout=timeout)
+        # Recorded before the task is done, so no caller sees a finished page without it
+        with self._lock:
+            self._fetched_at[key] = time.monotonic()
+        return response
+
+    def _landed(self, key: Tuple[str, bool], task: asyncio.Future):
+        with self._lock:
+            if self._pages.get(key) is task and (task.cancelled() or task.exception() is not None):
+                # Callers already waiting share the error; later ones fetch again
+                del self._pages[key]
+
+
+pages = AsyncPageCache()
+_client: Optional[AsyncHttpClient] = None
+_settings: Dict[str, Any] = {}
+
+
+def configure(**settings: Any):
+    """Set the options (see ``AsyncHttpClient``) used when the client is created."""
+    _settings.update(settings)
+
+
+def get_client() -> AsyncHttpClient:
+    """Return the client bound to the running event loop, creating it if needed."""
+    global _client
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.loop is not loop or _client.session.closed:
+        _client = AsyncHttpClient(**_settings)
+    return _client
+
+
+async def close_client():
+    """Close the shared client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -0,0 +1,149 @@
+"""
+Per-host circuit breaker and reachability pre-flight.
+
+When a monitored site is down every check against it would otherwise wait
+out its own connect timeout (and retries). The engine probes each site once
+before its first site-bound check; a host that cannot be resolved or
+connected to, or whose requests keep failing to connect, is marked open and
+the remaining site-bound checks return ``UNREACHABLE`` immediately. DNS and
+WHOIS checks do not talk to the host and keep running.
+
+Circuits are kept per endpoint (scheme, host and port), so a site that only
+serves HTTPS is not marked down because checks probing its port 80 fail.
+
+An open circuit closes again after ``reset_after`` seconds: the next
+request is let through as a trial and its outcome decides the new state.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Result reported for site-bound checks skipped because the host is unreachable
+UNREACHABLE = "⚫"
+
+
+def host_of(url: str) -> str:
+    """Return the lowercased hostname of a URL or bare domain."""
+    if '://' not in url:
+        url = f"https://{url}"
+    return (urlparse(url).hostname or '').lower()
+
+
+def endpoint_of(url: str) -> str:
+    """Return the circuit key of a URL or bare domain, e.g. ``https://example.com:443``."""
+    if '://' not in url:
+        url = f"https://{url}"
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    if port is None:
+        port = 80 if scheme == 'http' else 443
+    return f"{scheme}://{(parsed.hostname or '').lower()}:{port}"
+
+
+class _HostState:
+    __slots__ = ('failures', 'opened_at', 'reason')
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.reason = ''
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker keyed by endpoint (see ``endpoint_of``)."""
+
+    def __init__(self, failure_threshold: int = 3, reset_after: float = 300):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_after = reset_after
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, failure_threshold: Optional[int] = None, reset_after: Optional[float] = None):
+        """Update the thresholds without forgetting the known host states."""
+        with self._lock:
+            if failure_threshold is not None:
+                self.failure_threshold = max(1, failure_threshold)
+            if reset_after is not None:
+                self.reset_after = reset_after
+
+    def is_open(self, host: str) -> bool:
+        """Return True if requests to ``host`` should fail fast."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state.opened_at is None:
+                return False
+            if time.monotonic() - state.opened_at >= self.reset_after:
+                # Half-open: let the next request through as a trial
+                state.opened_at = None
+                state.failures = self.failure_threshold - 1
+                return False
+            return True
+
+    def record_success(self, host: str):
+        with self._lock:
+            state = self._hosts.pop(host, None)
+        if state is not None and state.opened_at is not None:
+            logger.info(f"Circuit for {host} closed")
+
+    def record_failure(self, host: str, reason: str = ''):
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostState())
+            state.failures += 1
+            if state.opened_at is not None or state.failures < self.failure_threshold:
+                return
+            state.opened_at = time.monotonic()
+            state.reason = reason
+        logger.warning(f"Circuit for {host} opened after {state.failures} failures: {reason}")
+
+    def trip(self, host: str, reason: str):
+        """Open the circuit for ``host`` immediately."""
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostState())
+            state.failures = max(state.failures, self.failure_threshold)
+            state.opened_at = time.monotonic()
+            state.reason = reason
+        logger.warning(f"Circuit for {host} opened: {reason}")
+
+    def open_hosts(self) -> Dict[str, str]:
+        """Return the currently open hosts and why they were opened."""
+        with self._lock:
+            return {host: state.reason for host, state in self._hosts.items() if state.opened_at is not None}
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+
+async def probe_host(host: str, ports: Iterable[int] = (443, 80), timeout: float = 5) -> Optional[str]:
+    """
+    Check that ``host`` resolves and accepts a TCP connection on one of ``ports``.
+
+    Returns:
+        None if the host is reachable, otherwise the reason it is not.
+    """
+    reason = 'no ports to probe'
+    for port in ports:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except asyncio.TimeoutError:
+            reason = f"connect to port {port} timed out after {timeout}s"
+            continue
+        except OSError as e:
+            reason = f"port {port}: {e}"
+            continue
+        writer.close()
+        return None
+    return reason
+
+
+breaker = CircuitBreaker()
@@ -0,0 +1,89 @@
+"""
+Process-wide limit on how fast checks are started.
+
+Even with their start times spread out, a large batch of due checks (the
+first run, or many sites sharing a slot) would otherwise be started as fast
+as the concurrency limits allow. ``DispatchLimiter`` spaces check starts at
+most ``rate`` per second and measures the rate actually achieved, which is
+exposed in the API's ``/metrics`` and the scheduler's log.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class DispatchLimiter:
+    """Spaces check starts to at most ``rate`` per second and measures the realized rate."""
+
+    def __init__(self, rate: Optional[float] = None, window: float = 60):
+        """
+        Args:
+            rate: Maximum check starts per second; None or 0 for no limit.
+            window: Seconds over which the realized dispatch rate is measured.
+        """
+        self.rate = rate
+        self.window = window
+        self.dispatched = 0
+        self.delayed = 0
+        self._next_slot = 0.0
+        self._recent = deque()  # (second, starts in that second)
+        self._lock = threading.Lock()
+
+    def configure(self, rate: Optional[float] = None):
+        """Change the maximum dispatch rate."""
+        with self._lock:
+            self.rate = rate
+            self._next_slot = 0.0
+
+    def _reserve(self) -> float:
+        """Reserve the next free start slot and return how long to wait for it."""
+        with self._lock:
+            if not self.rate:
+                return 0.0
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+            return slot - now
+
+    def _record(self):
+        now = time.monotonic()
+        second = int(now)
+        with self._lock:
+            self.dispatched += 1
+            if self._recent and self._recent[-1][0] == second:
+                self._recent[-1] = (second, self._recent[-1][1] + 1)
+            else:
+                self._recent.append((second, 1))
+            while self._recent and self._recent[0][0] <= now - self.window:
+                self._recent.popleft()
+
+    async def acquire(self):
+        """Wait for a start slot; call right before starting a check."""
+        delay = self._reserve()
+        if delay > 0:
+            self.delayed += 1
+            await asyncio.sleep(delay)
+        self._record()
+
+    def realized_rate(self) -> float:
+        """Return the check starts per second over the last ``window`` seconds."""
+        now = time.monotonic()
+        with self._lock:
+            started = sum(count for second, count in self._recent if second > now - self.window)
+        return started / self.window
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of the dispatch metrics."""
+        return {
+            "max_dispatch_rate": self.rate,
+            "dispatch_rate": round(self.realized_rate(), 3),
+            "dispatched": self.dispatched,
+            "delayed": self.delayed,
+        }
+
+
+# Shared by every engine and queue worker in the process
+dispatcher = DispatchLimiter()
@@ -0,0 +1,267 @@
+"""
+Process-wide DNS cache shared by the checks and the HTTP clients.
+
+The DNS checks, every ``requests``/aiohttp connection and every raw
+``socket.create_connection`` used to resolve the same names independently,
+each with a fresh resolver. ``DnsCache`` answers them all from one shared
+``dns.resolver.Resolver``:
+
+- answers are cached until their TTL expires;
+- NXDOMAIN and empty answers are cached for the zone's negative TTL (the
+  SOA minimum, RFC 2308), or ``negative_ttl`` when the response has no SOA;
+- concurrent lookups of the same name and type share one query;
+- upstream nameservers are configurable;
+- hits, misses and errors are counted for ``/metrics``.
+
+``install()`` routes ``socket.getaddrinfo`` through the cache, which covers
+the HTTP clients and raw sockets. Names only the system resolver knows keep
+using it: IP literals, single-label names (e.g. ``localhost`` or Docker
+service names), /etc/hosts entries and, when resolv.conf has a search list,
+names the upstream resolver says do not exist. Any other NXDOMAIN or empty
+answer, cached or not, fails at once with ``socket.gaierror``, and so does a
+timed-out lookup, without waiting for the system resolver as well.
+"""
+
+import ipaddress
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+import dns.exception
+import dns.rdatatype
+import dns.resolver
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def evict(entries: Dict[Any, tuple], max_entries: int, now: float) -> Dict[Any, tuple]:
+    """
+    Shrink a cache of ``(expires_at, ...)`` entries that reached ``max_entries``.
+
+    Expired entries are dropped first; if that is not enough, those expiring
+    soonest go too, down to three quarters of ``max_entries``, so the next
+    eviction is only needed after many more inserts.
+    """
+    live = {key: entry for key, entry in entries.items() if entry[0] > now}
+    low_water = max_entries * 3 // 4
+    if len(live) > low_water:
+        keep = sorted(live, key=lambda key: live[key][0], reverse=True)[:low_water]
+        live = {key: live[key] for key in keep}
+    return live
+
+
+class DnsCache:
+    """Thread-safe, TTL-respecting cache in front of one shared resolver."""
+
+    def __init__(self, nameservers: Optional[List[str]] = None, timeout: float = 5,
+                 negative_ttl: float = 60, max_ttl: float = 3600):
+        """
+        Args:
+            nameservers: Upstream resolvers; None uses the system configuration.
+            timeout: Lifetime of one lookup in seconds, retries included.
+            negative_ttl: Seconds a negative answer without an SOA record is cached.
+            max_ttl: Longest time any answer is cached.
+        """
+        self._lock = threading.Lock()
+        self._answers: Dict[CacheKey, Tuple[float, Any, Optional[Exception]]] = {}
+        self._inflight: Dict[CacheKey, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.errors = 0
+        self.max_entries = 10000
+        self.configure(nameservers, timeout, negative_ttl, max_ttl)
+
+    def configure(self, nameservers: Optional[List[str]] = None, timeout: float = 5,
+                  negative_ttl: float = 60, max_ttl: float = 3600):
+        resolver = dns.resolver.Resolver()
+        if nameservers:
+            resolver.nameservers = list(nameservers)
+        resolver.timeout = timeout
+        resolver.lifetime = timeout
+        with self._lock:
+            self.resolver = resolver
+            self.timeout = timeout
+            self.negative_ttl = negative_ttl
+            self.max_ttl = max_ttl
+
+    def _negative_expiry(self, error: Exception) -> float:
+        """Expiry of a negative answer: the SOA minimum of the response, if any."""
+        responses = []
+        if isinstance(error, dns.resolver.NXDOMAIN):
+            responses = list(error.responses().values())
+        elif isinstance(error, dns.resolver.NoAnswer) and error.response() is not None:
+            responses = [error.response()]
+        for response in responses:
+            for rrset in response.authority:
+                if rrset.rdtype == dns.rdatatype.SOA:
+                    return time.time() + min(rrset.ttl, rrset[0].minimum, self.max_ttl)
+        return time.time() + self.negative_ttl
+
+    def resolve(self, qname: Any, rdtype: str = 'A', tcp: bool = False,
+                lifetime: Optional[float] = None) -> dns.resolver.Answer:
+        """
+        Return the answer for ``qname``/``rdtype``, from the cache if it is still valid.
+
+        Raises the same exceptions as ``dns.resolver.Resolver.resolve``;
+        NXDOMAIN and NoAnswer are raised from the cache while they are valid.
+        """
+        key = (str(qname).lower().rstrip('.'), str(rdtype).upper())
+        with self._lock:
+            cached = self._answers.get(key)
+            if cached is not None and cached[0] > time.time():
+                if cached[2] is not None:
+                    self.negative_hits += 1
+                    raise cached[2]
+                self.hits += 1
+                return cached[1]
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+            resolver = self.resolver
+        if not owner:
+            return flight.result()
+
+        try:
+            answer = resolver.resolve(key[0], key[1], tcp=tcp, lifetime=lifetime or self.timeout)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            self._store(key, (self._negative_expiry(e), None, e))
+            flight.set_exception(e)
+            raise
+        except Exception as e:
+            # Timeouts and server failures are not cached
+            with self._lock:
+                self.errors += 1
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        self._store(key, (min(answer.expiration, time.time() + self.max_ttl), answer, None))
+        flight.set_result(answer)
+        return answer
+
+    def _store(self, key: CacheKey, entry: Tuple[float, Any, Optional[Exception]]):
+        with self._lock:
+            if len(self._answers) >= self.max_entries:
+                # Enumerating large wordlists caches many one-off names
+                self._answers = evict(self._answers, self.max_entries, time.time())
+            self._answers[key] = entry
+
+    def addresses(self, host: str, family: int = socket.AF_UNSPEC) -> List[Tuple[int, str]]:
+        """
+        Return ``(family, address)`` pairs for ``host``: IPv4 first, then IPv6.
+
+        Raises NXDOMAIN if the name does not exist; a family without records
+        is skipped.
+        """
+        record_types = []
+        if family in (socket.AF_UNSPEC, socket.AF_INET):
+            record_types.append((socket.AF_INET, 'A'))
+        if family in (socket.AF_UNSPEC, socket.AF_INET6):
+            record_types.append((socket.AF_INET6, 'AAAA'))
+        addresses = []
+        for address_family, rdtype in record_types:
+            try:
+                answer = self.resolve(host, rdtype)
+            except dns.resolver.NoAnswer:
+                continue
+            addresses.extend((address_family, rdata.address) for rdata in answer)
+        return addresses
+
+    def clear(self):
+        with self._lock:
+            self._answers.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.negative_hits
+            return {
+                "entries": len(self._answers),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "hit_ratio": round((self.hits + self.negative_hits) / lookups, 3) if lookups else 0.0,
+            }
+
+
+dns_cache = DnsCache()
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.split('%')[0])
+        return True
+    except ValueError:
+        return False
+
+
+HOSTS_FILE = '/etc/hosts'
+_hosts: Tuple[Optional[float], frozenset] = (None, frozenset())
+
+
+def _hosts_names() -> frozenset:
+    """Names listed in the hosts file, re-read when it changes."""
+    global _hosts
+    try:
+        mtime = os.stat(HOSTS_FILE).st_mtime
+    except OSError:
+        return frozenset()
+    if _hosts[0] != mtime:
+        names = set()
+        try:
+            with open(HOSTS_FILE, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    names.update(name.lower().rstrip('.') for name in line.split('#', 1)[0].split()[1:])
+        except OSError:
+            return _hosts[1]
+        _hosts = (mtime, frozenset(names))
+    return _hosts[1]
+
+
+def _getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """``socket.getaddrinfo`` answering hostnames from the shared DNS cache."""
+    if (not isinstance(host, str) or '.' not in host.rstrip('.') or _is_ip(host)
+            or flags & socket.AI_NUMERICHOST or family not in (socket.AF_UNSPEC, socket.AF_INET, socket.AF_INET6)
+            or host.lower().rstrip('.') in _hosts_names()):
+        return _system_getaddrinfo(host, port, family, type, proto, flags)
+    error = (getattr(socket, 'EAI_NODATA', socket.EAI_NONAME), 'No address associated with hostname')
+    try:
+        addresses = dns_cache.addresses(host, family)
+    except dns.resolver.NXDOMAIN:
+        addresses, error = [], (socket.EAI_NONAME, 'Name or service not known')
+    except dns.exception.Timeout:
+        raise socket.gaierror(socket.EAI_AGAIN, 'Temporary failure in name resolution')
+    except dns.exception.DNSException as e:
+        # e.g. every nameserver refused the query: only the system resolver can answer
+        logger.debug(f"DNS cache lookup for {host} failed ({e}); using the system resolver")
+        return _system_getaddrinfo(host, port, family, type, proto, flags)
+    if not addresses:
+        if dns_cache.resolver.search and not host.endswith('.'):
+            # The system resolver may find it under one of the search domains
+            return _system_getaddrinfo(host, port, family, type, proto, flags)
+        raise socket.gaierror(*error)
+    results = []
+    for address_family, address in addresses:
+        results.extend(_system_getaddrinfo(address, port, address_family, type, proto,
+                                           flags | socket.AI_NUMERICHOST))
+    return results
+
+
+def install(enabled: bool = True):
+    """Route ``socket.getaddrinfo`` through the DNS cache (or restore the system resolver)."""
+    socket.getaddrinfo = _getaddrinfo if enabled else _system_getaddrinfo
@@ -0,0 +1,265 @@
+"""
+Asynchronous DNSBL lookups shared by every site of a run.
+
+Checking a site against a DNS blacklist is one A query for the site's
+address, reversed, under the blacklist's zone. The sync check sent them
+through a small thread pool, one resolver per query. ``DnsblClient`` sends
+them all from one UDP socket per event loop and matches the answers to the
+pending queries by their message ID, so the queries of every site in a run
+are in flight at once:
+
+- identical queries (sites behind the same address) are sent only once;
+- answers are cached for their TTL, "not listed" (NXDOMAIN) for the zone's
+  negative TTL;
+- unanswered queries are resent, to the next nameserver, before giving up.
+
+The upstream nameservers and timeout are those of the shared DNS cache.
+Queries go to one nameserver at a time, with one socket per nameserver; a
+timeout moves every later query on to the next one.
+"""
+
+import asyncio
+import ipaddress
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import dns.exception
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.resolver
+
+from core.dns_cache import dns_cache, evict
+
+logger = logging.getLogger(__name__)
+
+
+def reverse_name(address: str, zone: str) -> str:
+    """Return the DNSBL query name of an IPv4 or IPv6 address, e.g. ``4.3.2.1.zen.spamhaus.org``."""
+    pointer = ipaddress.ip_address(address).reverse_pointer
+    # Drop the in-addr.arpa / ip6.arpa suffix (IPv6 addresses become nibbles)
+    return f"{pointer.rsplit('.', 2)[0]}.{zone}"
+
+
+class _DnsProtocol(asyncio.DatagramProtocol):
+    """UDP endpoint routing each response to the query with the same message ID."""
+
+    def __init__(self):
+        self.transport = None
+        self.pending: Dict[int, Tuple[dns.message.Message, asyncio.Future]] = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr):
+        try:
+            response = dns.message.from_wire(data)
+        except dns.exception.DNSException:
+            return
+        query, future = self.pending.get(response.id, (None, None))
+        if future is not None and not future.done() and query.is_response(response):
+            future.set_result(response)
+
+    def error_received(self, exc: Exception):
+        logger.debug(f"DNSBL socket error: {exc}")
+
+    def connection_lost(self, exc: Optional[Exception]):
+        for _, future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc or ConnectionError("DNSBL socket closed"))
+        self.pending.clear()
+
+
+class DnsblClient:
+    """DNSBL query multiplexer bound to one event loop."""
+
+    def __init__(self, nameservers: List[str], timeout: float = 5, attempts: int = 2,
+                 negative_ttl: float = 60):
+        """
+        Args:
+            nameservers: Resolvers the queries are sent to, the first one first.
+            timeout: Seconds to wait for one query, resends included.
+            attempts: Times an unanswered query is sent.
+            negative_ttl: Seconds a "not listed" answer without an SOA record is cached.
+        """
+        self.nameservers = list(nameservers)
+        self.timeout = timeout
+        self.attempts = max(1, attempts)
+        self.negative_ttl = negative_ttl
+        self.loop = asyncio.get_running_loop()
+        self._current = 0  # index of the nameserver queries are sent to
+        self._protocols: Dict[str, _DnsProtocol] = {}
+        self._connecting: Dict[str, asyncio.Future] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def _endpoint(self, nameserver: str) -> _DnsProtocol:
+        protocol = self._protocols.get(nameserver)
+        if protocol is not None and not protocol.transport.is_closing():
+            return protocol
+        connecting = self._connecting.get(nameserver)
+        if connecting is None:
+            connecting = self._connecting[nameserver] = self.loop.create_task(
+                self.loop.create_datagram_endpoint(_DnsProtocol, remote_addr=(nameserver, 53)))
+        try:
+            _, self._protocols[nameserver] = await asyncio.shield(connecting)
+        finally:
+            self._connecting.pop(nameserver, None)
+        return self._protocols[nameserver]
+
+    def _rotate(self, index: int):
+        """Move on from the nameserver at ``index`` unless a concurrent timeout already did."""
+        if self._current == index:
+            self._current = (index + 1) % len(self.nameservers)
+
+    async def _exchange(self, qname: str) -> dns.message.Message:
+        """Send an A query for ``qname`` and return the response, resending it on silence."""
+        future = self.loop.create_future()
+        sent: List[Tuple[_DnsProtocol, int]] = []
+        try:
+            for attempt in range(self.attempts):
+                index = self._current
+                protocol = await self._endpoint(self.nameservers[index])
+                # A fresh ID per send: an answer to an earlier send still completes the query
+                query = dns.message.make_query(qname, dns.rdatatype.A)
+                while query.id in protocol.pending:
+                    query.id = random.randint(0, 0xFFFF)
+                protocol.pending[query.id] = (query, future)
+                sent.append((protocol, query.id))
+                _stats.count('sent')
+                protocol.transport.sendto(query.to_wire())
+                try:
+                    return await asyncio.wait_for(asyncio.shield(future), self.timeout / self.attempts)
+                except asyncio.TimeoutError:
+                    self._rotate(index)
+            _stats.count('timeouts')
+            raise dns.exception.Timeout(timeout=self.timeout)
+        finally:
+            for protocol, query_id in sent:
+                protocol.pending.pop(query_id, None)
+
+    def _negative_ttl(self, response: dns.message.Message) -> float:
+        for rrset in response.authority:
+            if rrset.rdtype == dns.rdatatype.SOA:
+                return min(rrset.ttl, rrset[0].minimum)
+        return self.negative_ttl
+
+    async def _lookup(self, qname: str) -> List[str]:
+        response = await self._exchange(qname)
+        rcode = response.rcode()
+        if rcode == dns.rcode.NXDOMAIN:
+            _results.store(qname, [], self._negative_ttl(response))
+            return []
+        if rcode != dns.rcode.NOERROR:
+            raise dns.exception.DNSException(f"{dns.rcode.to_text(rcode)} for {qname}")
+        codes, ttl = [], None
+        for rrset in response.answer:
+            if rrset.rdtype == dns.rdatatype.A:
+                codes.extend(rdata.address for rdata in rrset)
+                ttl = rrset.ttl if ttl is None else min(ttl, rrset.ttl)
+        if not codes:
+            # The name exists without an A record: not a "not listed" answer
+            raise dns.resolver.NoAnswer(response=response)
+        _results.store(qname, codes, ttl)
+        return codes
+
+    async def query(self, address: str, zone: str) -> List[str]:
+        """
+        Return the return codes (e.g. ``127.0.0.2``) of ``address`` in ``zone``; empty if not listed.
+
+        Raises ``dns.exception.DNSException`` when the zone gave no usable answer.
+        """
+        qname = reverse_name(address, zone)
+        cached = _results.get(qname)
+        if cached is not None:
+            _stats.count('cache_hits')
+            return cached
+        flight = self._inflight.get(qname)
+        if flight is not None:
+            _stats.count('coalesced')
+            return await asyncio.shield(flight)
+        flight = self._inflight[qname] = self.loop.create_task(self._lookup(qname))
+        flight.add_done_callback(lambda task: self._landed(qname, task))
+        return await asyncio.shield(flight)
+
+    def _landed(self, qname: str, task: asyncio.Task):
+        self._inflight.pop(qname, None)
+        if not task.cancelled():
+            task.exception()  # retrieved even if every waiter was cancelled
+
+    async def close(self):
+        for protocol in self._protocols.values():
+            protocol.transport.close()
+        self._protocols.clear()
+
+
+class _ResultCache:
+    """Return codes per query name until their TTL runs out, shared across event loops."""
+
+    def __init__(self, max_entries: int = 10000):
+        self._entries: Dict[str, Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def get(self, qname: str) -> Optional[List[str]]:
+        with self._lock:
+            entry = self._entries.get(qname)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+    def store(self, qname: str, codes: List[str], ttl: float):
+        now = time.time()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # As in the DNS cache: a long-running process checks many one-off addresses
+                self._entries = evict(self._entries, self.max_entries, now)
+            self._entries[qname] = (now + min(ttl, dns_cache.max_ttl), codes)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _Stats:
+    def __init__(self):
+        self._counts = {'sent': 0, 'cache_hits': 0, 'coalesced': 0, 'timeouts': 0}
+        self._lock = threading.Lock()
+
+    def count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._counts, cached=len(_results))
+
+
+_results = _ResultCache()
+_stats = _Stats()
+_client: Optional[DnsblClient] = None
+
+
+def get_client() -> DnsblClient:
+    """Return the client bound to the running event loop, creating it if needed."""
+    global _client
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.loop is not loop:
+        nameservers = [str(nameserver) for nameserver in dns_cache.resolver.nameservers]
+        _client = DnsblClient(nameservers, timeout=dns_cache.timeout,
+                              negative_ttl=dns_cache.negative_ttl)
+    return _client
+
+
+async def close_client():
+    """Close the shared client's socket if it was created."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+def metrics() -> Dict[str, Any]:
+    """Return the DNSBL query counters: queries sent, cache hits, coalesced queries and timeouts."""
+    return _stats.snapshot()
@@ -0,0 +1,56 @@
+"""
+Parse-once DOM cache for BeautifulSoup-based checks.
+
+The parsed tree is attached to the response object itself, so every check
+that receives the shared response from ``fetch_page()`` also shares one
+parse. The tree is built with lxml when available (falling back to
+html.parser) and must be treated as read-only by the checks.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, List
+
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.element import Tag
+
+_INDEXED_TAGS = ('a', 'script', 'link', 'img', 'meta')
+
+
+def parse_html(markup) -> BeautifulSoup:
+    """Parse markup with lxml, falling back to the built-in html.parser."""
+    try:
+        return BeautifulSoup(markup, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser')
+
+
+class ParsedDocument:
+    """A parsed HTML page with precomputed tag indexes."""
+
+    def __init__(self, markup):
+        self.soup = parse_html(markup)
+        tags: Dict[str, List[Tag]] = defaultdict(list)
+        # One pass over the tree instead of a find_all() per check
+        for tag in self.soup.find_all(_INDEXED_TAGS):
+            tags[tag.name].append(tag)
+        self.links = [tag for tag in tags['a'] if tag.has_attr('href')]
+        self.scripts = tags['script']
+        self.script_sources = [tag for tag in self.scripts if tag.has_attr('src')]
+        self.link_tags = tags['link']
+        self.images = tags['img']
+        self.meta = tags['meta']
+
+
+def get_document(response) -> ParsedDocument:
+    """Return the parsed document for a response, parsing it on first use."""
+    document = response.__dict__.get('_parsed_document')
+    if document is not None:
+        return document
+    lock = response.__dict__.setdefault('_parse_lock', threading.Lock())
+    with lock:
+        document = response.__dict__.get('_parsed_document')
+        if document is None:
+            document = ParsedDocument(response.content)
+            response.__dict__['_parsed_document'] = document
+    return document
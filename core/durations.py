@@ -0,0 +1,105 @@
+"""
+Per-check duration history used to schedule long checks first.
+
+A parallel run ends when its slowest chain of work ends, so starting a
+60-second check last leaves every worker but one idle at the tail. The
+engine records how long each check takes (an exponentially weighted mean
+per check name) and dispatches checks longest-expected-first. Checks never
+seen before fall back to the static ``cost`` hint declared on the Check.
+"""
+
+import json
+import logging
+import os
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Expected duration, in seconds, of a check with no history and no hint
+DEFAULT_COST = 1.0
+
+
+class DurationHistory:
+    """Exponentially weighted mean duration per check, optionally persisted as JSON."""
+
+    def __init__(self, path: Optional[str] = None, alpha: float = 0.3):
+        """
+        Args:
+            path: JSON file the history is loaded from and saved to; None keeps it in memory.
+            alpha: Weight of the newest sample in the running mean.
+        """
+        self.path = path
+        self.alpha = alpha
+        self._stats: Dict[str, Dict[str, float]] = {}
+        # Checks timed since the file was last read
+        self._recorded: Set[str] = set()
+        self.load()
+
+    def expected(self, check_name: str, hint: Optional[float] = None) -> float:
+        """Return the expected duration of a check in seconds."""
+        stats = self._stats.get(check_name)
+        if stats:
+            return stats['mean']
+        return hint if hint is not None else DEFAULT_COST
+
+    def record(self, check_name: str, duration: float):
+        """Fold one observed duration into the running mean."""
+        stats = self._stats.get(check_name)
+        if stats is None:
+            self._stats[check_name] = {'mean': duration, 'count': 1}
+        else:
+            stats['mean'] += self.alpha * (duration - stats['mean'])
+            stats['count'] += 1
+        self._recorded.add(check_name)
+
+    def _read(self) -> Dict[str, Dict[str, float]]:
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            self._stats = self._read()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable duration history {self.path}: {e}")
+            self._stats = {}
+
+    def save(self):
+        """Write the history, keeping the checks other processes (e.g. shards) saved meanwhile."""
+        if not self.path:
+            return
+        try:
+            on_disk = self._read() if os.path.exists(self.path) else {}
+        except (OSError, ValueError):
+            on_disk = {}
+        for check_name, stats in on_disk.items():
+            if check_name not in self._recorded:
+                self._stats[check_name] = stats
+        self._recorded.clear()
+        try:
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self._stats, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save duration history to {self.path}: {e}")
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+
+_history: Optional[DurationHistory] = None
+
+
+def get_history(path: Optional[str] = None) -> DurationHistory:
+    """
+    Return the process-wide history, loading it from ``path`` on first use.
+
+    Concurrent runs (e.g. API requests) share one history so they do not
+    overwrite each other's samples.
+    """
+    global _history
+    if _history is None:
+        _history = DurationHistory(path)
+    return _history
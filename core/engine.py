@@ -0,0 +1,334 @@
+"""
+Concurrent execution engine for website checks.
+
+Fans the full check x website matrix out as asyncio tasks, bounded by a
+global concurrency limit and a per-site limit so a single host is never
+hammered by every check at once. Outcomes can be consumed as they
+complete (``stream``) or collected into the report matrix (``run``).
+
+Every result is written to the result store. With ``config.incremental``
+set, pairs whose stored result is younger than their check's ``ttl`` are
+not executed again; the stored result is reported with its age.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from core import async_http
+from core.circuit_breaker import UNREACHABLE, breaker, endpoint_of, host_of, probe_host
+from core.dispatch import dispatcher
+from core.durations import DurationHistory
+from core.page_cache import page_cache
+from core.result_store import ResultStore
+from core.timeouts import AdaptiveTimeouts
+from core.tls_probe import tls_probe
+
+logger = logging.getLogger(__name__)
+
+# Result reported for checks that did not run before the run deadline
+NOT_RUN = "⏳"
+
+
+@dataclass
+class RunStats:
+    """Timing statistics for a single engine run."""
+    wall_clock: float = 0.0
+    total_check_time: float = 0.0
+    tasks: int = 0
+    unreachable: int = 0
+    not_run: int = 0
+    cached: int = 0
+    deadline_exceeded: bool = False
+
+    @property
+    def speedup(self) -> float:
+        """Ratio of summed check time to elapsed wall-clock time."""
+        if not self.wall_clock:
+            return 0.0
+        return self.total_check_time / self.wall_clock
+
+    @property
+    def dispatch_rate(self) -> float:
+        """Checks started per second of wall-clock time."""
+        if not self.wall_clock:
+            return 0.0
+        return self.tasks / self.wall_clock
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dictionary."""
+        return {
+            "wall_clock": round(self.wall_clock, 3),
+            "total_check_time": round(self.total_check_time, 3),
+            "tasks": self.tasks,
+            "unreachable": self.unreachable,
+            "not_run": self.not_run,
+            "cached": self.cached,
+            "deadline_exceeded": self.deadline_exceeded,
+            "speedup": round(self.speedup, 2),
+            "dispatch_rate": round(self.dispatch_rate, 2),
+        }
+
+
+@dataclass
+class CheckOutcome:
+    """Result of one check against one website."""
+    check: str
+    website: str
+    result: str
+    duration: float
+    check_index: int
+    site_index: int
+    # Seconds since a cached result was computed; None if the check ran now
+    age: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the outcome as a plain dictionary."""
+        return {
+            "check_name": self.check,
+            "website": self.website,
+            "result": self.result,
+            "duration": round(self.duration, 3),
+            "age": None if self.age is None else round(self.age, 1),
+        }
+
+
+class ExecutionEngine:
+    """Runs every enabled check against every website concurrently."""
+
+    def __init__(self, max_workers: int = 4, max_workers_per_site: int = 2, preflight_timeout: float = 5,
+                 history: Optional[DurationHistory] = None, store: Optional[ResultStore] = None,
+                 timeouts: Optional[AdaptiveTimeouts] = None):
+        """
+        Args:
+            max_workers: Checks running at once across all sites.
+            max_workers_per_site: Checks running at once against one site.
+            preflight_timeout: Connect timeout of the per-site reachability
+                probe run before the first site-bound check; 0 disables it.
+            history: Duration history used to start the longest checks first.
+            store: Last result of every pair, used by incremental runs.
+            timeouts: Latency history the per-pair timeouts are learned from;
+                None runs every check with its configured timeout.
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_workers_per_site = max(1, min(max_workers_per_site, self.max_workers))
+        self.preflight_timeout = preflight_timeout
+        self.history = history or DurationHistory()
+        self.store = store or ResultStore()
+        self.timeouts = timeouts
+        self.stats = RunStats()
+        # Age in seconds of the cached results of the last run, by (website, check)
+        self.ages: Dict[Tuple[str, str], float] = {}
+
+    def schedule(self, checks: List[Any]) -> List[int]:
+        """Return the check indexes ordered longest-expected-first."""
+        return sorted(
+            range(len(checks)),
+            key=lambda index: self.history.expected(checks[index].name, getattr(checks[index], 'cost', None)),
+            reverse=True,
+        )
+
+    async def run(self, checks: List[Any], websites: List[str], config: Any) -> List[Tuple[str, List[str]]]:
+        """
+        Execute all checks against all websites.
+
+        Args:
+            checks: Check objects exposing ``name`` and ``execute()``.
+            websites: Websites to check.
+            config: Run configuration passed through to each check.
+
+        Returns:
+            List of ``(check_name, results)`` tuples where ``results`` is
+            ordered like ``websites``, as expected by ``generate_report``.
+        """
+        results: Dict[Tuple[int, int], str] = {}
+        async for outcome in self.stream(checks, websites, config):
+            results[(outcome.check_index, outcome.site_index)] = outcome.result
+
+        return [
+            (check.name, [results[(check_index, site_index)] for site_index in range(len(websites))])
+            for check_index, check in enumerate(checks)
+        ]
+
+    async def stream(self, checks: List[Any], websites: List[str], config: Any,
+                     cells: Optional[Iterable[Tuple[int, int]]] = None) -> AsyncIterator[CheckOutcome]:
+        """
+        Execute all checks against all websites, yielding each outcome as it completes.
+
+        ``cells`` restricts the run to those ``(check_index, site_index)``
+        pairs, e.g. the ones a schedule says are due; by default every check
+        runs against every website.
+
+        Only a bounded window of checks is scheduled at any time, so memory
+        does not grow with the size of the batch. Closing the iterator early
+        cancels the checks still in flight.
+
+        If ``config.run_deadline`` (seconds) is set, each check's timeout is
+        capped by the remaining budget. When the budget runs out the checks
+        still in flight are cancelled, and every check that did not complete
+        is yielded as ``NOT_RUN``, so callers always get a full matrix.
+        """
+        global_limit = asyncio.Semaphore(self.max_workers)
+        site_limits = {website: asyncio.Semaphore(self.max_workers_per_site) for website in websites}
+        window = self.max_workers * 4
+        preflights: Dict[str, asyncio.Future] = {}
+        self.stats = RunStats()
+        self.ages = {}
+        incremental = getattr(config, 'incremental', False)
+        budget = getattr(config, 'run_deadline', None)
+        started = time.perf_counter()
+        deadline = started + budget if budget else None
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else deadline - time.perf_counter()
+
+        def not_run(check_index: int, site_index: int) -> CheckOutcome:
+            self.stats.not_run += 1
+            return CheckOutcome(checks[check_index].name, websites[site_index], NOT_RUN, 0.0, check_index, site_index)
+
+        def cached(check_index: int, site_index: int) -> Optional[CheckOutcome]:
+            if not incremental:
+                return None
+            check = checks[check_index]
+            website = websites[site_index]
+            entry = self.store.fresh(website, check.name, getattr(check, 'ttl', None))
+            if entry is None:
+                return None
+            result, checked_at = entry
+            age = max(0.0, time.time() - checked_at)
+            self.stats.cached += 1
+            self.ages[(website, check.name)] = age
+            return CheckOutcome(check.name, website, result, 0.0, check_index, site_index, age=age)
+
+        async def preflight(website: str):
+            host = host_of(website)
+            try:
+                reason = await probe_host(host, timeout=self.preflight_timeout)
+            except Exception as e:
+                # Let the checks themselves decide
+                logger.debug(f"Pre-flight for {host} could not run: {e}")
+                return
+            if reason:
+                breaker.trip(endpoint_of(website), f"pre-flight failed: {reason}")
+
+        async def reachable(website: str, endpoint: str) -> bool:
+            if self.preflight_timeout and host_of(website) and endpoint not in preflights:
+                preflights[endpoint] = asyncio.ensure_future(preflight(website))
+            if endpoint in preflights:
+                # Shielded: a cancelled check must not cancel the probe other checks wait on
+                await asyncio.shield(preflights[endpoint])
+            return not breaker.is_open(endpoint)
+
+        def unreachable(check: Any, website: str, check_index: int, site_index: int) -> CheckOutcome:
+            self.stats.unreachable += 1
+            logger.debug(f"Check {check.name} for {website} skipped: host unreachable")
+            return CheckOutcome(check.name, website, UNREACHABLE, 0.0, check_index, site_index)
+
+        async def run_one(check_index: int, site_index: int) -> CheckOutcome:
+            check = checks[check_index]
+            website = websites[site_index]
+            # DNS/WHOIS style checks do not talk to the host and always run
+            site_bound = getattr(check, 'site_bound', True)
+            endpoint = endpoint_of(website)
+            if site_bound and not await reachable(website, endpoint):
+                return unreachable(check, website, check_index, site_index)
+            async with site_limits[website]:
+                async with global_limit:
+                    if site_bound and breaker.is_open(endpoint):
+                        return unreachable(check, website, check_index, site_index)
+                    # Spaces check starts to config.max_dispatch_rate
+                    await dispatcher.acquire()
+                    budget_left = remaining()
+                    if budget_left is not None and budget_left <= 0:
+                        return not_run(check_index, site_index)
+                    timeout = getattr(check, 'timeout', None) or config.timeout
+                    if self.timeouts is not None:
+                        timeout = self.timeouts.timeout_for(website, check.name, timeout)
+                    check_started = time.perf_counter()
+                    result = await check.execute(website, config, config.timeout, budget=budget_left,
+                                                 timeout=timeout)
+                    duration = time.perf_counter() - check_started
+            if result == NOT_RUN:
+                self.stats.not_run += 1
+                return CheckOutcome(check.name, website, result, duration, check_index, site_index)
+            if site_bound and result == "⚪" and breaker.is_open(endpoint):
+                # The host went down while the check was running
+                result = UNREACHABLE
+            if result != UNREACHABLE:
+                self.history.record(check.name, duration)
+            if self.timeouts is not None and result not in (UNREACHABLE, "⚪") and duration < timeout:
+                self.timeouts.record(website, check.name, duration)
+            if result not in (UNREACHABLE, "⚪"):
+                # Errors are not stored, so an incremental run retries them
+                self.store.record(website, check.name, result)
+            self.stats.total_check_time += duration
+            self.stats.tasks += 1
+            logger.debug(f"Check {check.name} for {website} finished in {duration:.2f}s")
+            return CheckOutcome(check.name, website, result, duration, check_index, site_index)
+
+        # Longest checks start first so no straggler is left for the tail of the
+        # run; sites vary fastest so the first wave of work is spread across hosts.
+        order = self.schedule(checks)
+        if cells is None:
+            cells = ((check_index, site_index) for check_index in order for site_index in range(len(websites)))
+        else:
+            rank = {check_index: position for position, check_index in enumerate(order)}
+            cells = sorted(cells, key=lambda cell: (rank[cell[0]], cell[1]))
+        cell_iter = iter(cells)
+        cell_of: Dict[asyncio.Future, Tuple[int, int]] = {}
+        pending = set()
+        exhausted = False
+        # Checks share one homepage fetch and one TLS handshake per site for the duration of the run.
+        with page_cache.run_scope(), async_http.pages.run_scope(), tls_probe.run_scope():
+            try:
+                while True:
+                    while not exhausted and len(pending) < window:
+                        cell = next(cell_iter, None)
+                        if cell is None:
+                            exhausted = True
+                            break
+                        hit = cached(*cell)
+                        if hit is not None:
+                            yield hit
+                            continue
+                        task = asyncio.ensure_future(run_one(*cell))
+                        cell_of[task] = cell
+                        pending.add(task)
+                    if not pending:
+                        break
+                    budget_left = remaining()
+                    if budget_left is not None and budget_left <= 0:
+                        break
+                    done, pending = await asyncio.wait(pending, timeout=budget_left,
+                                                       return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        del cell_of[task]
+                        yield task.result()
+
+                if pending or not exhausted:
+                    self.stats.deadline_exceeded = True
+                    logger.warning(f"Run deadline of {budget}s reached; cancelling {len(pending)} scheduled checks")
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    cancelled, pending = pending, set()
+                    for task in cancelled:
+                        if task.cancelled() or task.exception() is not None:
+                            yield not_run(*cell_of[task])
+                        else:
+                            yield task.result()
+                    for cell in cell_iter:
+                        yield cached(*cell) or not_run(*cell)
+            finally:
+                leftovers = pending | {probe for probe in preflights.values() if not probe.done()}
+                for task in leftovers:
+                    task.cancel()
+                if leftovers:
+                    await asyncio.gather(*leftovers, return_exceptions=True)
+                self.history.save()
+                self.store.save()
+                if self.timeouts is not None:
+                    self.timeouts.save()
+                self.stats.wall_clock = time.perf_counter() - started
@@ -0,0 +1,189 @@
+"""
+Managed thread pool for synchronous checks.
+
+Nearly every module in checks/ is blocking (requests, socket, whois,
+dnspython), so calling them directly inside a coroutine freezes the event
+loop. All sync checks are dispatched through a single bounded pool which
+also keeps track of queue depth and worker activity.
+
+Threads cannot be killed, so a sync check that overruns its deadline keeps
+its worker busy until it returns on its own. Hang-prone checks (Selenium,
+WHOIS) can instead be run isolated in a child process that is killed when
+the deadline passes.
+"""
+
+import asyncio
+import contextvars
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 8
+
+
+class CheckExecutor:
+    """Bounded thread pool with queue and activity metrics."""
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="check-worker")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.abandoned = 0
+        self.killed = 0
+        self.peak_queue_depth = 0
+
+    async def run(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run a blocking callable in the pool and await its result.
+
+        The caller's context variables are propagated to the worker thread.
+        When ``timeout`` is given, ``asyncio.TimeoutError`` is raised once it
+        elapses (time spent queued counts towards it); a job that had not
+        started yet is dropped, one that had is left to finish in the
+        background and counted as abandoned.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        started = threading.Event()
+        finished = threading.Event()
+
+        def call():
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+                started.set()
+            try:
+                return context.run(func, *args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+                    finished.set()
+
+        with self._lock:
+            self.queued += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, self.queued)
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(self._pool, call), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if finished.is_set():
+                    # Raised by the callable itself (e.g. an isolated check), already counted.
+                    raise
+                self.timed_out += 1
+                if started.is_set():
+                    self.abandoned += 1
+                else:
+                    self.queued -= 1
+            raise
+        except asyncio.CancelledError:
+            # A job cancelled before a worker picked it up never leaves the queue on its own.
+            with self._lock:
+                if not started.is_set():
+                    self.queued -= 1
+            raise
+
+    async def run_isolated(self, func: Callable, *args, timeout: float, **kwargs) -> Any:
+        """
+        Run a picklable, module-level callable in a dedicated child process.
+
+        The child is killed if it has not answered within ``timeout`` seconds,
+        in which case ``asyncio.TimeoutError`` is raised.
+        """
+        return await self.run(self._run_in_process, func, args, kwargs, timeout)
+
+    def _run_in_process(self, func: Callable, args: tuple, kwargs: dict, timeout: float) -> Any:
+        """Blocking helper that supervises one child process (runs in the pool)."""
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_process_entry, args=(sender, func, args, kwargs), daemon=True)
+        process.start()
+        sender.close()
+        try:
+            if not receiver.poll(timeout):
+                with self._lock:
+                    self.timed_out += 1
+                    self.killed += 1
+                raise asyncio.TimeoutError(f"{getattr(func, '__name__', func)} exceeded {timeout}s in isolated process")
+            succeeded, payload = receiver.recv()
+        except EOFError:
+            process.join(timeout=1)
+            raise RuntimeError(f"Isolated process for {getattr(func, '__name__', func)} exited with code {process.exitcode}")
+        finally:
+            if process.is_alive():
+                process.kill()
+            process.join()
+            receiver.close()
+        if not succeeded:
+            raise RuntimeError(payload)
+        return payload
+
+    def metrics(self) -> Dict[str, int]:
+        """Return a snapshot of the pool metrics."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self.queued,
+                "active_workers": self.active,
+                "completed": self.completed,
+                "failed": self.failed,
+                "timed_out": self.timed_out,
+                "abandoned": self.abandoned,
+                "killed": self.killed,
+                "peak_queue_depth": self.peak_queue_depth,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and release the worker threads."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _process_entry(sender, func: Callable, args: tuple, kwargs: dict):
+    """Child process entry point: run the check and send back its outcome."""
+    try:
+        sender.send((True, func(*args, **kwargs)))
+    except Exception as e:
+        sender.send((False, f"{type(e).__name__}: {e}"))
+    finally:
+        sender.close()
+
+
+_executor: Optional[CheckExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(max_workers: Optional[int] = None) -> CheckExecutor:
+    """
+    Return the process-wide check executor, creating it on first use.
+
+    ``max_workers`` only takes effect when the executor is created; later
+    callers share the existing pool.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = CheckExecutor(max_workers or DEFAULT_WORKERS)
+            logger.info(f"Check executor started with {_executor.max_workers} workers")
+        return _executor
+
+
+def shutdown_executor(wait: bool = True):
+    """Shut down the process-wide executor if it was started."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
@@ -0,0 +1,209 @@
+"""
+Shared, connection-pooled HTTP client for the checks.
+
+Module-level ``requests.get`` opens a fresh TCP + TLS connection for every
+call. Routing checks through one pooled ``requests.Session`` keeps
+connections alive between checks hitting the same origin, with a bounded
+pool per host, the retry and hedging policy of ``core.retry`` for
+idempotent requests and consistent default headers and timeouts.
+
+Usage mirrors ``requests``::
+
+    from core import http_client
+    response = http_client.get(url, timeout=10)
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.circuit_breaker import breaker, endpoint_of, host_of
+from core.retry import RETRY_STATUSES, policy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+DEFAULT_TIMEOUT = 15
+
+
+class HostUnreachableError(requests.exceptions.ConnectionError):
+    """Raised without sending the request when the host's circuit is open."""
+
+
+def _close_response(future):
+    """Release the connection of the hedged request that lost the race."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class HttpClient:
+    """Thread-safe wrapper around a pooled ``requests.Session``."""
+
+    def __init__(self, pool_connections: int = 100, pool_maxsize: int = 4, timeout: float = DEFAULT_TIMEOUT,
+                 headers: Optional[Dict[str, str]] = None, hedge_workers: int = 32):
+        """
+        Args:
+            pool_connections: Number of per-host connection pools kept alive.
+            pool_maxsize: Maximum connections kept open to a single host.
+            timeout: Default request timeout in seconds.
+            headers: Default headers sent with every request.
+            hedge_workers: Threads sending the requests that may be hedged.
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        # Checks inspect Set-Cookie on each response; never replay cookies between checks or sites
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        # Retries are handled by request() so the sync and async clients share one policy
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.hedge_workers = hedge_workers
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._hedge_pool_lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the shared session, applying the default timeout.
+
+        Idempotent requests are retried with backoff on connection errors and
+        502/503/504, and hedged if enabled (see ``core.retry``); pass
+        ``retry=False`` to send exactly one request, neither retried nor hedged
+        (e.g. the probes of the rate-limiting check). Requests to an endpoint
+        (scheme, host and port) whose circuit is open fail fast with
+        ``HostUnreachableError``; connection failures count towards opening it.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        host = host_of(url)
+        endpoint = endpoint_of(url)
+        retry = kwargs.pop('retry', True)
+        attempts = policy.attempts(method) if retry else 1
+        for attempt in range(attempts):
+            if breaker.is_open(endpoint):
+                raise HostUnreachableError(f"{endpoint} is unreachable (circuit open)")
+            try:
+                response = self._send(method, url, host, retry, **kwargs)
+            except requests.exceptions.SSLError:
+                # The host answered; a bad certificate is a result, not an outage
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.ConnectTimeout) as e:
+                breaker.record_failure(endpoint, str(e))
+                if attempt + 1 >= attempts:
+                    raise
+                logger.debug(f"Retrying {method} {url} after {type(e).__name__}")
+                time.sleep(policy.backoff(attempt))
+                continue
+            breaker.record_success(endpoint)
+            if response.status_code in RETRY_STATUSES and attempt + 1 < attempts:
+                logger.debug(f"Retrying {method} {url} after HTTP {response.status_code}")
+                delay = policy.backoff(attempt, response.headers.get('Retry-After'))
+                response.close()
+                time.sleep(delay)
+                continue
+            return response
+
+    def _send(self, method: str, url: str, host: str, hedge: bool, **kwargs: Any) -> requests.Response:
+        """Send one attempt, hedged if allowed and the policy says so, and record its latency."""
+        started = time.perf_counter()
+        delay = policy.hedge_delay(method, host) if hedge and not kwargs.get('stream') else None
+        if delay is None:
+            response = self.session.request(method, url, **kwargs)
+        else:
+            response = self._hedged(delay, method, url, **kwargs)
+        policy.record_latency(host, time.perf_counter() - started)
+        return response
+
+    def _hedged(self, delay: float, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send the request, and a second copy if it has not answered after ``delay`` seconds."""
+        with self._hedge_pool_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=self.hedge_workers, thread_name_prefix='http-hedge')
+        primary = self._hedge_pool.submit(self.session.request, method, url, **kwargs)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        policy.record_hedge()
+        backup = self._hedge_pool.submit(self.session.request, method, url, **kwargs)
+        done, _ = wait((primary, backup), return_when=FIRST_COMPLETED)
+        winner = primary if primary in done else backup
+        loser = backup if winner is primary else primary
+        if winner.exception() is not None:
+            # The first to finish failed: the other one may still succeed
+            winner, loser = loser, winner
+            if winner.exception() is not None:
+                raise loser.exception()
+        else:
+            loser.add_done_callback(_close_response)
+        if winner is backup:
+            policy.record_hedge(won=True)
+        return winner.result()
+
+    def close(self):
+        """Close every pooled connection."""
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client(**settings: Any) -> HttpClient:
+    """
+    Return the shared client, creating it on first use.
+
+    ``settings`` (see ``HttpClient``) only take effect when the client is
+    created; later callers share the existing pools.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(**settings)
+        return _client
+
+
+def close_client():
+    """Close the shared client's connections if it was created."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send a request with the shared client."""
+    return get_client().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """Send a GET request with the shared client."""
+    return request('GET', url, **kwargs)
+
+
+def head(url: str, **kwargs: Any) -> requests.Response:
+    """Send a HEAD request with the shared client."""
+    kwargs.setdefault('allow_redirects', False)
+    return request('HEAD', url, **kwargs)
+
+
+def options(url: str, **kwargs: Any) -> requests.Response:
+    """Send an OPTIONS request with the shared client."""
+    return request('OPTIONS', url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    """Send a POST request with the shared client."""
+    return request('POST', url, **kwargs)
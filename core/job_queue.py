@@ -0,0 +1,348 @@
+"""
+Durable (site, check) job queue for the scheduler's worker mode.
+
+A run is enqueued as one job per website and check. Worker processes claim
+jobs with a visibility timeout (a lease): a job whose worker crashes or
+hangs becomes claimable again once its lease expires, so a run survives the
+loss of any worker. Failed attempts are retried with exponential backoff up
+to a maximum number of attempts.
+
+Two backends share the ``JobQueue`` interface:
+
+- ``SQLiteJobQueue`` (default, ``sqlite:///path``): a single file, no
+  extra services, safe for several worker processes on one machine.
+- ``RedisJobQueue`` (``redis://host:port/db``): for workers on several
+  machines, e.g. with the ``redis`` service of docker-compose's
+  production profile. Needs the optional ``redis`` package.
+
+Results are stored as JSON, so checks returning more than a status (e.g.
+a ``(status, details)`` tuple) come back as they were returned.
+
+Use ``open_queue(url)`` to get the backend for a URL.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+
+def encode_result(result: Any) -> str:
+    """Serialize a check result for storage."""
+    return json.dumps(result, ensure_ascii=False)
+
+
+def decode_result(data: Optional[str]) -> Any:
+    """Restore a result stored by ``encode_result``; JSON arrays become tuples again."""
+    if data is None:
+        return None
+    try:
+        result = json.loads(data)
+    except ValueError:
+        return data  # Stored before results were serialized
+    return tuple(result) if isinstance(result, list) else result
+
+
+@dataclass
+class Job:
+    """One check to run against one website."""
+    id: str
+    run_id: str
+    website: str
+    check: str
+    attempts: int = 0
+
+
+class JobQueue:
+    """Interface shared by the queue backends."""
+
+    def enqueue(self, run_id: str, jobs: List[Tuple[str, str]]):
+        """Add one job per ``(website, check)`` pair to run ``run_id``."""
+        raise NotImplementedError
+
+    def claim(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        """Lease the next available job for ``visibility_timeout`` seconds, or return None."""
+        raise NotImplementedError
+
+    def ack(self, job: Job, result: Any):
+        """Record the result of a claimed job and remove it from the queue."""
+        raise NotImplementedError
+
+    def fail(self, job: Job, error: str, result: Any, max_attempts: int, retry_delay: float) -> bool:
+        """
+        Record a failed attempt.
+
+        The job is retried after ``retry_delay * 2 ** (attempts - 1)`` seconds
+        while it has attempts left; otherwise ``result`` becomes its final
+        result. Returns True if the job will be retried.
+        """
+        raise NotImplementedError
+
+    def results(self, run_id: str) -> Dict[Tuple[str, str], Any]:
+        """Return the final results of run ``run_id`` keyed by ``(website, check)``."""
+        raise NotImplementedError
+
+    def counts(self, run_id: str) -> Dict[str, int]:
+        """Return the number of jobs of run ``run_id`` in each state."""
+        raise NotImplementedError
+
+    def purge(self, keep_run_id: Optional[str] = None):
+        """Delete every job except those of ``keep_run_id``."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SQLiteJobQueue(JobQueue):
+    """Job queue stored in a SQLite database file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        # One connection per queue object, shared by the threads of one process
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    run_id TEXT NOT NULL,
+                    website TEXT NOT NULL,
+                    check_name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    available_at REAL NOT NULL,
+                    lease_expires REAL,
+                    worker TEXT,
+                    result TEXT,
+                    error TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, available_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_run ON jobs (run_id, status)")
+
+    def enqueue(self, run_id, jobs):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO jobs (id, run_id, website, check_name, status, available_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(uuid.uuid4().hex, run_id, website, check, QUEUED, now) for website, check in jobs],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def claim(self, worker_id, visibility_timeout):
+        now = time.time()
+        with self._lock:
+            # IMMEDIATE takes the write lock up front so two workers never claim the same job
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id, run_id, website, check_name, attempts FROM jobs "
+                    "WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires <= ?) "
+                    "ORDER BY available_at LIMIT 1",
+                    (QUEUED, now, RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                job_id, run_id, website, check, attempts = row
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = ?, lease_expires = ?, worker = ? WHERE id = ?",
+                    (RUNNING, attempts + 1, now + visibility_timeout, worker_id, job_id),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return Job(job_id, run_id, website, check, attempts + 1)
+
+    def ack(self, job, result):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, lease_expires = NULL WHERE id = ?",
+                (DONE, encode_result(result), job.id),
+            )
+
+    def fail(self, job, error, result, max_attempts, retry_delay):
+        retry = job.attempts < max_attempts
+        with self._lock:
+            if retry:
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, available_at = ?, lease_expires = NULL, error = ? WHERE id = ?",
+                    (QUEUED, time.time() + retry_delay * 2 ** (job.attempts - 1), error, job.id),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, result = ?, lease_expires = NULL, error = ? WHERE id = ?",
+                    (FAILED, encode_result(result), error, job.id),
+                )
+        return retry
+
+    def results(self, run_id):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT website, check_name, result FROM jobs WHERE run_id = ? AND status IN (?, ?)",
+                (run_id, DONE, FAILED),
+            ).fetchall()
+        return {(website, check): decode_result(result) for website, check, result in rows}
+
+    def counts(self, run_id):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs WHERE run_id = ? GROUP BY status", (run_id,)
+            ).fetchall()
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def purge(self, keep_run_id=None):
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE run_id != ?", (keep_run_id or '',))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Moves expired leases and due retries back to the ready list, then leases one job
+_REDIS_CLAIM = """
+local now = tonumber(ARGV[1])
+for _, zset in ipairs({KEYS[2], KEYS[3]}) do
+    local ids = redis.call('ZRANGEBYSCORE', zset, '-inf', now)
+    for _, id in ipairs(ids) do
+        redis.call('ZREM', zset, id)
+        redis.call('LPUSH', KEYS[1], id)
+    end
+end
+local id = redis.call('RPOP', KEYS[1])
+if not id then
+    return nil
+end
+redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), id)
+redis.call('HSET', ARGV[3] .. id, 'status', 'running', 'worker', ARGV[4])
+redis.call('HINCRBY', ARGV[3] .. id, 'attempts', 1)
+return id
+"""
+
+
+class RedisJobQueue(JobQueue):
+    """Job queue stored in Redis: a ready list, lease and retry sorted sets, and one hash per job."""
+
+    def __init__(self, url: str, prefix: str = 'website-monitor'):
+        if redis is None:
+            raise RuntimeError("The redis package is required for redis:// queue URLs")
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.ready = f"{prefix}:ready"
+        self.leases = f"{prefix}:leases"
+        self.delayed = f"{prefix}:delayed"
+        self.job_prefix = f"{prefix}:job:"
+        self.run_prefix = f"{prefix}:run:"
+        self._claim = self.client.register_script(_REDIS_CLAIM)
+
+    def enqueue(self, run_id, jobs):
+        pipe = self.client.pipeline()
+        for website, check in jobs:
+            job_id = uuid.uuid4().hex
+            pipe.hset(self.job_prefix + job_id, mapping={
+                'run_id': run_id, 'website': website, 'check': check, 'status': QUEUED, 'attempts': 0,
+            })
+            pipe.sadd(self.run_prefix + run_id, job_id)
+            pipe.lpush(self.ready, job_id)
+        pipe.execute()
+
+    def claim(self, worker_id, visibility_timeout):
+        job_id = self._claim(keys=[self.ready, self.leases, self.delayed],
+                             args=[time.time(), visibility_timeout, self.job_prefix, worker_id])
+        if job_id is None:
+            return None
+        data = self.client.hgetall(self.job_prefix + job_id)
+        return Job(job_id, data['run_id'], data['website'], data['check'], int(data['attempts']))
+
+    def ack(self, job, result):
+        pipe = self.client.pipeline()
+        pipe.hset(self.job_prefix + job.id, mapping={'status': DONE, 'result': encode_result(result)})
+        pipe.zrem(self.leases, job.id)
+        pipe.execute()
+
+    def fail(self, job, error, result, max_attempts, retry_delay):
+        retry = job.attempts < max_attempts
+        pipe = self.client.pipeline()
+        pipe.zrem(self.leases, job.id)
+        if retry:
+            pipe.hset(self.job_prefix + job.id, mapping={'status': QUEUED, 'error': error})
+            pipe.zadd(self.delayed, {job.id: time.time() + retry_delay * 2 ** (job.attempts - 1)})
+        else:
+            pipe.hset(self.job_prefix + job.id, mapping={'status': FAILED, 'result': encode_result(result),
+                                                         'error': error})
+        pipe.execute()
+        return retry
+
+    def _jobs(self, run_id):
+        job_ids = list(self.client.smembers(self.run_prefix + run_id))
+        pipe = self.client.pipeline()
+        for job_id in job_ids:
+            pipe.hgetall(self.job_prefix + job_id)
+        return pipe.execute()
+
+    def results(self, run_id):
+        return {
+            (data['website'], data['check']): decode_result(data.get('result'))
+            for data in self._jobs(run_id)
+            if data.get('status') in (DONE, FAILED)
+        }
+
+    def counts(self, run_id):
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for data in self._jobs(run_id):
+            counts[data['status']] = counts.get(data['status'], 0) + 1
+        return counts
+
+    def purge(self, keep_run_id=None):
+        for run_key in self.client.scan_iter(f"{self.run_prefix}*"):
+            if run_key == self.run_prefix + (keep_run_id or ''):
+                continue
+            job_ids = list(self.client.smembers(run_key))
+            pipe = self.client.pipeline()
+            for job_id in job_ids:
+                pipe.delete(self.job_prefix + job_id)
+                pipe.lrem(self.ready, 0, job_id)
+                pipe.zrem(self.leases, job_id)
+                pipe.zrem(self.delayed, job_id)
+            pipe.delete(run_key)
+            pipe.execute()
+
+    def close(self):
+        self.client.close()
+
+
+def open_queue(url: str) -> JobQueue:
+    """Return the queue backend for ``sqlite:///path`` or ``redis://...`` URLs."""
+    if url.startswith('sqlite:///'):
+        return SQLiteJobQueue(url[len('sqlite:///'):])
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisJobQueue(url)
+    raise ValueError(f"Unsupported queue URL {url!r}; use sqlite:///path or redis://host:port/db")
+
+
+def new_run_id() -> str:
+    return f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
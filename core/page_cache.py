@@ -0,0 +1,151 @@
+"""
+Per-run page fetch cache shared by the checks.
+
+Most checks start by downloading the same homepage. Within a monitoring
+run, ``fetch_page()`` performs that request once per normalized URL and
+request profile (headers + redirect policy) and hands the same response to
+every caller. Concurrent callers for the same key wait on the single
+in-flight request instead of issuing their own (single-flight). A failed
+request is shared with the callers already waiting on it but not kept, so
+later callers try again.
+
+Outside of a run scope (e.g. an individual API check) ``fetch_page()``
+simply performs the request.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+from core import http_client
+from core.http_client import DEFAULT_HEADERS, DEFAULT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, FrozenSet[Tuple[str, str]], bool]
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for cache lookups.
+
+    Adds an https scheme when missing, lowercases scheme and host, drops
+    default ports and fragments and makes an empty path ``/``.
+    """
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        url = f"https://{url}"
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and not ((scheme == 'http' and parts.port == 80) or (scheme == 'https' and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+
+class _Flight:
+    """A single in-flight or completed fetch."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[requests.Response] = None
+        self.error: Optional[Exception] = None
+        self.fetched_at = 0.0
+
+
+class PageCache:
+    """Thread-safe single-flight cache of HTTP GET responses."""
+
+    def __init__(self, max_age: float = 300):
+        self.max_age = max_age
+        self._flights: Dict[CacheKey, _Flight] = {}
+        self._lock = threading.Lock()
+        self._scopes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether at least one run scope is open."""
+        return self._scopes > 0
+
+    @contextmanager
+    def run_scope(self):
+        """Enable caching for the duration of a monitoring run."""
+        with self._lock:
+            self._scopes += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._scopes -= 1
+                if self._scopes == 0:
+                    logger.info(f"Page cache: {self.hits} hits, {self.misses} misses, {len(self._flights)} pages")
+                    self._flights.clear()
+                    self.hits = 0
+                    self.misses = 0
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None, allow_redirects: bool = True,
+              timeout: float = DEFAULT_TIMEOUT) -> requests.Response:
+        """
+        Return the (possibly shared) response for a GET request.
+
+        Errors are shared with the callers waiting on the failed fetch, which
+        get the same ``requests`` exception re-raised; the next call fetches again.
+        """
+        url = normalize_url(url)
+        headers = headers if headers is not None else DEFAULT_HEADERS
+        if not self.active:
+            return _get(url, headers, allow_redirects, timeout)
+
+        key = (url, frozenset((k.lower(), v) for k, v in headers.items()), allow_redirects)
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight.done.is_set() and time.monotonic() - flight.fetched_at > self.max_age:
+                flight = None
+            owner = flight is None
+            if owner:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if owner:
+            try:
+                flight.response = _get(url, headers, allow_redirects, timeout)
+            except Exception as e:
+                flight.error = e
+                with self._lock:
+                    # A transient error must not be replayed to every later caller
+                    if self._flights.get(key) is flight:
+                        del self._flights[key]
+            finally:
+                flight.fetched_at = time.monotonic()
+                flight.done.set()
+        else:
+            flight.done.wait()
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.response
+
+
+def _get(url: str, headers: Dict[str, str], allow_redirects: bool, timeout: float) -> requests.Response:
+    """Perform the request and load the body so the response can be shared."""
+    response = http_client.get(url, headers=headers, allow_redirects=allow_redirects, timeout=timeout)
+    response.content
+    return response
+
+
+page_cache = PageCache()
+
+
+def fetch_page(url: str, headers: Optional[Dict[str, str]] = None, allow_redirects: bool = True,
+               timeout: float = DEFAULT_TIMEOUT) -> requests.Response:
+    """Fetch a page through the process-wide page cache."""
+    return page_cache.fetch(url, headers=headers, allow_redirects=allow_redirects, timeout=timeout)
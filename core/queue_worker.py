@@ -0,0 +1,174 @@
+"""
+Worker and producer sides of the job-queue backend.
+
+``QueueWorker`` runs in each worker process: it claims a batch of jobs from
+the queue, runs it through an ``ExecutionEngine`` like a direct run (same
+per-site limits, pre-flight probes, adaptive timeouts and per-run caches),
+and acks or retries each job. ``collect_run`` is used by the producer to
+wait until a run is finished, or its deadline has passed.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import os
+import socket
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.engine import NOT_RUN, ExecutionEngine
+from core.job_queue import DONE, FAILED, Job, JobQueue
+
+logger = logging.getLogger(__name__)
+
+# Results that count as a failed attempt and are retried (a tuple: results need not be hashable)
+RETRYABLE_RESULTS = ("⚪", NOT_RUN)
+
+
+class QueueWorker:
+    """Pulls (site, check) jobs from a queue and executes them in batches."""
+
+    def __init__(self, queue: JobQueue, checks: Dict[str, Any], config: Any,
+                 engine: Optional[ExecutionEngine] = None, concurrency: int = 4, per_site: int = 2,
+                 visibility_timeout: float = 300, max_attempts: int = 3, retry_delay: float = 30,
+                 poll_interval: float = 1.0):
+        """
+        Args:
+            queue: Queue to pull jobs from.
+            checks: Check objects by name.
+            config: Run configuration passed to ``Check.execute``.
+            engine: Engine the batches run on; by default one limited to
+                ``concurrency`` checks at once, and ``per_site`` per website.
+                A batch holds as many jobs as the engine runs at once.
+            visibility_timeout: Lease length; must exceed the longest batch.
+            max_attempts: Attempts before a job's result is final.
+            retry_delay: Base delay of the exponential retry backoff, in seconds.
+            poll_interval: Sleep between polls of an empty queue.
+        """
+        self.queue = queue
+        self.checks = checks
+        # The producer decides which results are reused and when the run ends
+        self.config = dataclasses.replace(config, incremental=False, run_deadline=None)
+        self.engine = engine or ExecutionEngine(max_workers=concurrency, max_workers_per_site=per_site)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.processed = 0
+        self._stopping = False
+        # Jobs claimed for a pair already in the batch, run in the next one
+        self._deferred: List[Job] = []
+
+    def stop(self):
+        """Finish the batch in progress and exit ``run``."""
+        self._stopping = True
+
+    async def _call(self, func, *args):
+        # Queue backends are blocking; keep them off the event loop
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _report(self, job: Job, result: Any, error: Optional[str], max_attempts: Optional[int] = None):
+        """Ack or fail a job; a job whose result cannot be stored is failed rather than left leased."""
+        max_attempts = self.max_attempts if max_attempts is None else max_attempts
+        try:
+            if error is None:
+                try:
+                    await self._call(self.queue.ack, job, result)
+                    return
+                except Exception as e:
+                    logger.error(f"Could not store the result of {job.check} for {job.website}: {e}")
+                    result, error = "⚪", f"{type(e).__name__}: {e}"
+            retried = await self._call(self.queue.fail, job, error, result, max_attempts, self.retry_delay)
+            if retried:
+                logger.info(f"Retrying {job.check} for {job.website} (attempt {job.attempts} failed: {error})")
+        except Exception as e:
+            # The lease expires and the job is claimed again
+            logger.error(f"Could not report {job.check} for {job.website} to the queue: {e}")
+
+    async def _claim_batch(self) -> Dict[Tuple[str, str], Job]:
+        """Claim up to one engine's worth of jobs, at most one per (website, check)."""
+        batch: Dict[Tuple[str, str], Job] = {}
+        deferred, self._deferred = self._deferred, []
+        while len(batch) < self.engine.max_workers:
+            if deferred:
+                job = deferred.pop(0)
+            else:
+                job = await self._call(self.queue.claim, self.worker_id, self.visibility_timeout)
+                if job is None:
+                    break
+            if job.check not in self.checks:
+                await self._report(job, "⚪", f"unknown check {job.check!r}", max_attempts=0)
+            elif job.attempts > self.max_attempts:
+                # Its lease kept expiring: the check crashes or hangs the worker every time
+                await self._report(job, "⚪", "lease expired on every attempt", max_attempts=0)
+            elif (job.website, job.check) in batch:
+                self._deferred.append(job)
+            else:
+                batch[(job.website, job.check)] = job
+        self._deferred.extend(deferred)
+        return batch
+
+    async def _run_batch(self, batch: Dict[Tuple[str, str], Job]):
+        websites = list(dict.fromkeys(website for website, _ in batch))
+        check_names = list(dict.fromkeys(check for _, check in batch))
+        checks = [self.checks[name] for name in check_names]
+        cells = [(check_names.index(check), websites.index(website)) for website, check in batch]
+        remaining = dict(batch)
+        try:
+            async for outcome in self.engine.stream(checks, websites, self.config, cells=cells):
+                job = remaining[(outcome.website, outcome.check)]
+                error = None if outcome.result not in RETRYABLE_RESULTS else "check returned an error result"
+                await self._report(job, outcome.result, error)
+                del remaining[(outcome.website, outcome.check)]
+                self.processed += 1
+        except Exception as e:
+            logger.error(f"Queue worker batch of {len(batch)} jobs failed: {e}")
+            for job in remaining.values():
+                await self._report(job, "⚪", f"{type(e).__name__}: {e}")
+
+    async def run(self):
+        """Claim and execute batches of jobs until ``stop`` is called."""
+        logger.info(f"Queue worker {self.worker_id} started with batches of {self.engine.max_workers} jobs")
+        try:
+            while not self._stopping:
+                batch = await self._claim_batch()
+                if not batch:
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                # Each batch is one engine run, with its own page, TLS and pre-flight caches
+                await self._run_batch(batch)
+        finally:
+            logger.info(f"Queue worker {self.worker_id} stopped after {self.processed} jobs")
+
+
+async def collect_run(queue: JobQueue, run_id: str, total: int, deadline: Optional[float] = None,
+                      poll_interval: float = 2.0) -> Tuple[Dict[Tuple[str, str], str], bool]:
+    """
+    Wait until every job of ``run_id`` has a final result, or ``deadline`` seconds have passed.
+
+    Returns:
+        The results keyed by ``(website, check)`` and whether the run
+        finished; unfinished jobs are absent from the results.
+    """
+    started = time.monotonic()
+    loop = asyncio.get_running_loop()
+    while True:
+        counts = await loop.run_in_executor(None, queue.counts, run_id)
+        finished = counts[DONE] + counts[FAILED]
+        if finished >= total:
+            break
+        if deadline is not None and time.monotonic() - started >= deadline:
+            logger.warning(f"Run {run_id} deadline reached with {total - finished} of {total} jobs unfinished")
+            break
+        await asyncio.sleep(poll_interval)
+    results = await loop.run_in_executor(None, queue.results, run_id)
+    return results, len(results) >= total
+
+
+def fill_matrix(results: Dict[Tuple[str, str], str], check_names, websites) -> list:
+    """Arrange queue results into the ``(check_name, results)`` report matrix; gaps are NOT_RUN."""
+    return [
+        (check_name, [results.get((website, check_name), NOT_RUN) for website in websites])
+        for check_name in check_names
+    ]
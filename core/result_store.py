@@ -0,0 +1,122 @@
+"""
+Persisted last result of every (website, check) pair.
+
+Most check results cannot meaningfully change within hours (a domain's
+expiry date, its DNSSEC status, its WHOIS privacy). Every result is stored
+with the time it was computed, and an incremental run only re-executes the
+pairs whose stored result is older than the check's TTL; the rest are
+reported from the store, along with their age.
+
+Results are kept in their JSON form, so a result read back (from memory or
+from the file) is the same whether or not the store was reloaded; tuple
+results, e.g. ``(status, details)``, come back as tuples.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def format_age(seconds: float) -> str:
+    """Format an age compactly for the report, e.g. ``45s``, ``12m``, ``3h``, ``2d``."""
+    for unit, size in (('d', 86400), ('h', 3600), ('m', 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
+
+
+class ResultStore:
+    """Last result and its timestamp per (website, check), optionally persisted as JSON."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: JSON file the store is loaded from and saved to; None keeps it in memory.
+        """
+        self.path = path
+        # website -> check name -> [result, checked_at (Unix time)]
+        self._results: Dict[str, Dict[str, list]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def get(self, website: str, check_name: str) -> Optional[Tuple[Any, float]]:
+        """Return the last ``(result, checked_at)`` of a pair, or None."""
+        with self._lock:
+            entry = self._results.get(website, {}).get(check_name)
+        if not entry:
+            return None
+        result = entry[0]
+        return (tuple(result) if isinstance(result, list) else result), entry[1]
+
+    def fresh(self, website: str, check_name: str, ttl: Optional[float],
+              now: Optional[float] = None) -> Optional[Tuple[Any, float]]:
+        """Return the last ``(result, checked_at)`` of a pair if it is younger than ``ttl`` seconds."""
+        if not ttl:
+            return None
+        entry = self.get(website, check_name)
+        now = time.time() if now is None else now
+        if entry is None or now - entry[1] >= ttl:
+            return None
+        return entry
+
+    def record(self, website: str, check_name: str, result: Any, checked_at: Optional[float] = None):
+        # Stored as it will be saved, e.g. tuples as lists
+        result = json.loads(json.dumps(result, ensure_ascii=False))
+        with self._lock:
+            self._results.setdefault(website, {})[check_name] = [
+                result, time.time() if checked_at is None else checked_at
+            ]
+
+    def _read(self) -> Dict[str, Dict[str, list]]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            results = self._read()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable result store {self.path}: {e}")
+            return
+        with self._lock:
+            self._results = results
+
+    def save(self):
+        """Write the store, keeping newer entries other processes (e.g. shards) saved meanwhile."""
+        if not self.path:
+            return
+        try:
+            on_disk = self._read() if os.path.exists(self.path) else {}
+        except (OSError, ValueError):
+            on_disk = {}
+        with self._lock:
+            for website, checks in on_disk.items():
+                mine = self._results.setdefault(website, {})
+                for check_name, entry in checks.items():
+                    if check_name not in mine or mine[check_name][1] < entry[1]:
+                        mine[check_name] = entry
+            data = json.dumps(self._results, ensure_ascii=False, indent=1, sort_keys=True)
+        try:
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save result store to {self.path}: {e}")
+
+
+_store: Optional[ResultStore] = None
+
+
+def get_store(path: Optional[str] = None) -> ResultStore:
+    """Return the process-wide result store, loading it from ``path`` on first use."""
+    global _store
+    if _store is None:
+        _store = ResultStore(path)
+    return _store
@@ -0,0 +1,121 @@
+"""
+Retry and hedging policy shared by the sync and async HTTP clients.
+
+A single dropped connection or 503 used to turn a check into ⚪. Idempotent
+requests (GET, HEAD, OPTIONS) are now retried on connection errors and
+502/503/504 responses, with exponential backoff and full jitter so that
+retries against a struggling host do not arrive in lockstep.
+
+Hedging is optional: when a request to a host has not answered within that
+host's p95 latency, an identical second request is sent and whichever
+answers first wins. This cuts the tail of slow responses at the price of a
+few extra requests, capped at ``hedge_max_ratio`` of all requests.
+"""
+
+import math
+import random
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+class RequestPolicy:
+    """Backoff schedule, per-host latency tracking and hedging decisions."""
+
+    def __init__(self, retries: int = 1, backoff_factor: float = 0.5, max_backoff: float = 10,
+                 hedging: bool = False, hedge_quantile: float = 0.95, hedge_max_ratio: float = 0.1,
+                 window: int = 100, min_samples: int = 20):
+        """
+        Args:
+            retries: Retries of a failed idempotent request.
+            backoff_factor: Base of the exponential backoff, in seconds.
+            max_backoff: Longest wait between two attempts, in seconds.
+            hedging: Send a second request when the first is slower than usual.
+            hedge_quantile: Latency percentile of the host after which to hedge.
+            hedge_max_ratio: Maximum share of requests that may be hedged.
+            window: Latest latencies kept per host.
+            min_samples: Latencies needed before a host's requests are hedged.
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.configure(retries, backoff_factor, max_backoff, hedging, hedge_quantile, hedge_max_ratio)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retried = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def configure(self, retries: int = 1, backoff_factor: float = 0.5, max_backoff: float = 10,
+                  hedging: bool = False, hedge_quantile: float = 0.95, hedge_max_ratio: float = 0.1):
+        self.retries = max(0, retries)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.hedging = hedging
+        self.hedge_quantile = hedge_quantile
+        self.hedge_max_ratio = hedge_max_ratio
+
+    def attempts(self, method: str) -> int:
+        """Return how many times a request may be sent."""
+        return self.retries + 1 if method.upper() in IDEMPOTENT_METHODS else 1
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Return the wait before retry number ``attempt + 1``.
+
+        Full jitter: a uniform draw between 0 and the exponential backoff.
+        A server's ``Retry-After`` (in seconds) is honoured up to ``max_backoff``.
+        """
+        with self._lock:
+            self.retried += 1
+        if retry_after:
+            try:
+                return min(self.max_backoff, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+    def record_latency(self, host: str, seconds: float):
+        """Record how long a successful request to ``host`` took."""
+        with self._lock:
+            self.requests += 1
+            latencies = self._latencies.get(host)
+            if latencies is None:
+                latencies = self._latencies[host] = deque(maxlen=self.window)
+            latencies.append(seconds)
+
+    def hedge_delay(self, method: str, host: str) -> Optional[float]:
+        """Return after how long to hedge a request, or None to send it only once."""
+        if not self.hedging or method.upper() not in IDEMPOTENT_METHODS:
+            return None
+        with self._lock:
+            if self.hedged >= self.hedge_max_ratio * max(1, self.requests):
+                return None
+            latencies = sorted(self._latencies.get(host, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        return latencies[max(0, math.ceil(self.hedge_quantile * len(latencies)) - 1)]
+
+    def record_hedge(self, won: bool = False):
+        with self._lock:
+            if won:
+                self.hedge_wins += 1
+            else:
+                self.hedged += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of the retry and hedging counters."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retried": self.retried,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+            }
+
+
+# Shared by the sync and async HTTP clients
+policy = RequestPolicy()
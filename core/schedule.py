@@ -0,0 +1,150 @@
+"""
+Heap-based schedule of (website, check) pairs with individual intervals.
+
+Running every check at one global interval over-samples slow-changing
+facts (certificate and domain expiry, WHOIS) and under-samples volatile
+ones (response time). Each pair has its own interval; the schedule keeps
+the pairs in a min-heap keyed by next due time, so finding the due work is
+O(log n) per pair regardless of how many pairs are idle.
+
+With jitter enabled, each website gets a fixed phase within every interval
+(derived from a hash of its domain), and its checks are rescheduled onto
+that slot rather than exactly one interval after they last ran. The due
+work is thus spread uniformly across the interval instead of every site
+firing at once, and the slots stay the same across restarts. A site's
+checks with the same interval share a slot, so they still share one
+homepage fetch.
+"""
+
+import hashlib
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from core.circuit_breaker import host_of
+
+Pair = Tuple[str, str]  # (website, check name)
+
+_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_interval(value: Union[int, float, str]) -> float:
+    """Parse an interval given in seconds or as ``"30s"``, ``"5m"``, ``"6h"`` or ``"1d"``."""
+    if isinstance(value, (int, float)):
+        seconds = float(value)
+    else:
+        text = str(value).strip().lower()
+        try:
+            if text and text[-1] in _UNITS:
+                seconds = float(text[:-1]) * _UNITS[text[-1]]
+            else:
+                seconds = float(text)
+        except ValueError:
+            raise ValueError(f"Invalid interval {value!r}; use seconds or e.g. 30s, 5m, 6h, 1d")
+    if seconds <= 0:
+        raise ValueError(f"Invalid interval {value!r}; it must be positive")
+    return seconds
+
+
+def site_phase(website: str) -> float:
+    """Return the website's fixed offset within an interval, as a fraction in [0, 1)."""
+    domain = host_of(website).rstrip('.')
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    digest = hashlib.sha256(domain.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') / 2 ** 64
+
+
+class CheckSchedule:
+    """Min-heap of (website, check) pairs ordered by their next due time."""
+
+    def __init__(self, interval_for: Callable[[str, str], float], jitter: bool = True):
+        """
+        Args:
+            interval_for: Returns the interval in seconds of a ``(website, check)`` pair.
+            jitter: Reschedule each site onto its own fixed slot within the interval.
+        """
+        self.interval_for = interval_for
+        self.jitter = jitter
+        self._heap: List[Tuple[float, int, str, str]] = []
+        self._due: Dict[Pair, float] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def _push(self, pair: Pair, due: float):
+        self._due[pair] = due
+        heapq.heappush(self._heap, (due, next(self._counter), pair[0], pair[1]))
+
+    def sync(self, pairs: Iterable[Pair], now: Optional[float] = None,
+             last_run: Optional[Callable[[Pair], Optional[float]]] = None):
+        """
+        Make the schedule cover exactly ``pairs``.
+
+        New pairs are due on their first slot (see ``first_slot``), or one
+        interval after ``last_run(pair)`` if that returns when they last ran;
+        pairs no longer present are dropped (their heap entries are discarded
+        lazily when they surface).
+        """
+        now = time.time() if now is None else now
+        wanted = set(pairs)
+        for pair in list(self._due):
+            if pair not in wanted:
+                del self._due[pair]
+        for pair in wanted:
+            if pair not in self._due:
+                ran_at = last_run(pair) if last_run else None
+                self._push(pair, self.first_slot(pair, now) if ran_at is None
+                           else self.next_slot(pair, ran_at))
+
+    def _discard_stale(self):
+        while self._heap:
+            due, _, website, check = self._heap[0]
+            if self._due.get((website, check)) == due:
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        """Return the earliest due time, or None if the schedule is empty."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Pair]:
+        """Remove and return every pair due at ``now``; call ``reschedule`` once they have run."""
+        now = time.time() if now is None else now
+        due_pairs = []
+        self._discard_stale()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, website, check = heapq.heappop(self._heap)
+            pair = (website, check)
+            if pair in self._due:
+                del self._due[pair]
+                due_pairs.append(pair)
+            self._discard_stale()
+        return due_pairs
+
+    def first_slot(self, pair: Pair, now: float) -> float:
+        """Return when a ``pair`` that has never run is first due: its site's slot within the next interval."""
+        if not self.jitter:
+            return now
+        interval = self.interval_for(*pair)
+        return now + (site_phase(pair[0]) * interval - now) % interval
+
+    def next_slot(self, pair: Pair, now: float) -> float:
+        """Return when ``pair`` is next due after running at ``now``."""
+        interval = self.interval_for(*pair)
+        if not self.jitter:
+            return now + interval
+        # The first time after now that falls on the site's phase within the interval
+        offset = site_phase(pair[0]) * interval
+        due = now + interval - (now - offset) % interval
+        # Rounding can land a pair that ran right on its slot back on that same slot
+        return due if due - now >= 1 else due + interval
+
+    def reschedule(self, pairs: Iterable[Pair], now: Optional[float] = None):
+        """Schedule each pair again, one interval after ``now`` or on its site's next slot."""
+        now = time.time() if now is None else now
+        for pair in pairs:
+            self._push(pair, self.next_slot(pair, now))
@@ -0,0 +1,195 @@
+"""
+Sharded runs, across processes on one machine or across machines.
+
+Threads and asyncio overlap network waits, but HTML parsing and regex
+scanning in the checks still serialize on the GIL. A sharded run splits the
+websites across worker processes, each with its own event loop, executor
+and connection pools, and streams every outcome back to the parent as soon
+as it completes so the parent can merge them into a single report.
+
+Workers are started with the ``spawn`` method (as for isolated checks) so
+they never inherit the parent's threads, locks or sockets.
+
+Across machines, each runner selects its slice of the site list with
+``select_shard`` (a stable hash of the domain, so every runner agrees without
+coordinating), writes its results with ``write_partial``, and a final step
+combines the partial files with ``merge_partials``.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import queue
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from core.circuit_breaker import host_of
+
+logger = logging.getLogger(__name__)
+
+
+def partition(websites: List[str], shards: int) -> List[List[str]]:
+    """Split ``websites`` round-robin into at most ``shards`` non-empty lists."""
+    shards = max(1, min(shards, len(websites)))
+    return [websites[index::shards] for index in range(shards)]
+
+
+def _shard_entry(worker: Callable, index: int, websites: List[str], results, args: tuple):
+    """Child process entry point: run ``worker`` and report back through ``results``."""
+    def emit(*outcome):
+        results.put(('result', index) + outcome)
+
+    try:
+        worker(websites, emit, *args)
+        results.put(('done', index))
+    except BaseException as e:
+        results.put(('error', index, f"{type(e).__name__}: {e}"))
+
+
+def run_sharded(worker: Callable, shards: List[List[str]], *args: Any) -> Iterator[Tuple[Any, ...]]:
+    """
+    Run ``worker(websites, emit, *args)`` in one process per shard.
+
+    The worker calls ``emit(*outcome)`` for every result; the outcomes are
+    yielded here, in arrival order, while the shards are still running.
+    A shard that crashes is logged and skipped; its missing outcomes are
+    left to the caller to fill in.
+    """
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    processes = [
+        context.Process(target=_shard_entry, args=(worker, index, websites, results, args),
+                        name=f"shard-{index}")
+        for index, websites in enumerate(shards)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(f"Started {len(processes)} shard processes for {sum(len(s) for s in shards)} websites")
+
+    running = set(range(len(processes)))
+    exited = set()
+    try:
+        while running:
+            try:
+                message = results.get(timeout=1)
+            except queue.Empty:
+                for index in list(running):
+                    if processes[index].is_alive():
+                        continue
+                    if index not in exited:
+                        # Give its last messages one more poll to arrive
+                        exited.add(index)
+                        continue
+                    # Exited without reporting back (e.g. killed by the OS)
+                    logger.error(f"Shard {index} exited with code {processes[index].exitcode} "
+                                 f"before finishing")
+                    running.discard(index)
+                continue
+
+            kind, index = message[0], message[1]
+            if kind == 'result':
+                yield message[2:]
+            elif kind == 'done':
+                running.discard(index)
+            else:
+                logger.error(f"Shard {index} failed: {message[2]}")
+                running.discard(index)
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+
+PARTIAL_FORMAT_VERSION = 1
+
+
+def parse_shard(selector: str) -> Tuple[int, int]:
+    """Parse an ``"i/n"`` shard selector (0-based index ``i`` out of ``n`` shards)."""
+    try:
+        index, count = (int(part) for part in selector.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard selector {selector!r}, expected i/n (e.g. 0/4)")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard selector {selector!r}: need 0 <= i < n")
+    return index, count
+
+
+def shard_of(website: str, count: int) -> int:
+    """Return the shard a website belongs to; stable across runs, machines and list order."""
+    domain = host_of(website).rstrip('.')
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    digest = hashlib.sha256(domain.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count
+
+
+def select_shard(websites: List[str], index: int, count: int) -> List[str]:
+    """Return the websites of shard ``index`` out of ``count``, in their original order."""
+    return [website for website in websites if shard_of(website, count) == index]
+
+
+def write_partial(path: str, shard: Tuple[int, int], websites: List[str],
+                  check_results: List[Tuple[str, List[str]]]):
+    """Write one shard's results as a machine-readable partial result file."""
+    data = {
+        'version': PARTIAL_FORMAT_VERSION,
+        'shard': list(shard),
+        'generated_at': datetime.now().isoformat(),
+        'websites': websites,
+        'checks': [check_name for check_name, _ in check_results],
+        'results': {
+            check_name: dict(zip(websites, results))
+            for check_name, results in check_results
+        },
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    logger.info(f"Wrote partial results for shard {shard[0]}/{shard[1]} ({len(websites)} websites) to {path}")
+
+
+def merge_partials(paths: List[str], websites: List[str]) -> List[Tuple[str, List[str]]]:
+    """
+    Combine partial result files into the ``(check_name, results)`` matrix for ``websites``.
+
+    Checks keep the order of the first file they appear in. Missing shards
+    and websites no partial covers are logged, and their cells are errors.
+    """
+    check_names: List[str] = []
+    results: Dict[Tuple[str, str], str] = {}
+    shards_seen = set()
+    shard_count = None
+
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != PARTIAL_FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported partial result version {data.get('version')!r}")
+        index, count = data['shard']
+        if shard_count is not None and count != shard_count:
+            raise ValueError(f"{path}: shard {index}/{count} does not match the other partials (n={shard_count})")
+        shard_count = count
+        if index in shards_seen:
+            logger.warning(f"{path}: shard {index}/{count} seen more than once; later results win")
+        shards_seen.add(index)
+        for check_name in data['checks']:
+            if check_name not in check_names:
+                check_names.append(check_name)
+            for website, result in data['results'].get(check_name, {}).items():
+                results[(check_name, website)] = result
+
+    if shard_count is not None:
+        missing_shards = sorted(set(range(shard_count)) - shards_seen)
+        if missing_shards:
+            logger.error(f"Missing partial results for shards {missing_shards} of {shard_count}")
+    uncovered = [website for website in websites
+                 if not any((check_name, website) in results for check_name in check_names)]
+    if uncovered:
+        logger.error(f"No results for {len(uncovered)} websites: {', '.join(uncovered)}")
+
+    return [
+        (check_name, [results.get((check_name, website), "⚪") for website in websites])
+        for check_name in check_names
+    ]
@@ -0,0 +1,95 @@
+"""
+Supervised long-lived worker process.
+
+The scheduler used to start a fresh interpreter for every run, paying for
+all imports again and throwing away connection pools, DNS caches and
+downloaded datasets. A ``SupervisedWorker`` keeps one child process alive
+across runs and sends it requests over a pipe; the child is only restarted
+when it crashes or a request exceeds its deadline, so a run that takes the
+interpreter down still cannot take the scheduler with it.
+
+The child runs ``target``, given as ``"module:function"`` and imported in
+the child only, so the supervising process stays lightweight. The
+function receives its end of the pipe and serves requests until it reads
+``{'command': 'stop'}`` or the pipe closes.
+"""
+
+import importlib
+import logging
+import multiprocessing
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_entry(conn, target: str):
+    module_name, function_name = target.split(':')
+    function = getattr(importlib.import_module(module_name), function_name)
+    function(conn)
+
+
+class SupervisedWorker:
+    """Runs requests in a persistent child process, restarting it on failure."""
+
+    def __init__(self, target: str, name: str = 'monitor-worker'):
+        self.target = target
+        self.name = name
+        self.restarts = 0
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._conn = None
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        """Start the child process if it is not running."""
+        if self.alive:
+            return
+        if self._process is not None:
+            self.restarts += 1
+            logger.warning(f"Restarting {self.name} (exit code {self._process.exitcode}, restart #{self.restarts})")
+        self._conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(target=_worker_entry, args=(child_conn, self.target),
+                                              name=self.name, daemon=True)
+        self._process.start()
+        child_conn.close()
+        logger.info(f"Started {self.name} (pid {self._process.pid})")
+
+    def call(self, request: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send ``request`` to the child and wait for its reply.
+
+        Raises:
+            TimeoutError: No reply within ``timeout``; the child is killed.
+            RuntimeError: The child died while handling the request.
+        """
+        self.start()
+        try:
+            self._conn.send(request)
+            if not self._conn.poll(timeout):
+                self.kill()
+                raise TimeoutError(f"{self.name} did not answer within {timeout}s")
+            return self._conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError):
+            self._process.join(timeout=1)
+            raise RuntimeError(f"{self.name} died (exit code {self._process.exitcode})")
+
+    def kill(self):
+        if self.alive:
+            self._process.kill()
+            self._process.join()
+
+    def stop(self, timeout: float = 30):
+        """Ask the child to exit cleanly, killing it if it does not."""
+        if not self.alive:
+            return
+        try:
+            self._conn.send({'command': 'stop'})
+        except (BrokenPipeError, OSError):
+            pass
+        self._process.join(timeout)
+        self.kill()
+        self._conn.close()
+        logger.info(f"Stopped {self.name}")
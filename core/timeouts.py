@@ -0,0 +1,129 @@
+"""
+Adaptive per-(website, check) timeouts learned from latency history.
+
+A single static timeout is wrong in both directions: it lets a hung check
+against a fast site burn the full budget, and it cuts off slow but healthy
+sites. The engine records how long each check takes against each website
+and, once enough samples exist, uses a high percentile of them times a
+safety margin as the timeout, clamped between a floor and a ceiling.
+
+Only checks that completed are sampled. A timeout is not a latency sample:
+counting it would stretch the timeouts of hosts that hang, which is exactly
+what adaptive timeouts are meant to cut short.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveTimeouts:
+    """Sliding window of latencies per (website, check), optionally persisted as JSON."""
+
+    def __init__(self, path: Optional[str] = None, window: int = 50, min_samples: int = 5,
+                 percentile: float = 0.99, margin: float = 1.5, floor: float = 5, ceiling: float = 60):
+        """
+        Args:
+            path: JSON file the samples are loaded from and saved to; None keeps them in memory.
+            window: Latest samples kept per pair.
+            min_samples: Samples needed before the learned timeout replaces the configured one.
+            percentile: Latency percentile the timeout is based on.
+            margin: Factor applied to that percentile.
+            floor: Lowest timeout in seconds.
+            ceiling: Highest timeout in seconds.
+        """
+        self.path = path
+        self.window = window
+        self.min_samples = min_samples
+        self.percentile = percentile
+        self.margin = margin
+        self.floor = floor
+        self.ceiling = ceiling
+        # check name -> website -> latest durations, oldest first
+        self._samples: Dict[str, Dict[str, List[float]]] = {}
+        # (check name, website) pairs sampled since the file was last read
+        self._recorded: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self.load()
+
+    def configure(self, percentile: float = 0.99, margin: float = 1.5, floor: float = 5, ceiling: float = 60):
+        self.percentile = percentile
+        self.margin = margin
+        self.floor = floor
+        self.ceiling = max(floor, ceiling)
+
+    def record(self, website: str, check_name: str, duration: float):
+        """Add the duration of a check that completed."""
+        with self._lock:
+            samples = self._samples.setdefault(check_name, {}).setdefault(website, [])
+            samples.append(round(duration, 3))
+            del samples[:-self.window]
+            self._recorded.add((check_name, website))
+
+    def quantile(self, website: str, check_name: str) -> Optional[float]:
+        """Return the configured latency percentile of a pair, or None without enough samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(check_name, {}).get(website, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[max(0, math.ceil(self.percentile * len(samples)) - 1)]
+
+    def timeout_for(self, website: str, check_name: str, default: float) -> float:
+        """Return the timeout for a pair: the learned one, or ``default`` until enough samples exist."""
+        quantile = self.quantile(website, check_name)
+        if quantile is None:
+            return default
+        return min(self.ceiling, max(self.floor, quantile * self.margin))
+
+    def _read(self) -> Dict[str, Dict[str, List[float]]]:
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            self._samples = self._read()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable latency history {self.path}: {e}")
+            self._samples = {}
+
+    def save(self):
+        """Write the samples, keeping those other processes (e.g. shards of other sites) saved meanwhile."""
+        if not self.path:
+            return
+        try:
+            on_disk = self._read() if os.path.exists(self.path) else {}
+        except (OSError, ValueError):
+            on_disk = {}
+        with self._lock:
+            for check_name, websites in on_disk.items():
+                mine = self._samples.setdefault(check_name, {})
+                for website, samples in websites.items():
+                    if (check_name, website) not in self._recorded:
+                        mine[website] = samples
+            self._recorded.clear()
+            data = json.dumps(self._samples, sort_keys=True)
+        try:
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save latency history to {self.path}: {e}")
+
+
+_timeouts: Optional[AdaptiveTimeouts] = None
+
+
+def get_timeouts(path: Optional[str] = None) -> AdaptiveTimeouts:
+    """Return the process-wide latency history, loading it from ``path`` on first use."""
+    global _timeouts
+    if _timeouts is None:
+        _timeouts = AdaptiveTimeouts(path)
+    return _timeouts
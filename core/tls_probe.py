@@ -0,0 +1,156 @@
+"""
+Per-run TLS handshake cache shared by the SSL checks.
+
+``check_ssl_cert`` and ``check_ssl_cipher_strength`` used to open their own
+connection to port 443 and perform the same verified handshake. Within a
+monitoring run, ``probe()`` handshakes once per host and port and hands
+every caller the same ``TlsInfo``: the certificate, the chain presented,
+the negotiated protocol and cipher and the ALPN protocol. Concurrent
+callers wait on the single in-flight handshake (single-flight), and a
+failed handshake is shared too.
+
+Outside of a run scope (e.g. an individual API check) ``probe()`` simply
+performs the handshake.
+"""
+
+import logging
+import socket
+import ssl
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 15
+
+ALPN_PROTOCOLS = ['h2', 'http/1.1']
+
+
+@dataclass
+class TlsInfo:
+    """What one verified TLS handshake revealed about a host."""
+    host: str
+    port: int
+    protocol: Optional[str]
+    # (name, protocol, secret bits), as returned by ``SSLSocket.cipher()``
+    cipher: Optional[Tuple[str, str, int]]
+    # Decoded leaf certificate, as returned by ``SSLSocket.getpeercert()``
+    cert: Dict[str, Any]
+    # DER certificates, leaf first; only the leaf on Python < 3.13
+    chain: List[bytes] = field(default_factory=list)
+    alpn: Optional[str] = None
+
+
+def handshake(host: str, port: int = 443, timeout: float = DEFAULT_TIMEOUT) -> TlsInfo:
+    """Connect, perform a verified TLS handshake and describe it."""
+    context = ssl.create_default_context()
+    context.check_hostname = True
+    context.verify_mode = ssl.CERT_REQUIRED
+    context.set_alpn_protocols(ALPN_PROTOCOLS)
+    with socket.create_connection((host, port), timeout=timeout) as conn:
+        with context.wrap_socket(conn, server_hostname=host) as sock:
+            if hasattr(sock, 'get_verified_chain'):
+                chain = list(sock.get_verified_chain())
+            else:
+                chain = [sock.getpeercert(binary_form=True)]
+            return TlsInfo(
+                host=host,
+                port=port,
+                protocol=sock.version(),
+                cipher=sock.cipher(),
+                cert=sock.getpeercert(),
+                chain=chain,
+                alpn=sock.selected_alpn_protocol(),
+            )
+
+
+class _Flight:
+    """A single in-flight or completed handshake."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.info: Optional[TlsInfo] = None
+        self.error: Optional[Exception] = None
+        self.probed_at = 0.0
+
+
+class TlsProbe:
+    """Thread-safe single-flight cache of TLS handshakes."""
+
+    def __init__(self, max_age: float = 300):
+        self.max_age = max_age
+        self._flights: Dict[Tuple[str, int], _Flight] = {}
+        self._lock = threading.Lock()
+        self._scopes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether at least one run scope is open."""
+        return self._scopes > 0
+
+    @contextmanager
+    def run_scope(self):
+        """Enable caching for the duration of a monitoring run."""
+        with self._lock:
+            self._scopes += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._scopes -= 1
+                if self._scopes == 0:
+                    logger.info(f"TLS probe: {self.hits} hits, {self.misses} misses, {len(self._flights)} hosts")
+                    self._flights.clear()
+                    self.hits = 0
+                    self.misses = 0
+
+    def probe(self, host: str, port: int = 443, timeout: float = DEFAULT_TIMEOUT) -> TlsInfo:
+        """
+        Return the (possibly shared) description of a handshake with ``host``.
+
+        Errors are shared too: every caller waiting on a failed handshake
+        gets the same ``ssl.SSLError`` or ``OSError`` re-raised.
+        """
+        host = host.lower()
+        if not self.active:
+            return handshake(host, port, timeout)
+
+        key = (host, port)
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight.done.is_set() and time.monotonic() - flight.probed_at > self.max_age:
+                flight = None
+            owner = flight is None
+            if owner:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if owner:
+            try:
+                flight.info = handshake(host, port, timeout)
+            except Exception as e:
+                flight.error = e
+            finally:
+                flight.probed_at = time.monotonic()
+                flight.done.set()
+        else:
+            flight.done.wait()
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.info
+
+
+tls_probe = TlsProbe()
+
+
+def probe(host: str, port: int = 443, timeout: float = DEFAULT_TIMEOUT) -> TlsInfo:
+    """Handshake with a host through the process-wide TLS probe."""
+    return tls_probe.probe(host, port, timeout)
@@ -0,0 +1,217 @@
+"""
+Parallel enumeration of the TLS protocol versions and cipher suites a host accepts.
+
+The verified handshake of ``core.tls_probe`` only shows the single suite
+the server prefers. ``TlsScanner`` finds everything it accepts:
+
+1. one handshake per protocol version (TLS 1.0 to 1.3), all at once;
+2. for every accepted version below 1.3, the candidate suites of the local
+   OpenSSL are split into groups, one per worker. Each worker offers its
+   group, removes the suite the server picks and offers the rest again,
+   until the server rejects the group. A scan takes about
+   ``accepted suites / workers + 1`` handshakes of wall-clock time instead of
+   one per candidate.
+
+Workers are capped per host, across concurrent scans, and a scan stops as
+soon as its ``stop`` predicate is met (e.g. a weak suite was accepted), in
+which case the result is marked incomplete.
+
+TLS 1.3 suites cannot be restricted through the ``ssl`` module, so only the
+suite negotiated for TLS 1.3 is reported. Versions and suites the local
+OpenSSL does not support are not probed.
+"""
+
+import logging
+import socket
+import ssl
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Strongest first; the names are those reported by ``SSLSocket.version()``
+PROTOCOLS = {
+    'TLSv1.3': ssl.TLSVersion.TLSv1_3,
+    'TLSv1.2': ssl.TLSVersion.TLSv1_2,
+    'TLSv1.1': ssl.TLSVersion.TLSv1_1,
+    'TLSv1': ssl.TLSVersion.TLSv1,
+}
+
+# Suites that cannot be negotiated without pre-shared keys or passwords
+_UNUSABLE = ('PSK', 'SRP')
+
+
+@dataclass
+class TlsScan:
+    """Protocol versions and suites a host accepted."""
+    host: str
+    port: int
+    # Protocol version -> whether it was accepted
+    protocols: Dict[str, bool] = field(default_factory=dict)
+    # Protocol version -> accepted suites, in the order they were found
+    ciphers: Dict[str, List[str]] = field(default_factory=dict)
+    # False if the scan was stopped early or some handshakes failed
+    complete: bool = True
+    handshakes: int = 0
+    duration: float = 0.0
+
+
+def _context(version: ssl.TLSVersion, ciphers: Optional[List[str]] = None) -> ssl.SSLContext:
+    """Client context limited to one protocol version and, optionally, some suites."""
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    with warnings.catch_warnings():
+        # TLS 1.0 and 1.1 are deprecated, which is why they are probed
+        warnings.simplefilter('ignore', DeprecationWarning)
+        context.minimum_version = version
+        context.maximum_version = version
+    # Security level 0 lets the local OpenSSL offer legacy protocols and suites
+    context.set_ciphers(f"{':'.join(ciphers) if ciphers else 'ALL'}:@SECLEVEL=0")
+    return context
+
+
+def candidate_ciphers(protocol: str) -> List[str]:
+    """Return the suites the local OpenSSL can offer for a protocol version below TLS 1.3."""
+    try:
+        context = _context(PROTOCOLS[protocol])
+    except (ssl.SSLError, ValueError):
+        return []
+    newer = {'TLSv1.3'} if protocol == 'TLSv1.2' else {'TLSv1.2', 'TLSv1.3'}
+    return [
+        suite['name'] for suite in context.get_ciphers()
+        if suite['protocol'] not in newer and not any(marker in suite['name'] for marker in _UNUSABLE)
+    ]
+
+
+class TlsScanner:
+    """Runs restricted handshakes concurrently, at most ``max_per_host`` at a time per host."""
+
+    def __init__(self, max_per_host: int = 8, timeout: float = 10):
+        """
+        Args:
+            max_per_host: Concurrent handshakes with one host, across all scans.
+            timeout: Connect and handshake timeout of each handshake, in seconds.
+        """
+        self._lock = threading.Lock()
+        self.max_per_host = 0
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self.configure(max_per_host, timeout)
+
+    def configure(self, max_per_host: int = 8, timeout: float = 10):
+        """Update the settings; the per-host slots are only replaced if the cap changes."""
+        with self._lock:
+            self.timeout = timeout
+            if max(1, max_per_host) != self.max_per_host:
+                # Scans already holding a slot finish against the old cap
+                self.max_per_host = max(1, max_per_host)
+                self._slots = {}
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = self._slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return slot
+
+    def handshake(self, host: str, port: int, protocol: str,
+                  ciphers: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Offer only ``protocol`` (and ``ciphers``) and return the suite the server picked.
+
+        Returns None if the server rejected the offer; raises ``OSError`` if
+        the host could not be reached.
+        """
+        context = _context(PROTOCOLS[protocol], ciphers)
+        with self._slot(host):
+            try:
+                with socket.create_connection((host, port), timeout=self.timeout) as conn:
+                    with context.wrap_socket(conn, server_hostname=host) as sock:
+                        if sock.version() != protocol:
+                            return None
+                        return sock.cipher()[0]
+            except (ssl.SSLError, ConnectionResetError):
+                # Handshake failure alert or dropped connection: offer rejected
+                return None
+
+    def scan(self, host: str, port: int = 443,
+             stop: Optional[Callable[[TlsScan], bool]] = None) -> TlsScan:
+        """
+        Enumerate the protocol versions and suites ``host`` accepts.
+
+        ``stop`` is called with the partial result after every finding; once
+        it returns True no further handshakes are started. Raises ``OSError``
+        if no handshake could reach the host.
+        """
+        started = time.perf_counter()
+        result = TlsScan(host=host, port=port)
+        lock = threading.Lock()
+        stopped = threading.Event()
+        errors: List[Exception] = []
+
+        def offer(protocol: str, ciphers: Optional[List[str]] = None) -> Optional[str]:
+            try:
+                return self.handshake(host, port, protocol, ciphers)
+            finally:
+                with lock:
+                    result.handshakes += 1
+
+        def found(protocol: str, cipher: str):
+            with lock:
+                result.ciphers.setdefault(protocol, []).append(cipher)
+                if stop is not None and stop(result):
+                    stopped.set()
+
+        def probe_protocol(protocol: str):
+            try:
+                cipher = offer(protocol)
+            except OSError as e:
+                errors.append(e)
+                return
+            with lock:
+                result.protocols[protocol] = cipher is not None
+            if cipher is not None:
+                found(protocol, cipher)
+
+        def eliminate(protocol: str, group: List[str]):
+            remaining = list(group)
+            while remaining and not stopped.is_set():
+                try:
+                    cipher = offer(protocol, remaining)
+                except OSError as e:
+                    errors.append(e)
+                    return
+                if cipher is None or cipher not in remaining:
+                    return
+                remaining.remove(cipher)
+                found(protocol, cipher)
+
+        supported = [protocol for protocol in PROTOCOLS if protocol == 'TLSv1.3' or candidate_ciphers(protocol)]
+        with ThreadPoolExecutor(max_workers=self.max_per_host, thread_name_prefix='tls-scan') as executor:
+            list(executor.map(probe_protocol, supported))
+            if not result.protocols and errors:
+                raise errors[0]
+
+            groups = []
+            for protocol in supported:
+                if protocol == 'TLSv1.3' or not result.protocols.get(protocol) or stopped.is_set():
+                    continue
+                candidates = [cipher for cipher in candidate_ciphers(protocol)
+                              if cipher not in result.ciphers.get(protocol, ())]
+                workers = min(self.max_per_host, len(candidates))
+                groups.extend((protocol, candidates[index::workers]) for index in range(workers))
+            list(executor.map(lambda group: eliminate(*group), groups))
+
+        result.complete = not stopped.is_set() and not errors
+        result.duration = time.perf_counter() - started
+        logger.debug(f"TLS scan of {host}:{port}: {result.handshakes} handshakes in {result.duration:.2f}s, "
+                     f"protocols {result.protocols}, complete={result.complete}")
+        return result
+
+
+# Shared by every check in the process, so the per-host cap holds across scans
+scanner = TlsScanner()
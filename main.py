@@ -1,13 +1,31 @@
 # Standard library imports
 from datetime import datetime
 import logging
-from typing import List, Tuple, Callable, Optional
+from typing import AsyncIterator, Dict, List, Tuple, Callable, Optional
 import sys
 import asyncio
 import yaml
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+import argparse
 import os
+import signal
+import time
 
+from core import async_http, dnsbl, http_client
+from core.circuit_breaker import breaker
+from core.dispatch import dispatcher
+from core.dns_cache import dns_cache, install as install_dns_cache
+from core.retry import policy as http_policy
+from core.tls_scan import scanner as tls_scanner
+from core.durations import get_history
+from core.engine import NOT_RUN, CheckOutcome, ExecutionEngine
+from core.executor import get_executor
+from core.job_queue import new_run_id, open_queue
+from core.queue_worker import QueueWorker, collect_run, fill_matrix
+from core.result_store import format_age, get_store
+from core.schedule import CheckSchedule, parse_interval
+from core.timeouts import get_timeouts
+from core.sharding import merge_partials, parse_shard, partition, run_sharded, select_shard, write_partial
 
 # Import all check functions
 from checks.check_accessibility import check_accessibility
@@ -15,7 +33,7 @@ from checks.check_ad_and_tracking import check_ad_and_tracking
 from checks.check_alt_tags import check_alt_tags
 from checks.check_amp_compatibility import check_amp_compatibility
 from checks.check_asset_minification import check_asset_minification
-from checks.check_broken_links import check_broken_links
+from checks.check_broken_links import check_broken_links, check_broken_links_async
 from checks.check_brotli_compression import check_brotli_compression
 from checks.check_browser_compatibility import check_browser_compatibility
 from checks.check_cdn import check_cdn
@@ -29,16 +47,16 @@ from checks.check_cookie_samesite_attribute import check_cookie_samesite_attribu
 from checks.check_cors_headers import check_cors_headers
 from checks.check_data_leakage import check_data_leakage
 from checks.check_deprecated_libraries import check_deprecated_libraries
-from checks.check_dns_blacklist import check_dns_blacklist
+from checks.check_dns_blacklist import check_dns_blacklist, check_dns_blacklist_async
 from checks.check_dnssec import check_dnssec
 from checks.check_domain_breach import check_domain_breach
 from checks.check_domain_expiration import check_domain_expiration
 from checks.check_domainsblacklists_blacklist import check_domainsblacklists_blacklist
 from checks.check_email_domain import check_email_domain
 from checks.check_external_links import check_external_links
-from checks.check_favicon import check_favicon
+from checks.check_favicon import check_favicon, check_favicon_async
 from checks.check_floc import check_floc
-from checks.check_hsts import check_hsts
+from checks.check_hsts import check_hsts, check_hsts_async
 from checks.check_internationalization import check_internationalization
 from checks.check_mixed_content import check_mixed_content
 from checks.check_mobile_friendly import check_mobile_friendly
@@ -48,15 +66,15 @@ from checks.check_privacy_exposure import check_privacy_exposure
 from checks.check_privacy_protected_whois import check_privacy_protected_whois
 from checks.check_rate_limiting import check_rate_limiting
 from checks.check_redirect_chains import check_redirect_chains
-from checks.check_redirects import check_redirects
-from checks.check_robot_txt import check_robot_txt
-from checks.check_security_headers import check_security_headers
+from checks.check_redirects import check_redirects, check_redirects_async
+from checks.check_robot_txt import check_robot_txt, check_robot_txt_async
+from checks.check_security_headers import check_security_headers, check_security_headers_async
 from checks.check_semantic_markup import check_semantic_markup
 from checks.check_server_response_time import check_server_response_time
-from checks.check_sitemap import check_sitemap
+from checks.check_sitemap import check_sitemap, check_sitemap_async
 from checks.check_ssl_cert import check_ssl_cert
 from checks.check_ssl_cipher_strength import check_ssl_cipher_strength
-from checks.check_subdomain_enumeration import check_subdomain_enumeration
+from checks.check_subdomain_enumeration import check_subdomain_enumeration, check_subdomain_enumeration_async
 from checks.check_subresource_integrity import check_subresource_integrity
 from checks.check_third_party_requests import check_third_party_requests
 from checks.check_third_party_resources import check_third_party_resources
@@ -75,17 +93,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Interval units for the per-check scheduling defaults
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
 @dataclass
 class Config:
     """Configuration class to store all settings."""
     websites: List[str]
     output_file: str = "report.md"
     max_workers: int = 4
+    max_workers_per_site: int = 2
+    executor_workers: Optional[int] = None
+    http_pool_connections: int = 100
+    http_pool_maxsize: int = 4
+    http_retries: int = 1
+    http_backoff_factor: float = 0.5
+    http_max_backoff: float = 10
+    http_hedging: bool = False
+    http_hedge_quantile: float = 0.95
+    http_hedge_max_ratio: float = 0.1
+    dns_cache: bool = True
+    dns_nameservers: Optional[List[str]] = None
+    dns_timeout: float = 5
+    dns_negative_ttl: int = 60
+    async_checks: bool = True
+    async_http_limit: int = 1000
+    preflight_timeout: int = 5
+    breaker_failure_threshold: int = 3
+    breaker_reset_after: int = 300
+    duration_history_file: Optional[str] = ".check_durations.json"
+    result_store_file: Optional[str] = ".check_results.json"
+    incremental: bool = False
+    run_deadline: Optional[int] = None
+    processes: int = 1
+    queue_url: str = "sqlite:///monitor-queue.db"
+    queue_visibility_timeout: int = 300
+    queue_max_attempts: int = 3
+    queue_retry_delay: float = 30
+    default_interval: int = 3600
+    dispatch_jitter: bool = True
+    max_dispatch_rate: Optional[float] = None
+    check_intervals: Dict[str, str] = field(default_factory=dict)
+    site_intervals: Dict[str, Dict[str, str]] = field(default_factory=dict)
     timeout: int = 30
+    adaptive_timeouts: bool = True
+    latency_history_file: Optional[str] = ".check_latencies.json"
+    timeout_percentile: float = 0.99
+    timeout_margin: float = 1.5
+    timeout_floor: float = 5
+    timeout_ceiling: float = 90
     log_file: str = "monitor.log"
     report_template: str = "report_template.md"
     github_workflow_badge: str = "https://github.com/fabriziosalmi/websites-monitor/actions/workflows/create-report.yml/badge.svg"
     pagespeed_api_key: Optional[str] = None
+    subdomain_wordlist: Optional[str] = None
+    tls_enumeration: bool = True
+    tls_scan_concurrency: int = 8
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Config':
@@ -93,112 +158,265 @@ class Config:
         return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
 
 
+def configure_process(config: Config):
+    """
+    Apply ``config`` to the process-wide clients, caches and policies.
+
+    Called once per process (and per run of a supervised monitor process,
+    after config.yaml is reloaded), never per ``WebsiteMonitor``: the API
+    builds a monitor per request, and one request must not change the
+    policies under another.
+    """
+    get_executor(config.executor_workers or config.max_workers)
+    http_client.get_client(
+        pool_connections=config.http_pool_connections,
+        pool_maxsize=config.http_pool_maxsize,
+    )
+    http_policy.configure(retries=config.http_retries, backoff_factor=config.http_backoff_factor,
+                          max_backoff=config.http_max_backoff, hedging=config.http_hedging,
+                          hedge_quantile=config.http_hedge_quantile,
+                          hedge_max_ratio=config.http_hedge_max_ratio)
+    async_http.configure(limit=config.async_http_limit, limit_per_host=config.http_pool_maxsize)
+    dns_cache.configure(nameservers=config.dns_nameservers, timeout=config.dns_timeout,
+                        negative_ttl=config.dns_negative_ttl)
+    install_dns_cache(config.dns_cache)
+    tls_scanner.configure(max_per_host=config.tls_scan_concurrency)
+    breaker.configure(failure_threshold=config.breaker_failure_threshold,
+                      reset_after=config.breaker_reset_after)
+    dispatcher.configure(rate=config.max_dispatch_rate)
+
+
 class WebsiteMonitor:
     def __init__(self, config: Config):
         self.config = config
         self.error_log = []
         self.check_functions = self._initialize_check_functions()
+        # Created by configure_process(); the first caller's settings win
+        self.executor = get_executor(config.executor_workers or config.max_workers)
+        self.http_client = http_client.get_client(
+            pool_connections=config.http_pool_connections,
+            pool_maxsize=config.http_pool_maxsize,
+        )
+        timeouts = None
+        if config.adaptive_timeouts:
+            timeouts = get_timeouts(config.latency_history_file)
+            timeouts.configure(percentile=config.timeout_percentile, margin=config.timeout_margin,
+                               floor=config.timeout_floor, ceiling=config.timeout_ceiling)
+        self.engine = ExecutionEngine(config.max_workers, config.max_workers_per_site, config.preflight_timeout,
+                                      history=get_history(config.duration_history_file),
+                                      store=get_store(config.result_store_file), timeouts=timeouts)
+
+    async def run(self, websites: Optional[List[str]] = None) -> List[Tuple[str, List[str]]]:
+        """Run all enabled checks against the given (or configured) websites concurrently."""
+        websites = websites if websites is not None else self.config.websites
+        check_results = await self.engine.run(self.check_functions, websites, self.config)
+        stats = self.engine.stats
+        logger.info(
+            f"Ran {stats.tasks} checks in {stats.wall_clock:.2f}s wall-clock "
+            f"({stats.total_check_time:.2f}s total check time, {stats.speedup:.1f}x speedup)"
+        )
+        if stats.deadline_exceeded:
+            logger.warning(f"Run deadline of {self.config.run_deadline}s exceeded; {stats.not_run} checks did not run")
+        if stats.unreachable:
+            logger.warning(f"Skipped {stats.unreachable} checks against unreachable hosts: {breaker.open_hosts()}")
+        if stats.cached:
+            logger.info(f"Reused {stats.cached} results still within their TTL")
+        return check_results
+
+    async def stream(self, websites: Optional[List[str]] = None) -> AsyncIterator[CheckOutcome]:
+        """Run all enabled checks, yielding each outcome as soon as it completes."""
+        websites = websites if websites is not None else self.config.websites
+        async for outcome in self.engine.stream(self.check_functions, websites, self.config):
+            yield outcome
+
+    def interval_for(self, website: str, check_name: str) -> float:
+        """
+        Return how often, in seconds, a check runs against a website.
+
+        In order of precedence: ``site_intervals[website][check]``,
+        ``site_intervals[website]['default']``, ``check_intervals[check]``,
+        the check's own default and finally ``default_interval``.
+        """
+        site = (self.config.site_intervals or {}).get(website) or {}
+        if check_name in site:
+            return parse_interval(site[check_name])
+        if 'default' in site:
+            return parse_interval(site['default'])
+        if check_name in (self.config.check_intervals or {}):
+            return parse_interval(self.config.check_intervals[check_name])
+        check = next((check for check in self.check_functions if check.name == check_name), None)
+        if check is not None and check.interval:
+            return check.interval
+        return parse_interval(self.config.default_interval)
+
+    async def run_pairs(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        """Run only the given ``(website, check)`` pairs; returns their results keyed the same way."""
+        due_sites = {website for website, _ in pairs}
+        websites = [website for website in self.config.websites if website in due_sites]
+        site_index = {website: index for index, website in enumerate(websites)}
+        check_index = {check.name: index for index, check in enumerate(self.check_functions)}
+        cells = [(check_index[check], site_index[website]) for website, check in pairs
+                 if check in check_index and website in site_index]
+        results = {}
+        async for outcome in self.engine.stream(self.check_functions, websites, self.config, cells=cells):
+            results[(outcome.website, outcome.check)] = outcome.result
+        stats = self.engine.stats
+        logger.info(f"Ran {stats.tasks} due checks in {stats.wall_clock:.2f}s wall-clock")
+        return results
 
     class Check:
         """Represents a single website check."""
-        def __init__(self, name: str, function: Callable, enabled: bool = True, timeout: Optional[int] = None):
+        def __init__(self, name: str, function: Callable, enabled: bool = True, timeout: Optional[int] = None,
+                     isolated: bool = False, async_function: Optional[Callable] = None, site_bound: bool = True,
+                     cost: Optional[float] = None, interval: Optional[float] = None, ttl: Optional[float] = None):
             self.name = name
             self.function = function
+            # Native asyncio variant, preferred over the thread pool when aiohttp is available
+            self.async_function = async_function
+            # Site-bound checks talk to the site itself and are skipped once it is unreachable
+            self.site_bound = site_bound
+            # Expected duration in seconds, used for scheduling until real timings are recorded
+            self.cost = cost
+            # Default seconds between runs for the scheduler; None uses config.default_interval
+            self.interval = interval
+            # Seconds a result stays valid for incremental runs; None always runs the check
+            self.ttl = ttl
             self.enabled = enabled
             self.timeout = timeout
+            # Hang-prone checks run in a child process that is killed on timeout
+            self.isolated = isolated
+
+        def _arguments(self, website: str, config: Config) -> Tuple[tuple, dict]:
+            """Build the positional and keyword arguments for the check function."""
+            if self.name == "Pagespeed":
+                return (f"https://{website}",), {"api_key": config.pagespeed_api_key}
+            elif self.name == "Rate Limiting":
+                return (f"https://{website}",), {}
+            elif self.name == "SSL Cipher Strength":
+                return (website,), {"enumerate_ciphers": config.tls_enumeration}
+            elif self.name == "Subdomain Enumeration":
+                return (website,), {"wordlist": config.subdomain_wordlist}
+            return (website,), {}
 
-        async def execute(self, website: str, config: Config, default_timeout: int) -> str:
-            """Execute the check with timeout handling."""
+        async def execute(self, website: str, config: Config, default_timeout: int,
+                          budget: Optional[float] = None, timeout: Optional[float] = None) -> str:
+            """
+            Execute the check with a hard deadline, whether it is sync or async.
+
+            ``timeout`` overrides the check's own timeout (e.g. one learned from
+            its latency history). ``budget`` is what is left of the run
+            deadline; it caps the timeout, and a check cut short by it reports
+            NOT_RUN rather than a failure.
+            """
+            timeout = timeout or self.timeout or default_timeout
+            cut_by_budget = budget is not None and budget < timeout
+            if cut_by_budget:
+                timeout = budget
+            args, kwargs = self._arguments(website, config)
             try:
-                if self.name == "Pagespeed" and asyncio.iscoroutinefunction(self.function):
-                  return await asyncio.wait_for(self.function(f"https://{website}", api_key=config.pagespeed_api_key), self.timeout or default_timeout)
-                elif self.name == "Pagespeed":
-                  return self.function(f"https://{website}", api_key=config.pagespeed_api_key)
-                elif self.name == "Rate Limiting":
-                   return self.function(f"https://{website}")
+                if self.async_function and config.async_checks and async_http.AVAILABLE:
+                    return await asyncio.wait_for(self.async_function(*args, **kwargs), timeout)
                 elif asyncio.iscoroutinefunction(self.function):
-                  return await asyncio.wait_for(self.function(website), self.timeout or default_timeout)
+                    return await asyncio.wait_for(self.function(*args, **kwargs), timeout)
+                elif self.isolated:
+                    return await get_executor().run_isolated(self.function, *args, timeout=timeout, **kwargs)
                 else:
-                   return self.function(website)
+                    return await get_executor().run(self.function, *args, timeout=timeout, **kwargs)
             except asyncio.TimeoutError:
-                logger.warning(f"Check {self.name} for {website} timed out.")
+                if cut_by_budget:
+                    logger.warning(f"Check {self.name} for {website} did not finish before the run deadline.")
+                    return NOT_RUN
+                logger.warning(f"Check {self.name} for {website} timed out after {timeout:.1f}s.")
                 return "🔴"  # Timeout indicator
             except Exception as e:
                 logger.error(f"Check {self.name} failed for {website}: {e}")
                 return "⚪"  # Error indicator
 
-    def _initialize_check_functions(self) -> List['WebsiteMonitor.Check']:
+    @classmethod
+    def _initialize_check_functions(cls) -> List['WebsiteMonitor.Check']:
         """Initialize the list of check functions with their names."""
         checks = [
             # Security & Protection (10)
-            self.Check("SSL Certificate", check_ssl_cert),
-            self.Check("SSL Cipher Strength", check_ssl_cipher_strength),
-            self.Check("Security Headers", check_security_headers),
-            self.Check("HSTS", check_hsts),
-            self.Check("XSS Protection", check_xss_protection),
-            self.Check("CORS Headers", check_cors_headers),
-            self.Check("Mixed Content", check_mixed_content),
-            self.Check("Subresource Integrity", check_subresource_integrity),
-            self.Check("Rate Limiting", check_rate_limiting),
-            self.Check("Data Leakage", check_data_leakage),
+            cls.Check("SSL Certificate", check_ssl_cert, interval=HOUR * 6, ttl=HOUR * 6),
+            cls.Check("SSL Cipher Strength", check_ssl_cipher_strength, timeout=60, interval=DAY, ttl=DAY),
+            cls.Check("Security Headers", check_security_headers, async_function=check_security_headers_async,
+                       ttl=HOUR),
+            cls.Check("HSTS", check_hsts, async_function=check_hsts_async, ttl=HOUR),
+            cls.Check("XSS Protection", check_xss_protection, ttl=HOUR),
+            cls.Check("CORS Headers", check_cors_headers, ttl=HOUR),
+            cls.Check("Mixed Content", check_mixed_content, ttl=HOUR),
+            cls.Check("Subresource Integrity", check_subresource_integrity, ttl=HOUR),
+            cls.Check("Rate Limiting", check_rate_limiting, cost=15, ttl=HOUR),
+            cls.Check("Data Leakage", check_data_leakage, ttl=HOUR),
             
             # Performance & Speed (8)
-            self.Check("Pagespeed", check_pagespeed_performances, timeout=60),
-            self.Check("Website Load Time", check_website_load_time),
-            self.Check("Server Response Time", check_server_response_time),
-            self.Check("Brotli Compression", check_brotli_compression),
-            self.Check("Asset Minification", check_asset_minification),
-            self.Check("CDN", check_cdn),
-            self.Check("Redirect Chains", check_redirect_chains),
-            self.Check("Redirects", check_redirects),
+            cls.Check("Pagespeed", check_pagespeed_performances, timeout=60, cost=30, interval=HOUR * 6, ttl=HOUR * 6),
+            cls.Check("Website Load Time", check_website_load_time, cost=5, interval=MINUTE * 5, ttl=MINUTE * 5),
+            cls.Check("Server Response Time", check_server_response_time, cost=5, interval=MINUTE, ttl=MINUTE),
+            cls.Check("Brotli Compression", check_brotli_compression, ttl=HOUR * 6),
+            cls.Check("Asset Minification", check_asset_minification, ttl=HOUR * 6),
+            cls.Check("CDN", check_cdn, ttl=DAY),
+            cls.Check("Redirect Chains", check_redirect_chains, ttl=HOUR),
+            cls.Check("Redirects", check_redirects, async_function=check_redirects_async, ttl=HOUR),
             
             # SEO & Content (9)
-            self.Check("Sitemap", check_sitemap),
-            self.Check("Robots.txt", check_robot_txt),
-            self.Check("Open Graph Protocol", check_open_graph_protocol),
-            self.Check("Alt Tags", check_alt_tags),
-            self.Check("Semantic Markup", check_semantic_markup),
-            self.Check("URL Canonicalization", check_url_canonicalization),
-            self.Check("Favicon", check_favicon),
-            self.Check("Broken Links", check_broken_links),
-            self.Check("External Links", check_external_links),
+            cls.Check("Sitemap", check_sitemap, async_function=check_sitemap_async, ttl=HOUR * 6),
+            cls.Check("Robots.txt", check_robot_txt, async_function=check_robot_txt_async, ttl=HOUR * 6),
+            cls.Check("Open Graph Protocol", check_open_graph_protocol, ttl=HOUR),
+            cls.Check("Alt Tags", check_alt_tags, ttl=HOUR),
+            cls.Check("Semantic Markup", check_semantic_markup, ttl=HOUR),
+            cls.Check("URL Canonicalization", check_url_canonicalization, ttl=HOUR),
+            cls.Check("Favicon", check_favicon, async_function=check_favicon_async, ttl=DAY),
+            cls.Check("Broken Links", check_broken_links, async_function=check_broken_links_async, cost=10, ttl=HOUR),
+            cls.Check("External Links", check_external_links, ttl=HOUR),
             
             # Domain & DNS (7)
-            self.Check("Domain Expiration", check_domain_expiration),
-            self.Check("DNSSEC", check_dnssec),
-            self.Check("DNS Blacklist", check_dns_blacklist, timeout=45),
-            self.Check("Domain Breach", check_domain_breach),
-            self.Check("Domains Blacklists", check_domainsblacklists_blacklist),
-            self.Check("Subdomain Enumeration", check_subdomain_enumeration),
-            self.Check("Email Domain", check_email_domain),
+            cls.Check("Domain Expiration", check_domain_expiration, isolated=True, site_bound=False, cost=5,
+                       interval=DAY, ttl=DAY),
+            cls.Check("DNSSEC", check_dnssec, site_bound=False, interval=HOUR * 6, ttl=HOUR * 6),
+            cls.Check("DNS Blacklist", check_dns_blacklist, async_function=check_dns_blacklist_async, timeout=45,
+                       site_bound=False, cost=5, ttl=HOUR),
+            cls.Check("Domain Breach", check_domain_breach, site_bound=False, interval=DAY, ttl=DAY),
+            cls.Check("Domains Blacklists", check_domainsblacklists_blacklist, site_bound=False, cost=15,
+                       ttl=HOUR * 6),
+            cls.Check("Subdomain Enumeration", check_subdomain_enumeration,
+                       async_function=check_subdomain_enumeration_async, timeout=60, site_bound=False, cost=20,
+                       interval=DAY, ttl=DAY),
+            cls.Check("Email Domain", check_email_domain, site_bound=False, interval=HOUR * 6, ttl=HOUR * 6),
             
             # Privacy & Tracking (10)
-            self.Check("Cookie Policy", check_cookie_policy),
-            self.Check("Cookie Flags", check_cookie_flags),
-            self.Check("Cookie Duration", check_cookie_duration),
-            self.Check("Cookie SameSite", check_cookie_samesite_attribute),
-            self.Check("Ad & Tracking", check_ad_and_tracking),
-            self.Check("FLoC Detection", check_floc),
-            self.Check("Privacy Exposure", check_privacy_exposure),
-            self.Check("WHOIS Protection", check_privacy_protected_whois),
-            self.Check("Third-Party Requests", check_third_party_requests),
-            self.Check("Third-Party Resources", check_third_party_resources),
+            cls.Check("Cookie Policy", check_cookie_policy, ttl=HOUR),
+            cls.Check("Cookie Flags", check_cookie_flags, ttl=HOUR),
+            cls.Check("Cookie Duration", check_cookie_duration, ttl=HOUR),
+            cls.Check("Cookie SameSite", check_cookie_samesite_attribute, ttl=HOUR),
+            cls.Check("Ad & Tracking", check_ad_and_tracking, ttl=HOUR),
+            cls.Check("FLoC Detection", check_floc, ttl=DAY),
+            cls.Check("Privacy Exposure", check_privacy_exposure, ttl=HOUR),
+            cls.Check("WHOIS Protection", check_privacy_protected_whois, isolated=True, site_bound=False, cost=5,
+                       interval=DAY, ttl=DAY),
+            cls.Check("Third-Party Requests", check_third_party_requests, ttl=HOUR),
+            cls.Check("Third-Party Resources", check_third_party_resources, ttl=HOUR),
             
             # Accessibility & Mobile (5)
-            self.Check("Accessibility", check_accessibility),
-            self.Check("Mobile Friendly", check_mobile_friendly),
-            self.Check("AMP Compatibility", check_amp_compatibility),
-            self.Check("Internationalization", check_internationalization),
-            self.Check("Browser Compatibility", check_browser_compatibility),
+            cls.Check("Accessibility", check_accessibility, ttl=HOUR),
+            cls.Check("Mobile Friendly", check_mobile_friendly, ttl=HOUR),
+            cls.Check("AMP Compatibility", check_amp_compatibility, ttl=HOUR),
+            cls.Check("Internationalization", check_internationalization, ttl=HOUR),
+            cls.Check("Browser Compatibility", check_browser_compatibility, isolated=True, cost=20, ttl=HOUR * 6),
             
             # Technical & Infrastructure (4)
-            self.Check("Content-Type Headers", check_content_type_headers),
-            self.Check("CMS Detection", check_cms_used),
-            self.Check("Client-Side Rendering", check_clientside_rendering),
-            self.Check("Deprecated Libraries", check_deprecated_libraries),
+            cls.Check("Content-Type Headers", check_content_type_headers, ttl=HOUR),
+            cls.Check("CMS Detection", check_cms_used, ttl=DAY),
+            cls.Check("Client-Side Rendering", check_clientside_rendering, ttl=HOUR),
+            cls.Check("Deprecated Libraries", check_deprecated_libraries, ttl=HOUR * 6),
         ]
         return [check for check in checks if check.enabled]
 
+    @classmethod
+    def check_names(cls) -> List[str]:
+        """Names of the enabled checks, in report order, without building a monitor."""
+        return [check.name for check in cls._initialize_check_functions()]
+
 
 class PerformanceMonitor:
     """Tracks execution time and performance metrics."""
@@ -222,8 +440,15 @@ class PerformanceMonitor:
             "total_duration": (self.end_time - self.start_time).total_seconds()
         }
 
-def generate_report(config: Config, check_results: List[Tuple[str, List[str]]]):
-    """Generates the markdown report."""
+def generate_report(config: Config, check_results: List[Tuple[str, List[str]]],
+                    ages: Optional[Dict[Tuple[str, str], float]] = None):
+    """
+    Generates the markdown report.
+
+    ``ages`` maps ``(website, check_name)`` to the age in seconds of results
+    reused from the result store, which are shown next to the result.
+    """
+    ages = ages or {}
     
     try:
         with open("usage.md", "r") as f:
@@ -248,44 +473,303 @@ This report was automatically generated on {datetime.now().strftime('%Y-%m-%d %H
     # Add results for each website
     for website in config.websites:
         row = [website]
-        for _, results in check_results:
+        for check_name, results in check_results:
             result_index = config.websites.index(website)
-            row.append(str(results[result_index]))
+            cell = str(results[result_index])
+            if (website, check_name) in ages:
+                cell += f" <sub>{format_age(ages[(website, check_name)])}</sub>"
+            row.append(cell)
         report_content += " | ".join(row) + " |\n"
-        
+
+    if any(result == NOT_RUN for _, results in check_results for result in results):
+        report_content += f"\n{NOT_RUN} The run deadline was reached before this check ran; the report is partial.\n"
+    if ages:
+        report_content += ("\nResults marked with an age (e.g. <sub>3h</sub>) were not re-checked in this run: "
+                           "they are the last results, still within their check's TTL.\n")
+
     
     with open(config.output_file, "w") as f:
         f.write(report_content)
 
 
-async def main():
-    """Main execution function."""
+def _run_shard(websites: List[str], emit: Callable, config_data: dict):
+    """Shard process entry point: run every check against ``websites`` and emit each outcome."""
+    config = Config.from_dict({**config_data, 'websites': websites, 'processes': 1})
+    configure_process(config)
+
+    async def stream():
+        monitor = WebsiteMonitor(config)
+        try:
+            async for outcome in monitor.stream():
+                emit(outcome.check, outcome.website, outcome.result, outcome.duration, outcome.age)
+        finally:
+            await async_http.close_client()
+            await dnsbl.close_client()
+
+    asyncio.run(stream())
+
+
+def run_sharded_checks(config: Config, check_names: List[str],
+                       ages: Optional[Dict[Tuple[str, str], float]] = None) -> List[Tuple[str, List[str]]]:
+    """
+    Run the checks in ``config.processes`` worker processes and merge their results.
+
+    Returns the same ``(check_name, results)`` matrix as ``WebsiteMonitor.run``;
+    cells a crashed shard never reported are marked as errors. The ages of
+    cached results are added to ``ages`` if given.
+    """
+    shards = partition(config.websites, config.processes)
+    results = {}
+    for check_name, website, result, _duration, age in run_sharded(_run_shard, shards, asdict(config)):
+        results[(check_name, website)] = result
+        if age is not None and ages is not None:
+            ages[(website, check_name)] = age
+    missing = len(check_names) * len(config.websites) - len(results)
+    if missing:
+        logger.error(f"{missing} check results missing from failed shards")
+    return [
+        (check_name, [results.get((check_name, website), "⚪") for website in config.websites])
+        for check_name in check_names
+    ]
+
+
+async def run_queue_worker(config: Config):
+    """Pull (site, check) jobs from ``config.queue_url`` until SIGTERM/SIGINT."""
+    monitor = WebsiteMonitor(config)
+    queue = open_queue(config.queue_url)
+    worker = QueueWorker(
+        queue,
+        {check.name: check for check in monitor.check_functions},
+        config,
+        engine=monitor.engine,
+        visibility_timeout=config.queue_visibility_timeout,
+        max_attempts=config.queue_max_attempts,
+        retry_delay=config.queue_retry_delay,
+    )
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        queue.close()
+
+
+async def run_queued_checks(config: Config,
+                            ages: Optional[Dict[Tuple[str, str], float]] = None) -> List[Tuple[str, List[str]]]:
+    """
+    Enqueue one job per (website, check) and wait for the queue workers to finish them.
+
+    Jobs left unfinished when ``config.run_deadline`` passes are reported as NOT_RUN.
+    With ``config.incremental``, pairs with a result still within its TTL are
+    not enqueued; their stored result is used and its age added to ``ages``.
+    """
+    monitor = WebsiteMonitor(config)
+    queue = open_queue(config.queue_url)
+    loop = asyncio.get_running_loop()
+    try:
+        run_id = new_run_id()
+        # Drop whatever an interrupted earlier run left behind
+        await loop.run_in_executor(None, queue.purge)
+        checks = [monitor.check_functions[index] for index in monitor.engine.schedule(monitor.check_functions)]
+        store = monitor.engine.store
+        cached = {}
+        if config.incremental:
+            for check in checks:
+                for website in config.websites:
+                    entry = store.fresh(website, check.name, check.ttl)
+                    if entry is not None:
+                        cached[(website, check.name)] = entry
+        jobs = [(website, check.name) for check in checks for website in config.websites
+                if (website, check.name) not in cached]
+        await loop.run_in_executor(None, queue.enqueue, run_id, jobs)
+        logger.info(f"Enqueued run {run_id}: {len(jobs)} jobs" + (f", {len(cached)} results reused" if cached else ""))
+
+        results, complete = await collect_run(queue, run_id, len(jobs), deadline=config.run_deadline)
+        if not complete:
+            logger.warning(f"Run {run_id} is partial: {len(jobs) - len(results)} jobs did not finish")
+        await loop.run_in_executor(None, queue.purge)
+    finally:
+        queue.close()
+    for (website, check_name), result in results.items():
+        if result not in ("⚪", NOT_RUN):
+            store.record(website, check_name, result)
+    store.save()
+    now = time.time()
+    for pair, (result, checked_at) in cached.items():
+        results[pair] = result
+        if ages is not None:
+            ages[pair] = now - checked_at
+    return fill_matrix(results, [check.name for check in monitor.check_functions], config.websites)
+
+
+def serve_runs(conn):
+    """
+    Serve run requests from a supervising scheduler (``core.supervisor``) until told to stop.
+
+    The process, and with it the imported checks, connection pools, caches and
+    event loop, stays alive between runs. Each run reloads config.yaml.
+
+    ``{'command': 'run'}`` runs every check. ``{'command': 'tick'}`` runs only
+    the (website, check) pairs whose interval has elapsed, rewrites the report
+    with the latest result of every pair, and replies with ``next_due``, the
+    time the next pair becomes due.
+    """
+    # Shutdown is driven by the supervisor, not by signals sent to the whole process group
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    runs = 0
+    schedule = None
+    # (website, check) -> (result, checked_at); seeded from the result store after a restart
+    latest: Dict[Tuple[str, str], Tuple[str, float]] = {}
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+            if request.get('command') == 'stop':
+                break
+
+            started = time.perf_counter()
+            try:
+                config = load_config()
+                if request.get('run_deadline'):
+                    config.run_deadline = request['run_deadline']
+                # Runs are sequential, so each one can apply the reloaded settings
+                configure_process(config)
+                monitor = WebsiteMonitor(config)
+                reply = {}
+                if request.get('command') == 'tick':
+                    if schedule is None:
+                        schedule = CheckSchedule(monitor.interval_for)
+                    # Follow config.yaml changes: new pairs are due at once, removed ones are dropped
+                    schedule.interval_for = monitor.interval_for
+                    schedule.jitter = config.dispatch_jitter
+                    check_names = [check.name for check in monitor.check_functions]
+                    pairs = [(website, check_name) for website in config.websites for check_name in check_names]
+                    for pair in pairs:
+                        if pair not in latest:
+                            stored = monitor.engine.store.get(*pair)
+                            if stored is not None:
+                                latest[pair] = stored
+                    # Pairs with a stored result are not due before their next slot
+                    schedule.sync(pairs, last_run=lambda pair: latest[pair][1] if pair in latest else None)
+                    due = schedule.pop_due()
+                    if due:
+                        results = loop.run_until_complete(monitor.run_pairs(due))
+                        # Pairs cut off by the run deadline keep their previous result and
+                        # are left out of the schedule, so the next tick picks them up again
+                        finished = [pair for pair in due if results.get(pair, NOT_RUN) != NOT_RUN]
+                        now = time.time()
+                        latest.update((pair, (results[pair], now)) for pair in finished)
+                        schedule.reschedule(finished)
+                        ran = set(finished)
+                        generate_report(
+                            config,
+                            fill_matrix({pair: result for pair, (result, _) in latest.items()},
+                                        check_names, config.websites),
+                            ages={pair: now - checked_at for pair, (_, checked_at) in latest.items()
+                                  if pair not in ran},
+                        )
+                    reply = {'due': len(due), 'next_due': schedule.next_due()}
+                else:
+                    check_results = loop.run_until_complete(monitor.run())
+                    generate_report(config, check_results, ages=monitor.engine.ages)
+                runs += 1
+                conn.send({
+                    'ok': True,
+                    'run': runs,
+                    'duration': time.perf_counter() - started,
+                    'stats': monitor.engine.stats.to_dict(),
+                    'dispatch': dispatcher.metrics(),
+                    **reply,
+                })
+            except Exception as e:
+                logger.error(f"Run failed: {e}")
+                conn.send({'ok': False, 'error': f"{type(e).__name__}: {e}"})
+    finally:
+        loop.run_until_complete(async_http.close_client())
+        loop.run_until_complete(dnsbl.close_client())
+        loop.close()
+
+
+async def main(processes: Optional[int] = None, shard: Optional[str] = None,
+               partial_output: Optional[str] = None, merge: Optional[List[str]] = None,
+               worker: bool = False, queued: bool = False, incremental: bool = False):
+    """
+    Main execution function.
+
+    Args:
+        processes: Overrides ``config.processes``.
+        shard: ``"i/n"`` selector; only this runner's slice of the websites is
+            checked and written to a partial result file instead of the report.
+        partial_output: Path of the partial result file (sharded runs only).
+        merge: Partial result files to combine into the report instead of running checks.
+        worker: Run as a job-queue worker instead of producing a report.
+        queued: Run the checks through the job queue's workers instead of in-process.
+        incremental: Only run the checks whose last result is older than their TTL.
+    """
     performance_monitor = PerformanceMonitor()
     performance_monitor.start()
     try:
         # Load configuration
         config = load_config()
-        monitor = WebsiteMonitor(config)
+        configure_process(config)
+
+        if worker:
+            await run_queue_worker(config)
+            return
 
-        # Run all checks
-        check_results = []
-        for check in monitor.check_functions:
-            results = []
-            for website in config.websites:
-                result = await check.execute(website, config, config.timeout)
-                results.append(result)
-            check_results.append((check.name, results))
+        if merge:
+            generate_report(config, merge_partials(merge, config.websites))
+            logger.info(f"Merged {len(merge)} partial result files into {config.output_file}.")
+            return
+
+        if shard:
+            shard_index, shard_count = parse_shard(shard)
+            config.websites = select_shard(config.websites, shard_index, shard_count)
+            logger.info(f"Shard {shard_index}/{shard_count}: checking {len(config.websites)} websites")
+        if processes is not None:
+            config.processes = processes
+        if incremental:
+            config.incremental = True
+        if config.processes == 0:
+            config.processes = os.cpu_count() or 1
+        ages = {}
+
+        if queued:
+            check_results = await run_queued_checks(config, ages)
+        elif config.processes > 1 and len(config.websites) > 1:
+            # Shard the websites across processes so CPU-bound checks use every core
+            check_results = await asyncio.get_running_loop().run_in_executor(
+                None, run_sharded_checks, config, WebsiteMonitor.check_names(), ages
+            )
+        else:
+            # Run all checks concurrently
+            monitor = WebsiteMonitor(config)
+            check_results = await monitor.run()
+            ages = monitor.engine.ages
 
         logger.info("All checks completed successfully.")
         
-        generate_report(config, check_results)
+        if shard:
+            write_partial(partial_output or f"partial-{shard_index}-of-{shard_count}.json",
+                          (shard_index, shard_count), config.websites, check_results)
+        else:
+            generate_report(config, check_results, ages=ages)
         
     except Exception as e:
         logger.error(f"Critical error: {e}")
         
-
-    performance_monitor.stop()
-    logger.info(f"Execution completed in {performance_monitor.get_summary()['total_duration']} seconds.")
+    finally:
+        await async_http.close_client()
+        await dnsbl.close_client()
+        performance_monitor.stop()
+        logger.info(f"Execution completed in {performance_monitor.get_summary()['total_duration']} seconds.")
+        logger.info(f"Check executor metrics: {get_executor().metrics()}")
 
 
 def load_config(config_file: str = 'config.yaml') -> Config:
@@ -297,6 +781,17 @@ def load_config(config_file: str = 'config.yaml') -> Config:
         api_key = os.environ.get('PAGESPEED_API_KEY')
         if api_key:
             config_data['pagespeed_api_key'] = api_key
+        # The scheduler passes its own budget so the report is written before it kills the run
+        run_deadline = os.environ.get('RUN_DEADLINE')
+        if run_deadline:
+            config_data['run_deadline'] = int(run_deadline)
+        queue_url = os.environ.get('QUEUE_URL')
+        if queue_url:
+            config_data['queue_url'] = queue_url
+        # Interval of the checks that have neither their own default nor an override
+        default_interval = os.environ.get('MONITOR_INTERVAL')
+        if default_interval:
+            config_data['default_interval'] = int(default_interval)
         return Config.from_dict(config_data)
     except FileNotFoundError:
         logger.warning("Config file not found. Falling back to default configuration.")
@@ -305,4 +800,32 @@ def load_config(config_file: str = 'config.yaml') -> Config:
 
 if __name__ == "__main__":
     import asyncio
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run the website checks and write the report.")
+    parser.add_argument('--processes', type=int, default=None,
+                        help="Shard the websites across this many processes (0 = one per CPU core); "
+                             "overrides 'processes' in config.yaml")
+    parser.add_argument('--shard', metavar='I/N', default=None,
+                        help="Check only shard I of N (0-based) of the websites, selected by a stable hash "
+                             "of the domain, and write a partial result file instead of the report")
+    parser.add_argument('--partial-output', metavar='PATH', default=None,
+                        help="Partial result file for --shard (default: partial-I-of-N.json)")
+    parser.add_argument('--merge', metavar='PARTIAL', nargs='+', default=None,
+                        help="Combine partial result files from sharded runs into the report")
+    parser.add_argument('--worker', action='store_true',
+                        help="Run as a job-queue worker, executing (site, check) jobs from queue_url")
+    parser.add_argument('--queued', action='store_true',
+                        help="Enqueue the run on queue_url, wait for the workers and write the report")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only re-run checks whose last stored result is older than their TTL; "
+                             "the report shows the age of the reused results")
+    args = parser.parse_args()
+    if args.shard and args.merge:
+        parser.error("--shard and --merge cannot be combined")
+    if args.shard:
+        try:
+            parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    asyncio.run(main(processes=args.processes, shard=args.shard,
+                     partial_output=args.partial_output, merge=args.merge,
+                     worker=args.worker, queued=args.queued, incremental=args.incremental))
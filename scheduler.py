@@ -2,6 +2,12 @@
 """
 Website Monitor Scheduler
 Runs the monitoring checks at regular intervals in Docker environment.
+
+With the default 'inprocess' backend every (website, check) pair runs at its
+own interval (see ``check_intervals`` and ``site_intervals`` in config.yaml)
+and the scheduler wakes up whenever the next pair is due; MONITOR_INTERVAL is
+the interval of checks without one. The other backends run every check at
+MONITOR_INTERVAL.
 """
 
 import time
@@ -12,6 +18,8 @@ import signal
 import sys
 from datetime import datetime
 
+from core.supervisor import SupervisedWorker
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +34,18 @@ logger = logging.getLogger(__name__)
 class MonitorScheduler:
     def __init__(self):
         self.interval = int(os.getenv('MONITOR_INTERVAL', 3600))  # Default: 1 hour
+        # Wait before retrying after the monitor process failed a tick
+        self.retry_interval = 60
+        self.timeout = int(os.getenv('MONITOR_TIMEOUT', 1800))  # Default: 30 minutes
+        # main.py stops starting checks this long before the hard timeout so it can still write a partial report
+        self.report_grace = int(os.getenv('MONITOR_REPORT_GRACE', 120))
+        # 'inprocess' keeps one supervised monitor process warm across runs; 'subprocess'
+        # starts a fresh main.py per run; 'queue' enqueues (site, check) jobs that
+        # MONITOR_WORKERS long-lived worker processes execute
+        self.backend = os.getenv('MONITOR_BACKEND', 'inprocess')
+        self.worker_count = int(os.getenv('MONITOR_WORKERS', 2))
+        self.workers = []
+        self.monitor_worker = SupervisedWorker('main:serve_runs') if self.backend == 'inprocess' else None
         self.running = True
         
         # Set up signal handlers for graceful shutdown
@@ -37,18 +57,75 @@ class MonitorScheduler:
         logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
         
-    def run_monitoring(self):
-        """Execute the monitoring script."""
+    def ensure_workers(self):
+        """Start the queue workers, replacing any that have exited."""
+        for index, worker in enumerate(self.workers):
+            if worker.poll() is not None:
+                logger.warning(f'Queue worker {worker.pid} exited with code {worker.returncode}; restarting')
+                self.workers[index] = subprocess.Popen(['python', 'main.py', '--worker'])
+        while len(self.workers) < self.worker_count:
+            self.workers.append(subprocess.Popen(['python', 'main.py', '--worker']))
+            logger.info(f'Started queue worker {self.workers[-1].pid}')
+
+    def stop_workers(self):
+        """Ask the queue workers to finish their current jobs and exit."""
+        for worker in self.workers:
+            if worker.poll() is None:
+                worker.terminate()
+        for worker in self.workers:
+            try:
+                worker.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+        self.workers = []
+
+    def run_in_process(self) -> float:
+        """
+        Run the due checks in the long-lived monitor process, restarting it only if it fails.
+
+        Returns the time the next check is due.
+        """
+        start_time = datetime.now()
+        try:
+            response = self.monitor_worker.call(
+                {'command': 'tick', 'run_deadline': max(60, self.timeout - self.report_grace)},
+                timeout=self.timeout
+            )
+        except TimeoutError:
+            logger.error(f'Monitoring timed out after {self.timeout} seconds; the monitor process was restarted')
+            return time.time() + self.retry_interval
+        except RuntimeError as e:
+            logger.error(f'Monitoring crashed: {e}')
+            return time.time() + self.retry_interval
+        execution_time = (datetime.now() - start_time).total_seconds()
+        if not response.get('ok'):
+            logger.error(f"Monitoring failed: {response.get('error')}")
+            return time.time() + self.retry_interval
+        if response['due']:
+            logger.info(f"Ran {response['due']} due checks in {execution_time:.2f} seconds ({response['stats']}, "
+                        f"dispatch: {response['dispatch']})")
+        return response['next_due'] or time.time() + self.interval
+
+    def run_monitoring(self) -> float:
+        """Execute the monitoring script; returns the time of the next run."""
+        if self.monitor_worker is not None:
+            return self.run_in_process()
         try:
             logger.info('Starting website monitoring check...')
             start_time = datetime.now()
+            command = ['python', 'main.py']
+            if self.backend == 'queue':
+                self.ensure_workers()
+                command.append('--queued')
             
-            # Run the main monitoring script
+            # Run the main monitoring script with a run deadline inside our hard timeout
+            env = dict(os.environ, RUN_DEADLINE=str(max(60, self.timeout - self.report_grace)))
             result = subprocess.run(
-                ['python', 'main.py'], 
+                command, 
                 capture_output=True, 
                 text=True,
-                timeout=1800  # 30 minute timeout
+                timeout=self.timeout,
+                env=env
             )
             
             end_time = datetime.now()
@@ -66,35 +143,40 @@ class MonitorScheduler:
                     logger.info(f'Standard output: {result.stdout}')
                     
         except subprocess.TimeoutExpired:
-            logger.error('Monitoring timed out after 30 minutes')
+            logger.error(f'Monitoring timed out after {self.timeout} seconds')
         except Exception as e:
             logger.error(f'Error running monitoring: {e}')
+        return time.time() + self.interval
             
     def start(self):
         """Start the scheduler main loop."""
         logger.info(f'🚀 Starting Website Monitor Scheduler')
-        logger.info(f'📅 Monitoring interval: {self.interval} seconds ({self.interval/3600:.1f} hours)')
+        if self.monitor_worker is not None:
+            logger.info(f'📅 Per-check intervals, default {self.interval} seconds ({self.interval/3600:.1f} hours)')
+        else:
+            logger.info(f'📅 Monitoring interval: {self.interval} seconds ({self.interval/3600:.1f} hours)')
         logger.info(f'📁 Working directory: {os.getcwd()}')
+        logger.info(f'⚙️ Backend: {self.backend}' + (f' ({self.worker_count} workers)' if self.backend == 'queue' else ''))
         logger.info(f'🐍 Python version: {sys.version}')
         
         # Run initial monitoring check
         logger.info('Running initial monitoring check...')
-        self.run_monitoring()
+        next_run = self.run_monitoring()
         
         # Main scheduling loop
         while self.running:
             try:
-                logger.info(f'⏰ Waiting {self.interval} seconds until next monitoring run...')
+                sleep_remaining = max(1.0, next_run - time.time())
+                logger.info(f'⏰ Waiting {sleep_remaining:.0f} seconds until next monitoring run...')
                 
                 # Sleep in small intervals to allow for graceful shutdown
-                sleep_remaining = self.interval
                 while sleep_remaining > 0 and self.running:
                     sleep_time = min(60, sleep_remaining)  # Sleep max 60 seconds at a time
                     time.sleep(sleep_time)
                     sleep_remaining -= sleep_time
                 
                 if self.running:
-                    self.run_monitoring()
+                    next_run = self.run_monitoring()
                     
             except KeyboardInterrupt:
                 logger.info('Scheduler interrupted by user')
@@ -102,7 +184,11 @@ class MonitorScheduler:
             except Exception as e:
                 logger.error(f'Unexpected error in scheduler: {e}')
                 time.sleep(60)  # Wait a minute before trying again
+                next_run = time.time()
                 
+        self.stop_workers()
+        if self.monitor_worker is not None:
+            self.monitor_worker.stop()
         logger.info('📊 Website Monitor Scheduler stopped')
 
 def main():